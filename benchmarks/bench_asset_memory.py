@@ -0,0 +1,59 @@
+"""Benchmark of the memory used by a catalog of CAsset compared to a catalog of CAssetRecord.
+
+Run with the src folder in the PYTHONPATH, from mayapy : mayapy benchmarks/bench_asset_memory.py
+"""
+
+import gc
+import sys
+import types
+import colorium.command as command
+from colorium.asset import CAsset
+from colorium.asset_record import CAssetRecord
+
+
+CATALOG_SIZE = 100000
+
+# Objects shared by every asset of a catalog, which aren't counted in its size.
+SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, command.CCommand)
+
+
+def deep_size(root):
+    """Return the size in bytes of an object and of every object it references, counting each object once."""
+
+    seen = set()
+    size = 0
+    stack = [root]
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+
+    return size
+
+
+def build_assets():
+    """Build a catalog of assets."""
+
+    return [CAsset(asset_type="mdl", name="asset{}".format(index), has_variant=True, variant=index % 99 + 1, version=index % 999 + 1) for index in range(CATALOG_SIZE)]
+
+
+def main():
+    assets = build_assets()
+    records = [asset.to_record() for asset in assets]
+
+    assets_size = deep_size(assets)
+    records_size = deep_size(records)
+
+    print("{} CAsset       : {:.1f} MB ({} bytes/asset)".format(CATALOG_SIZE, assets_size / 1e6, assets_size // CATALOG_SIZE))
+    print("{} CAssetRecord : {:.1f} MB ({} bytes/asset)".format(CATALOG_SIZE, records_size / 1e6, records_size // CATALOG_SIZE))
+    print("ratio               : {:.1f}x".format(float(assets_size) / records_size))
+
+
+if __name__ == "__main__":
+    main()
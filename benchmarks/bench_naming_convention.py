@@ -0,0 +1,60 @@
+"""Benchmark of the single pass file name parser against the per variable search functions of CNamingConvention.
+
+Run with the src folder in the PYTHONPATH : python benchmarks/bench_naming_convention.py
+"""
+
+import timeit
+from colorium.naming_convention import CNamingConvention
+
+
+NAMING_CONVENTION = CNamingConvention()
+FILE_NAMES = [
+    "mdl_tree_v001.ma",
+    "mdl_tree_01_v012.mb",
+    "anm_bob_010-020_v003.ma",
+    "anm_bob_02_010-020_v003.mb",
+    "lay_forest_120-005_publish.ma",
+    "rig_bob_03_export.mb",
+]
+REPEAT = 5
+NUMBER = 20000
+
+
+def parse_per_variable():
+    """Parse the file names with one search per variable, the way the scene name parser used to."""
+
+    for file_name in FILE_NAMES:
+        NAMING_CONVENTION.search_type_in_name(file_name)
+        NAMING_CONVENTION.search_name_in_name(file_name)
+        NAMING_CONVENTION.search_variant_in_name(file_name)
+        NAMING_CONVENTION.search_scene_in_name(file_name)
+        NAMING_CONVENTION.search_shot_in_name(file_name)
+        NAMING_CONVENTION.seach_version_in_name(file_name)
+
+
+def parse_single_pass():
+    """Parse the file names with the compiled single pass parser."""
+
+    for file_name in FILE_NAMES:
+        NAMING_CONVENTION.parse_name(file_name)
+
+
+def measure(function):
+    """Return the best time, in microseconds, to parse one file name with the given function."""
+
+    best = min(timeit.repeat(function, repeat=REPEAT, number=NUMBER))
+
+    return best / (NUMBER * len(FILE_NAMES)) * 1e6
+
+
+def main():
+    per_variable = measure(parse_per_variable)
+    single_pass = measure(parse_single_pass)
+
+    print("per variable search : {:.2f} us/name".format(per_variable))
+    print("single pass parser  : {:.2f} us/name".format(single_pass))
+    print("speedup             : {:.1f}x".format(per_variable / single_pass))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Module of Colorium's batch publish tool. Publishes the selected nodes, each one to the target matching its name."""
+
+import imports
+
+# Maya caches the imported modules, so we need to drop them to avoid weird problems.
+# The kinds of problems caused by this are :
+# - Changes on a module doesn't apply in next execution in Maya;
+# - Things breaks when you close and reopen the tool (can't say why).
+imports.dropCachedImports(
+    "maya",
+    "patterns",
+    "colorium",
+)
+
+import maya.cmds as cmds
+import colorium.batch_publish as batch_publish
+
+
+def batch_publish_selection(command_name="Maya Ascii"):
+    """Publish all selected nodes using the publish command of the specified name. The nodes sharing a target are published together.
+    Shows the progress and prints the nodes that couldn't be published."""
+
+    nodes = cmds.ls(sl=True)
+
+    if not nodes:
+        cmds.confirmDialog(
+            title="Cannot publish assets",
+            message="The assets cannot be published. Please, select the objects you want to publish.",
+            button=["Ok"],
+            defaultButton="Ok"
+        )
+
+        return []
+
+    def progress(done, total, result):
+        cmds.progressWindow(e=True, progress=done, status="Published {} of {} nodes".format(done, total))
+
+    cmds.progressWindow(title="Batch publish", progress=0, maxValue=len(nodes), status="Publishing...", isInterruptable=False)
+
+    try:
+        results = batch_publish.publish(nodes, command_name, progress)
+    finally:
+        cmds.progressWindow(endProgress=True)
+
+    failures = [result for result in results if not result.success]
+
+    for failure in failures:
+        print "Could not publish '{}' : {}".format(failure.node, failure.error)
+
+    print "{} nodes published, {} failed.".format(len(results) - len(failures), len(failures))
+
+    return results
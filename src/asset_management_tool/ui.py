@@ -5,8 +5,11 @@ import colorium.ui as ui
 import colorium.asset_type_definition as asset_type_definition
 import colorium.scene_name_parser as scene_name_parser
 import colorium.command as command
+import colorium.commit as commit
 import colorium.data_binding as data_binding
 import colorium.settings as settings
+import colorium.task_graph as task_graph
+import colorium.worker_pool as worker_pool
 
 
 class AssetManagementToolUI(ui.CUI):
@@ -30,10 +33,10 @@ class AssetManagementToolUI(ui.CUI):
         type_input = ui.CComboInput("type", "Asset's type", frm_asset_information,\
             enabled=True,\
             items=asset_type_definition.names(),\
-            default_value=asset_type_definition.get_type_by_code(self.controller.asset.type).name,\
+            default_value=asset_type_definition.get_type(self.controller.asset.type).name,\
         )
         data_binding.bind(type_input, "enabled", self.controller.asset, "has_type")
-        data_binding.bind(type_input, "value", self.controller.asset, "type")
+        data_binding.bind(type_input, "value", self.controller.asset, "type", converter=asset_type_definition.name_converter())
         self.add_control(type_input)
 
         name_input = ui.CTextInput("name", "Asset's name", frm_asset_information,\
@@ -148,7 +151,7 @@ class AssetManagementToolUI(ui.CUI):
             default_value=self.controller.asset.save_config.file_name,\
         )
         data_binding.bind(save_file_name_input, "enabled", self.controller.asset.save_config, "file_name_overridden")
-        data_binding.bind(save_file_name_input, "text", self.controller.asset.save_config, "file_name")
+        data_binding.bind(save_file_name_input, "text", self.controller.asset.save_config, "file_name", deferred=True)
         self.add_control(save_file_name_input)
 
         publish_file_name_input = ui.CTextInput("publish_file_name", "Publish file name", frm_file_name_preview,\
@@ -157,7 +160,7 @@ class AssetManagementToolUI(ui.CUI):
             default_value=self.controller.asset.publish_config.file_name,\
         )
         data_binding.bind(publish_file_name_input, "enabled", self.controller.asset.publish_config, "file_name_overridden")
-        data_binding.bind(publish_file_name_input, "text", self.controller.asset.publish_config, "file_name")
+        data_binding.bind(publish_file_name_input, "text", self.controller.asset.publish_config, "file_name", deferred=True)
         self.add_control(publish_file_name_input)
 
         export_file_name_input = ui.CTextInput("export_file_name", "Export file name", frm_file_name_preview,\
@@ -166,7 +169,7 @@ class AssetManagementToolUI(ui.CUI):
             default_value=self.controller.asset.export_config.file_name,\
         )
         data_binding.bind(export_file_name_input, "enabled", self.controller.asset.export_config, "file_name_overridden")
-        data_binding.bind(export_file_name_input, "text", self.controller.asset.export_config, "file_name")
+        data_binding.bind(export_file_name_input, "text", self.controller.asset.export_config, "file_name", deferred=True)
         self.add_control(export_file_name_input)
 
 
@@ -182,7 +185,7 @@ class AssetManagementToolUI(ui.CUI):
             open_command=self.controller.open_save_path_explorer,\
         )
         data_binding.bind(save_path_input, "enabled", self.controller.asset.save_config, "path_overridden")
-        data_binding.bind(save_path_input, "text", self.controller.asset.save_config, "path")
+        data_binding.bind(save_path_input, "text", self.controller.asset.save_config, "path", deferred=True)
         self.add_control(save_path_input)
 
         publish_path_input = ui.CFilePathInput("publish_path", "Publish path", frm_path_preview,\
@@ -192,7 +195,7 @@ class AssetManagementToolUI(ui.CUI):
             open_command=self.controller.open_publish_path_explorer,\
         )
         data_binding.bind(publish_path_input, "enabled", self.controller.asset.publish_config, "path_overridden")
-        data_binding.bind(publish_path_input, "text", self.controller.asset.publish_config, "path")
+        data_binding.bind(publish_path_input, "text", self.controller.asset.publish_config, "path", deferred=True)
         self.add_control(publish_path_input)
 
         export_path_input = ui.CFilePathInput("export_path", "Export path", frm_path_preview,\
@@ -202,7 +205,7 @@ class AssetManagementToolUI(ui.CUI):
             open_command=self.controller.open_export_path_explorer,\
         )
         data_binding.bind(export_path_input, "enabled", self.controller.asset.export_config, "path_overridden")
-        data_binding.bind(export_path_input, "text", self.controller.asset.export_config, "path")
+        data_binding.bind(export_path_input, "text", self.controller.asset.export_config, "path", deferred=True)
         self.add_control(export_path_input)
 
 
@@ -250,6 +253,9 @@ class AssetManagementToolController(ui.CController):
 
         self._asset = scene_name_parser.parse_scene_name_to_asset()
 
+        if settings.COMMIT_IN_WORKERS and worker_pool.get_pool().is_available():
+            worker_pool.get_pool().start()
+
 
     def display_ui_callback(self):
         pass
@@ -295,25 +301,47 @@ class AssetManagementToolController(ui.CController):
 
 
     def commit(self, value):
-        """Command used to commit (save, publish and/or export) the scene based on the asset data."""
+        """Command used to commit (save, publish and/or export) the scene based on the asset data. Once the save is done, the publish and the export
+        run in parallel. The commit can be cancelled from the progress window, and a failing step only skips the steps depending on it."""
 
         save_enabled = self.ui.get_control_by_name("save_type").enabled
         publish_enabled = self.ui.get_control_by_name("publish_type").enabled
         export_enabled = self.ui.get_control_by_name("export_type").enabled
+        increment_on_save = save_enabled and self.ui.get_control_by_name('increment_on_save').value
+
+        graph = commit.plan_commit(self.asset, cmds,
+            save=save_enabled,
+            publish=publish_enabled,
+            export=export_enabled,
+            increment_version=increment_on_save,
+            pool=worker_pool.get_pool() if settings.COMMIT_IN_WORKERS else None,
+        )
+
+        def on_result(result):
+            cmds.progressWindow(e=True, status="{} {} in {:.1f} s".format(result.name.capitalize(), result.status, result.wall))
 
-        if save_enabled:
-            increment_on_save = self.ui.get_control_by_name('increment_on_save').value
+        def poll():
+            if cmds.progressWindow(q=True, isCancelled=True):
+                graph.cancel()
 
-            if increment_on_save:
-                self.asset.version += 1
+        cmds.progressWindow(title="Commit", status="Committing...", isInterruptable=True)
 
-            self.asset.save_config.execute_command()
+        try:
+            results = graph.run(on_result, poll)
+        finally:
+            cmds.progressWindow(endProgress=True)
 
-        if publish_enabled:
-            self.asset.publish_config.execute_command()
+        report = task_graph.format_results(results)
+        print report
 
-        if export_enabled:
-            self.asset.export_config.execute_command()
+        if not all(result.succeeded for result in results.values()):
+            cmds.confirmDialog(
+                title="Commit incomplete",
+                message="Some steps of the commit didn't succeed :\n{}".format(report),
+                button=["Ok"],
+                defaultButton="Ok",
+                icon="warning",
+            )
 
 
     def set_save_config_command(self, value):
@@ -1,14 +1,21 @@
 """Module containing the CAsset class. The CAsset class contains the information used for saving, publishing, exporting, creating, opening and deleting an asset (Maya scene file)."""
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from colorium.asset_record import CAssetRecord
 from colorium.configuration import CConfiguration
 import colorium.data_binding as data_binding
 import colorium.command as command
 import colorium.naming_convention as naming_convention
 import colorium.settings as settings
+import patterns.observerPattern as observerPattern
 
 
-class CAsset(object, data_binding.CBindable):
-    """Information used for saving, publishing, exporting, creating, opening and deleting an asset (Maya scene file)."""
+class CAsset(observerPattern.Observable, data_binding.CBindable):
+    """Information used for saving, publishing, exporting, creating, opening and deleting an asset (Maya scene file).
+    The property changes are sent to the bindings and published to the observers, the property's name being the topic."""
+
+    FIELDS = ("has_type", "type", "has_name", "name", "has_variant", "variant", "has_scene", "scene", "has_shot", "shot", "has_version", "version")
 
     @property
     def has_type(self):
@@ -19,8 +26,7 @@ class CAsset(object, data_binding.CBindable):
     @has_type.setter
     def has_type(self, value):
         self._has_type = value
-        self.notify_configurations()
-        self.notify_property_changed("has_type", value)
+        self.field_changed("has_type", value)
         print('\'has_type\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -33,8 +39,7 @@ class CAsset(object, data_binding.CBindable):
     @type.setter
     def type(self, value):
         self._type = value
-        self.notify_configurations()
-        self.notify_property_changed("type", value)
+        self.field_changed("type", value)
         print('\'type\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -47,8 +52,7 @@ class CAsset(object, data_binding.CBindable):
     @has_name.setter
     def has_name(self, value):
         self._has_name = value
-        self.notify_configurations()
-        self.notify_property_changed("has_name", value)
+        self.field_changed("has_name", value)
         print('\'has_name\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -61,8 +65,7 @@ class CAsset(object, data_binding.CBindable):
     @name.setter
     def name(self, value):
         self._name = value
-        self.notify_configurations()
-        self.notify_property_changed("name", value)
+        self.field_changed("name", value)
         print('\'name\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -75,8 +78,7 @@ class CAsset(object, data_binding.CBindable):
     @has_variant.setter
     def has_variant(self, value):
         self._has_variant = value
-        self.notify_configurations()
-        self.notify_property_changed("has_variant", value)
+        self.field_changed("has_variant", value)
         print('\'has_variant\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -88,8 +90,7 @@ class CAsset(object, data_binding.CBindable):
     @variant.setter
     def variant(self, value):
         self._variant = value
-        self.notify_configurations()
-        self.notify_property_changed("variant", value)
+        self.field_changed("variant", value)
         print('\'variant\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -102,8 +103,7 @@ class CAsset(object, data_binding.CBindable):
     @has_scene.setter
     def has_scene(self, value):
         self._has_scene = value
-        self.notify_configurations()
-        self.notify_property_changed("has_scene", value)
+        self.field_changed("has_scene", value)
         print('\'has_scene\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -116,8 +116,7 @@ class CAsset(object, data_binding.CBindable):
     @scene.setter
     def scene(self, value):
         self._scene = value
-        self.notify_configurations()
-        self.notify_property_changed("scene", value)
+        self.field_changed("scene", value)
         print('\'scene\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -130,8 +129,7 @@ class CAsset(object, data_binding.CBindable):
     @has_shot.setter
     def has_shot(self, value):
         self._has_shot = value
-        self.notify_configurations()
-        self.notify_property_changed("has_shot", value)
+        self.field_changed("has_shot", value)
         print('\'has_shot\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -144,8 +142,7 @@ class CAsset(object, data_binding.CBindable):
     @shot.setter
     def shot(self, value):
         self._shot = value
-        self.notify_configurations()
-        self.notify_property_changed("shot", value)
+        self.field_changed("shot", value)
         print('\'shot\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -158,8 +155,7 @@ class CAsset(object, data_binding.CBindable):
     @has_version.setter
     def has_version(self, value):
         self._has_version = value
-        self.notify_configurations()
-        self.notify_property_changed("has_version", value)
+        self.field_changed("has_version", value)
         print('\'has_version\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -172,8 +168,7 @@ class CAsset(object, data_binding.CBindable):
     @version.setter
     def version(self, value):
         self._version = value
-        self.notify_configurations()
-        self.notify_property_changed("version", value)
+        self.field_changed("version", value)
         print('\'version\' property of CAsset set to \'{}\'').format(value)
 
 
@@ -220,6 +215,7 @@ class CAsset(object, data_binding.CBindable):
 
 
     def __init__(self, has_type=False, asset_type="non", has_name=False, name="unamed", has_variant=False, variant=1, has_scene=False, scene=10, has_shot=False, shot=10, has_version=False, version=1, save_config=None, publish_config=None, export_config=None):
+        observerPattern.Observable.__init__(self)
         data_binding.CBindable.__init__(self)
 
         self._has_type = has_type
@@ -234,6 +230,8 @@ class CAsset(object, data_binding.CBindable):
         self._shot = shot
         self._has_version = has_version
         self._version = version
+        self._batch_depth = 0
+        self._pending_changes = None
 
         if save_config:
             self._save_config = save_config
@@ -263,9 +261,119 @@ class CAsset(object, data_binding.CBindable):
                 )
 
 
-    def notify_configurations(self):
-        """Method that asks the asset's configuration to update themselves."""
+    @classmethod
+    def from_record(cls, record):
+        """Create an asset from a CAssetRecord."""
+
+        return cls(
+            has_type=record.has_type,
+            asset_type=record.type,
+            has_name=record.has_name,
+            name=record.name,
+            has_variant=record.has_variant,
+            variant=record.variant,
+            has_scene=record.has_scene,
+            scene=record.scene,
+            has_shot=record.has_shot,
+            shot=record.shot,
+            has_version=record.has_version,
+            version=record.version
+        )
+
+
+    def to_record(self):
+        """Return a compact, immutable and hashable CAssetRecord of the asset's information."""
+
+        return CAssetRecord._make((
+            self._has_type, self._type, self._has_name, self._name, self._has_variant, self._variant,
+            self._has_scene, self._scene, self._has_shot, self._shot, self._has_version, self._version
+        ))
+
+
+    def notify_configurations(self, *fields):
+        """Method that asks the asset's configuration to update themselves. When fields are given, only the configurations depending on those fields are updated."""
+
+        self._save_config.update(*fields)
+        self._publish_config.update(*fields)
+        self._export_config.update(*fields)
+
+
+    def notify_property_changed(self, prop, value):
+        """Notifies the bindings of the property's new value and publishes it to the observers of the property."""
+
+        data_binding.CBindable.notify_property_changed(self, prop, value)
+        self.notify((prop, value))
+
+
+    def getState(self, topics=None):
+        """Return the current value of every field, or only of the specified fields, as (field, value) changes."""
+
+        return [(field, getattr(self, field)) for field in self.FIELDS if topics is None or field in topics]
+
+
+    def dependent_properties(self, prop):
+        """Return the configurations' properties changed as a side effect of a change of the specified field."""
+
+        if prop not in self.FIELDS:
+            return []
+
+        return [(config, config_prop) for config in (self._save_config, self._publish_config, self._export_config)
+                for config_prop in config.get_properties_depending_on(prop)]
+
+
+    def field_changed(self, field, value):
+        """Method called by the fields' setters. Updates the configurations depending on the field and notifies the bindings,
+        or defers both until the end of the current batch update."""
+
+        if self._batch_depth:
+            self._pending_changes[field] = value
+        else:
+            self.notify_configurations(field)
+            self.notify_property_changed(field, value)
+
+
+    @contextmanager
+    def batch_update(self):
+        """Context manager that defers the configurations' update and the property change notifications until the end of the block.
+        The configurations are then updated once and a single notification is sent per changed field. Batch updates can be nested."""
+
+        if not self._batch_depth:
+            self._pending_changes = OrderedDict()
+
+        self._batch_depth += 1
+
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+            if not self._batch_depth:
+                self.flush_pending_changes()
+
+
+    def update_many(self, **fields):
+        """Set several fields at once in a single batch update."""
+
+        for field in fields:
+            if field not in self.FIELDS:
+                raise AttributeError('{!r} is not a field of CAsset'.format(field))
+
+        with self.batch_update():
+            for field, value in fields.items():
+                setattr(self, field, value)
+
+
+    def flush_pending_changes(self):
+        """Update the configurations and notify the bindings of the fields changed during a batch update."""
+
+        changes = self._pending_changes
+        self._pending_changes = None
+
+        if not changes:
+            return
+
+        self.notify_configurations(*changes)
 
-        self.save_config.update()
-        self.publish_config.update()
-        self.export_config.update()
+        with self.batch():
+            for field, value in changes.items():
+                self.notify_property_changed(field, value)
@@ -0,0 +1,44 @@
+"""Module containing the CAssetRecord class. The CAssetRecord class is a compact, immutable and hashable copy of an asset's information, used to hold large catalogs of assets in memory."""
+
+from collections import namedtuple
+
+
+FIELDS = ("has_type", "type", "has_name", "name", "has_variant", "variant", "has_scene", "scene", "has_shot", "shot", "has_version", "version")
+
+
+class CAssetRecord(namedtuple("CAssetRecord", FIELDS)):
+    """Compact, immutable and hashable copy of an asset's information. It has the same fields as CAsset, so it can be passed directly to the naming convention's generators."""
+
+    __slots__ = ()
+
+    def __new__(cls, has_type=False, type="non", has_name=False, name="unamed", has_variant=False, variant=1, has_scene=False, scene=10, has_shot=False, shot=10, has_version=False, version=1):
+        return super(CAssetRecord, cls).__new__(cls, has_type, type, has_name, name, has_variant, variant, has_scene, scene, has_shot, shot, has_version, version)
+
+
+def from_parsed_name(parsed_name):
+    """Create an asset record from a CParsedName. The values missing from the parsed name keep the record's defaults."""
+
+    return CAssetRecord(**get_parsed_values(parsed_name))
+
+
+def get_parsed_values(parsed_name):
+    """Return the asset fields set by a CParsedName, by name. The fields missing from the parsed name aren't included."""
+
+    values = {"type": parsed_name.type, "name": parsed_name.name}
+
+    if parsed_name.has_variant:
+        values["has_variant"] = True
+        values["variant"] = parsed_name.variant
+
+    if parsed_name.has_scene:
+        values["has_scene"] = True
+        values["scene"] = parsed_name.scene
+
+    if parsed_name.has_shot:
+        values["has_shot"] = True
+        values["shot"] = parsed_name.shot
+
+    if parsed_name.has_version:
+        values["version"] = parsed_name.version
+
+    return values
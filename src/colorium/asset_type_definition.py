@@ -1,5 +1,6 @@
 """Module where all the Colorium Asset Type Definitions are centralized."""
 
+import colorium.data_binding as data_binding
 import colorium.settings as settings
 
 
@@ -51,6 +52,61 @@ class CAssetTypeDefinition(object):
 
 ASSET_TYPES = []
 
+# Indexes of the asset type definitions and cached views, kept in sync with ASSET_TYPES by register_type and invalidate_registry.
+_TYPES_BY_CODE = {}
+_TYPES_BY_NAME = {}
+_CODES = None
+_NAMES = None
+_NAME_CONVERTER = None
+_REGISTRY_LISTENERS = []
+
+
+def register_type(asset_type):
+    """Add an asset type definition to the list of asset type definitions and index it. When two definitions share a code or a name, the first one registered wins."""
+
+    ASSET_TYPES.append(asset_type)
+
+    _TYPES_BY_CODE.setdefault(asset_type.code, asset_type)
+    _TYPES_BY_NAME.setdefault(asset_type.name, asset_type)
+
+    _registry_changed()
+
+    return asset_type
+
+
+def invalidate_registry():
+    """Rebuild the indexes of the asset type definitions. Must be called after ASSET_TYPES is modified directly."""
+
+    _TYPES_BY_CODE.clear()
+    _TYPES_BY_NAME.clear()
+
+    for asset_type in ASSET_TYPES:
+        _TYPES_BY_CODE.setdefault(asset_type.code, asset_type)
+        _TYPES_BY_NAME.setdefault(asset_type.name, asset_type)
+
+    _registry_changed()
+
+
+def add_registry_listener(callback):
+    """Add a callback called without argument every time the asset type definitions change."""
+
+    if callback not in _REGISTRY_LISTENERS:
+        _REGISTRY_LISTENERS.append(callback)
+
+
+def _registry_changed():
+    """Drop the cached views and call the registry listeners."""
+
+    global _CODES, _NAMES, _NAME_CONVERTER
+
+    _CODES = None
+    _NAMES = None
+    _NAME_CONVERTER = None
+
+    for callback in _REGISTRY_LISTENERS:
+        callback()
+
+
 NONE_TYPE = CAssetTypeDefinition(
     code="non",
     name="None",
@@ -58,7 +114,7 @@ NONE_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/nones",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/nones"
 )
-ASSET_TYPES.append(NONE_TYPE)
+register_type(NONE_TYPE)
 
 MODEL_TYPE = CAssetTypeDefinition(
     code="mdl",
@@ -67,7 +123,7 @@ MODEL_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/models",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/models"
 )
-ASSET_TYPES.append(MODEL_TYPE)
+register_type(MODEL_TYPE)
 
 ANIMATION_TYPE = CAssetTypeDefinition(
     code="anm",
@@ -76,7 +132,7 @@ ANIMATION_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/animations",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/animations"
 )
-ASSET_TYPES.append(ANIMATION_TYPE)
+register_type(ANIMATION_TYPE)
 
 RIG_TYPE = CAssetTypeDefinition(
     code="rig",
@@ -85,7 +141,7 @@ RIG_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/rigs",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/rigs"
 )
-ASSET_TYPES.append(RIG_TYPE)
+register_type(RIG_TYPE)
 
 LAYOUT_TYPE = CAssetTypeDefinition(
     code="lay",
@@ -94,7 +150,7 @@ LAYOUT_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/layouts",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/layouts"
 )
-ASSET_TYPES.append(LAYOUT_TYPE)
+register_type(LAYOUT_TYPE)
 
 PROXY_TYPE = CAssetTypeDefinition(
     code="prx",
@@ -103,7 +159,7 @@ PROXY_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/proxies",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/proxies"
 )
-ASSET_TYPES.append(PROXY_TYPE)
+register_type(PROXY_TYPE)
 
 SIMULATION_TYPE = CAssetTypeDefinition(
     code="sim",
@@ -112,7 +168,7 @@ SIMULATION_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/simulations",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/simulations"
 )
-ASSET_TYPES.append(SIMULATION_TYPE)
+register_type(SIMULATION_TYPE)
 
 RENDER_TYPE = CAssetTypeDefinition(
     code="rnd",
@@ -121,7 +177,7 @@ RENDER_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/renders",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/renders"
 )
-ASSET_TYPES.append(RENDER_TYPE)
+register_type(RENDER_TYPE)
 
 TEST_TYPE = CAssetTypeDefinition(
     code="tst",
@@ -130,7 +186,7 @@ TEST_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/tests",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/tests"
 )
-ASSET_TYPES.append(TEST_TYPE)
+register_type(TEST_TYPE)
 
 KIT_TYPE = CAssetTypeDefinition(
     code="kit",
@@ -139,7 +195,7 @@ KIT_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/kits",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/kits"
 )
-ASSET_TYPES.append(KIT_TYPE)
+register_type(KIT_TYPE)
 
 CAMERA_TYPE = CAssetTypeDefinition(
     code="cam",
@@ -148,7 +204,7 @@ CAMERA_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/cameras",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/cameras"
 )
-ASSET_TYPES.append(CAMERA_TYPE)
+register_type(CAMERA_TYPE)
 
 LIGHTING_TYPE = CAssetTypeDefinition(
     code="ltg",
@@ -157,46 +213,61 @@ LIGHTING_TYPE = CAssetTypeDefinition(
     publish_dir=settings.ASSET_PUBLISH_BASE_FOLDER + "/lightings",
     export_dir=settings.ASSET_EXPORT_BASE_FOLDER + "/lightings"
 )
-ASSET_TYPES.append(LIGHTING_TYPE)
+register_type(LIGHTING_TYPE)
 
 
 def codes():
-    """Return a list of every asset type's code from the list of asset type definitions."""
+    """Return every asset type's code from the list of asset type definitions. The tuple is cached until the registry changes."""
 
-    result = []
+    global _CODES
 
-    for asset_type in ASSET_TYPES:
-        result.append(asset_type.code)
+    if _CODES is None:
+        _CODES = tuple(asset_type.code for asset_type in ASSET_TYPES)
 
-    return result
+    return _CODES
 
 
 def names():
-    """Return a list of every asset type's name from the list of asset type definitions."""
+    """Return every asset type's name from the list of asset type definitions. The tuple is cached until the registry changes."""
 
-    result = []
+    global _NAMES
 
-    for asset_type in ASSET_TYPES:
-        result.append(asset_type.name)
+    if _NAMES is None:
+        _NAMES = tuple(asset_type.name for asset_type in ASSET_TYPES)
+
+    return _NAMES
+
+
+def name_converter():
+    """Return a binding converter turning an asset type's code into its name and back, used to bind a control showing the names to an asset storing the codes.
+    The converter is cached until the registry changes."""
 
-    return result
+    global _NAME_CONVERTER
+
+    if _NAME_CONVERTER is None:
+        _NAME_CONVERTER = data_binding.CMappingConverter((code, asset_type.name) for code, asset_type in _TYPES_BY_CODE.items())
+
+    return _NAME_CONVERTER
 
 
 def get_type_by_name(name):
     """Return an asset type definition by name."""
 
-    for asset_type in ASSET_TYPES:
-        if asset_type.name == name:
-            return asset_type
-
-    return NONE_TYPE
+    return _TYPES_BY_NAME.get(name, NONE_TYPE)
 
 
 def get_type_by_code(code):
     """Return an asset type definition by code."""
 
-    for asset_type in ASSET_TYPES:
-        if asset_type.code == code:
-            return asset_type
+    return _TYPES_BY_CODE.get(code, NONE_TYPE)
+
+
+def get_type(code_or_name):
+    """Return an asset type definition by code or by name. The code is looked up first."""
+
+    asset_type = _TYPES_BY_CODE.get(code_or_name)
+
+    if asset_type is None:
+        asset_type = _TYPES_BY_NAME.get(code_or_name, NONE_TYPE)
 
-    return NONE_TYPE
+    return asset_type
@@ -0,0 +1,105 @@
+"""Module containing the batch publish engine. The publishes of many nodes are planned up front from the nodes' names, the nodes sharing
+the same publish target are grouped and each group is exported once, using a publish command."""
+
+from collections import OrderedDict, namedtuple
+import colorium.asset_record as asset_record
+import colorium.command as command
+import colorium.naming_convention as naming_convention
+import colorium.scene_name_parser as scene_name_parser
+
+try:
+    import maya.cmds as cmds
+except ImportError:
+    # Outside Maya, the planning still works. Only publishing needs cmds.
+    cmds = None
+
+
+class CPublishJob(namedtuple("CPublishJob", ("record", "path", "file_name", "nodes"))):
+    """Publish of a group of nodes sharing the same target. Has the path and file_name of a configuration, so it can be passed to a command."""
+
+    __slots__ = ()
+
+
+class CPublishResult(namedtuple("CPublishResult", ("node", "job", "success", "error"))):
+    """Result of the publish of a node. The job is None if the node's name doesn't follow the naming convention."""
+
+    __slots__ = ()
+
+
+def node_short_name(node):
+    """Return the name of a node without its DAG path and namespaces."""
+
+    return node.rpartition("|")[2].rpartition(":")[2]
+
+
+def plan(nodes):
+    """Plan the publishes of the nodes. Returns the list of CPublishJob, one per publish target in the order the targets are first seen,
+    and the list of the nodes whose name doesn't follow the naming convention."""
+
+    jobs = OrderedDict()
+    unparseable = []
+
+    for node in nodes:
+        parsed_name = scene_name_parser.parse_string(node_short_name(node))
+
+        if parsed_name is None:
+            unparseable.append(node)
+            continue
+
+        record = asset_record.from_parsed_name(parsed_name)
+        path = naming_convention.generate_path_for_published_asset(record)
+        file_name = naming_convention.generate_file_name_for_published_asset(record)
+        job = jobs.get((path, file_name))
+
+        if job is None:
+            job = jobs[(path, file_name)] = CPublishJob(record, path, file_name, [])
+
+        job.nodes.append(node)
+
+    return list(jobs.values()), unparseable
+
+
+def publish(nodes, command_name="Maya Ascii", progress=None):
+    """Publish the nodes with the publish command of the specified name, exporting each group of nodes sharing a target once.
+    A failing group doesn't stop the batch. The progress callback, if given, is called with the number of nodes processed,
+    the total number of nodes and the CPublishResult of every node. Returns the list of CPublishResult. The selection is restored at the end."""
+
+    publish_command = command.get_command("publish", command_name)
+
+    if publish_command is None:
+        raise ValueError('{!r} is not a publish command'.format(command_name))
+
+    jobs, unparseable = plan(nodes)
+    total = len(unparseable) + sum(len(job.nodes) for job in jobs)
+    results = []
+
+    def report(result):
+        results.append(result)
+
+        if progress is not None:
+            progress(len(results), total, result)
+
+    for node in unparseable:
+        report(CPublishResult(node, None, False, "The node's name doesn't follow the naming convention."))
+
+    selection = cmds.ls(sl=True) or []
+
+    try:
+        for job in jobs:
+            error = None
+
+            try:
+                cmds.select(job.nodes, r=True)
+                publish_command.execute(job)
+            except Exception as exception:
+                error = str(exception) or repr(exception)
+
+            for node in job.nodes:
+                report(CPublishResult(node, job, error is None, error))
+    finally:
+        if selection:
+            cmds.select(selection, r=True)
+        else:
+            cmds.select(cl=True)
+
+    return results
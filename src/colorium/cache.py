@@ -0,0 +1,141 @@
+"""Module containing a bounded LRU cache and a decorator used to memoize the functions that take an asset as their only argument."""
+
+import functools
+import operator
+import threading
+
+
+DEFAULT_MAX_SIZE = 1024
+
+# Indexes of a link of the LRU cache's circular doubly linked list.
+_PREVIOUS, _NEXT, _KEY, _VALUE = 0, 1, 2, 3
+
+# Sentinel returned by the cache when a key is missing.
+MISSING = object()
+
+
+class CLRUCache(object):
+    """Bounded cache that discards its least recently used value when it's full. Keeps count of its hits and misses."""
+
+    @property
+    def max_size(self):
+        """The maximum number of values kept by the cache."""
+
+        return self.__max_size
+
+
+    @property
+    def size(self):
+        """The number of values currently in the cache."""
+
+        return len(self.__links)
+
+
+    @property
+    def hits(self):
+        """The number of lookups that found their value in the cache."""
+
+        return self.__hits
+
+
+    @property
+    def misses(self):
+        """The number of lookups that didn't find their value in the cache."""
+
+        return self.__misses
+
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.__max_size = max_size
+        self.__links = {}
+        self.__root = []
+        self.__root[:] = [self.__root, self.__root, None, None]
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+
+
+    def get(self, key, default=MISSING):
+        """Return the value cached for the key and mark it as the most recently used, or the default if the key isn't cached."""
+
+        with self.__lock:
+            link = self.__links.get(key)
+
+            if link is None:
+                self.__misses += 1
+
+                return default
+
+            previous_link, next_link = link[_PREVIOUS], link[_NEXT]
+            previous_link[_NEXT] = next_link
+            next_link[_PREVIOUS] = previous_link
+
+            root = self.__root
+            last = root[_PREVIOUS]
+            last[_NEXT] = root[_PREVIOUS] = link
+            link[_PREVIOUS] = last
+            link[_NEXT] = root
+
+            self.__hits += 1
+
+            return link[_VALUE]
+
+
+    def set(self, key, value):
+        """Cache a value for the key. Discards the least recently used value if the cache is full."""
+
+        with self.__lock:
+            if key in self.__links:
+                self.__links[key][_VALUE] = value
+
+                return
+
+            root = self.__root
+
+            if len(self.__links) >= self.__max_size:
+                oldest = root[_NEXT]
+                root[_NEXT] = oldest[_NEXT]
+                oldest[_NEXT][_PREVIOUS] = root
+
+                del self.__links[oldest[_KEY]]
+
+            last = root[_PREVIOUS]
+            link = [last, root, key, value]
+            last[_NEXT] = root[_PREVIOUS] = self.__links[key] = link
+
+
+    def clear(self):
+        """Discard every cached value and reset the hit and miss counters."""
+
+        with self.__lock:
+            self.__links.clear()
+            self.__root[:] = [self.__root, self.__root, None, None]
+            self.__hits = 0
+            self.__misses = 0
+
+
+def memoize(fields, max_size=DEFAULT_MAX_SIZE):
+    """Decorator that memoizes a function taking an asset as its only argument. The results are cached in a CLRUCache keyed on the values
+    of the asset fields the function reads. The decorated function exposes those fields as its fields attribute and the cache as its cache attribute."""
+
+    def decorator(function):
+        lru_cache = CLRUCache(max_size)
+        get_key = operator.attrgetter(*fields)
+
+        @functools.wraps(function)
+        def memoized(asset_data):
+            key = get_key(asset_data)
+            value = lru_cache.get(key)
+
+            if value is MISSING:
+                value = function(asset_data)
+                lru_cache.set(key, value)
+
+            return value
+
+        memoized.fields = tuple(fields)
+        memoized.cache = lru_cache
+
+        return memoized
+
+    return decorator
@@ -1,8 +1,20 @@
 """Module containing all the commands used in Colorium's tools."""
 
 from abc import ABCMeta, abstractmethod, abstractproperty
+import functools
+import importlib
+import json
 import os
-import maya.cmds as cmds
+import sys
+import colorium.command_metrics as command_metrics
+import colorium.geometry_cache as geometry_cache
+import colorium.settings as settings
+
+try:
+    import maya.cmds as cmds
+except ImportError:
+    # Outside Maya (tests, mayapy tooling), the registry still works. Only executing a Maya command needs cmds.
+    cmds = None
 
 
 class CCommand:
@@ -71,7 +83,77 @@ class CConcreteCommand(CCommand):
 
 
     def execute(self, config):
-        self._function(config)
+        return run_middlewares(self, config, self._function)
+
+
+class CLazyCommand(CCommand):
+    """Command whose function is only imported the first time the command is executed. Used for the third-party commands."""
+
+    @property
+    def name(self):
+        return self._name
+
+
+    @property
+    def action(self):
+        return self._action
+
+
+    @property
+    def loaded(self):
+        """Indicates if the command's function has been imported."""
+
+        return self._function is not None
+
+
+    def __init__(self, action, name, loader):
+        self._action = action
+        self._name = name
+        self._loader = loader
+        self._function = None
+
+
+    def execute(self, config):
+        if self._function is None:
+            self._function = self._loader()
+
+        return run_middlewares(self, config, self._function)
+
+
+MIDDLEWARES = []
+
+
+def add_middleware(middleware):
+    """Add a middleware to the chain wrapping the execution of every command. A middleware is a function taking the command, the configuration
+    and a function without argument calling the rest of the chain. It can run code before and after calling the rest of the chain and returns its result.
+    The middlewares are called in the order they were added."""
+
+    if middleware not in MIDDLEWARES:
+        MIDDLEWARES.append(middleware)
+
+
+def remove_middleware(middleware):
+    """Remove a middleware from the chain."""
+
+    if middleware in MIDDLEWARES:
+        MIDDLEWARES.remove(middleware)
+
+
+def run_middlewares(command, config, function):
+    """Call the command's function with the configuration through the middlewares' chain."""
+
+    middlewares = tuple(MIDDLEWARES)
+
+    if not middlewares:
+        return function(config)
+
+    def call(index):
+        if index == len(middlewares):
+            return function(config)
+
+        return middlewares[index](command, config, lambda: call(index + 1))
+
+    return call(0)
 
 
 def __open_explorer(config):
@@ -338,6 +420,34 @@ def __publish_maya_geometry_cache(config):
     cmds.cacheFile(f=config.file_name, dir=config.path, pts=selected_shapes, st=start_frame, et=end_frame, r=True, ws=True, fm="OneFile", sch=True)
 
 
+def __publish_maya_geometry_cache_chunked(config, run_up=False):
+    """Publish the asset in Maya Geometry Cache based on the configuration. The playback range is split in chunks cached in parallel
+    by the worker processes, and indexed in a JSON file (see colorium.geometry_cache). The Maya session waits until every chunk is cached.
+    Without run-up, each chunk is evaluated from its first frame, which is only right for animation and deformers without history.
+    With run-up, each chunk is evaluated from the start of the range, which simulations need : the speedup then only applies to the writing
+    of the cache, not to the evaluation."""
+
+    if not os.path.exists(config.path):
+        os.makedirs(config.path)
+
+    selection = cmds.ls(sl=True)
+    selected_shapes = cmds.listRelatives(selection, s=True, f=True)
+    if not selected_shapes:
+        cmds.confirmDialog(
+            title="Cannot publish asset",
+            message="The asset cannot be published. Please, select the geometry you want to publish.",
+            button=["Ok"],
+            defaultButton="Ok"
+        )
+
+        return
+
+    start_frame = cmds.playbackOptions(q=True, ast=True)
+    end_frame = cmds.playbackOptions(q=True, aet=True)
+
+    geometry_cache.publish_chunked(cmds, config, selected_shapes, start_frame, end_frame, settings.GEOMETRY_CACHE_CHUNK_SIZE, run_up=run_up)
+
+
 def __export_maya_ascii(config):
     """Export the asset in Maya Ascii based on the configuration."""
 
@@ -397,64 +507,195 @@ def __export_obj(config):
 
 
 COMMANDS = []
-COMMANDS.append(CConcreteCommand("open", "Explorer", __open_explorer))
-COMMANDS.append(CConcreteCommand("open", "Maya Ascii", __open_maya_ascii))
-COMMANDS.append(CConcreteCommand("open", "Maya Binary", __open_maya_binary))
-COMMANDS.append(CConcreteCommand("create", "Blank Maya Ascii", __create_blank_maya_ascii))
-COMMANDS.append(CConcreteCommand("create", "Blank Maya Binary", __create_blank_maya_binary))
-COMMANDS.append(CConcreteCommand("delete", "Maya Ascii", __delete_maya_ascii))
-COMMANDS.append(CConcreteCommand("delete", "Maya Binary", __delete_maya_binary))
-COMMANDS.append(CConcreteCommand("save", "Maya Ascii", __save_maya_ascii))
-COMMANDS.append(CConcreteCommand("save", "Maya Binary", __save_maya_binary))
-COMMANDS.append(CConcreteCommand("publish", "Maya Ascii", __publish_maya_ascii))
-COMMANDS.append(CConcreteCommand("publish", "Maya Binary", __publish_maya_binary))
-COMMANDS.append(CConcreteCommand("publish", "Geometry Cache", __publish_maya_geometry_cache))
-COMMANDS.append(CConcreteCommand("export", "Maya Ascii", __export_maya_ascii))
-COMMANDS.append(CConcreteCommand("export", "Maya Binary", __export_maya_binary))
-COMMANDS.append(CConcreteCommand("export", "FBX", __export_fbx))
-COMMANDS.append(CConcreteCommand("export", "OBJ", __export_obj))
-COMMANDS.append(CConcreteCommand("export", "Alembic", __export_alembic))
+
+# Indexes of the commands and cached views, kept in sync with COMMANDS by register_command.
+_COMMANDS_BY_KEY = {}
+_COMMANDS_BY_ACTION = {}
+_COMMANDS_BY_NAME = {}
+_NAMES_BY_ACTION = {}
+_PLUGINS_LOADED = False
+
+# The entry point group and the manifest file of the plugins folder used to register third-party commands.
+PLUGIN_ENTRY_POINT_GROUP = "colorium.commands"
+PLUGIN_MANIFEST_FILE_NAME = "commands.json"
+
+
+def register_command(command):
+    """Add a command to the list of commands and index it by action and name. When two commands share an action and a name, the first one registered wins."""
+
+    key = (command.action, command.name)
+
+    if key in _COMMANDS_BY_KEY:
+        return _COMMANDS_BY_KEY[key]
+
+    COMMANDS.append(command)
+
+    _COMMANDS_BY_KEY[key] = command
+    _COMMANDS_BY_ACTION.setdefault(command.action, []).append(command)
+    _COMMANDS_BY_NAME.setdefault(command.name, []).append(command)
+    _NAMES_BY_ACTION.pop(command.action, None)
+
+    return command
+
+
+register_command(CConcreteCommand("open", "Explorer", __open_explorer))
+register_command(CConcreteCommand("open", "Maya Ascii", __open_maya_ascii))
+register_command(CConcreteCommand("open", "Maya Binary", __open_maya_binary))
+register_command(CConcreteCommand("create", "Blank Maya Ascii", __create_blank_maya_ascii))
+register_command(CConcreteCommand("create", "Blank Maya Binary", __create_blank_maya_binary))
+register_command(CConcreteCommand("delete", "Maya Ascii", __delete_maya_ascii))
+register_command(CConcreteCommand("delete", "Maya Binary", __delete_maya_binary))
+register_command(CConcreteCommand("save", "Maya Ascii", __save_maya_ascii))
+register_command(CConcreteCommand("save", "Maya Binary", __save_maya_binary))
+register_command(CConcreteCommand("publish", "Maya Ascii", __publish_maya_ascii))
+register_command(CConcreteCommand("publish", "Maya Binary", __publish_maya_binary))
+register_command(CConcreteCommand("publish", "Geometry Cache", __publish_maya_geometry_cache))
+register_command(CConcreteCommand("publish", "Geometry Cache (Chunked)", __publish_maya_geometry_cache_chunked))
+register_command(CConcreteCommand("publish", "Geometry Cache (Chunked, Run-Up)", functools.partial(__publish_maya_geometry_cache_chunked, run_up=True)))
+register_command(CConcreteCommand("export", "Maya Ascii", __export_maya_ascii))
+register_command(CConcreteCommand("export", "Maya Binary", __export_maya_binary))
+register_command(CConcreteCommand("export", "FBX", __export_fbx))
+register_command(CConcreteCommand("export", "OBJ", __export_obj))
+register_command(CConcreteCommand("export", "Alembic", __export_alembic))
+
+
+if settings.COMMAND_METRICS_ENABLED:
+    add_middleware(command_metrics.CMetricsMiddleware(settings.COMMAND_METRICS_LOG, settings.COMMAND_PROFILE_FOLDER or None))
+
+
+def load_plugins():
+    """Register the third-party commands, once. The commands are declared by the entry points of the \"colorium.commands\" group
+    and by the manifest of the plugins folder (settings.COMMAND_PLUGINS_FOLDER), both named \"action:Name\" and pointing to a \"module:function\".
+    The plugins' modules are only imported the first time their command is executed. Called by the get functions on their first call.
+    A source or a declaration that can't be read only prints a warning, so a broken plugin never prevents the built-in commands from loading."""
+
+    global _PLUGINS_LOADED
+
+    if _PLUGINS_LOADED:
+        return
+
+    _PLUGINS_LOADED = True
+
+    for source, discover in (("entry points", __discover_entry_point_commands), ("plugins folder", lambda: __discover_folder_commands(settings.COMMAND_PLUGINS_FOLDER))):
+        try:
+            commands = discover()
+        except Exception as exception:
+            print('Could not load the plugin commands of the {} : {}'.format(source, exception))
+            continue
+
+        for command in commands:
+            register_command(command)
+
+
+def __discover_entry_point_commands():
+    """Return the lazy commands declared by the installed distributions' entry points. Returns nothing if setuptools isn't available."""
+
+    try:
+        import pkg_resources
+    except ImportError:
+        return []
+
+    commands = []
+
+    for entry_point in pkg_resources.iter_entry_points(PLUGIN_ENTRY_POINT_GROUP):
+        try:
+            action, name = parse_command_key(entry_point.name)
+        except ValueError as exception:
+            print('Could not load the plugin command \'{}\' : {}'.format(entry_point.name, exception))
+            continue
+
+        commands.append(CLazyCommand(action, name, entry_point.load))
+
+    return commands
+
+
+def __discover_folder_commands(folder):
+    """Return the lazy commands declared by the manifest of a plugins folder. The folder is added to the module search path when a command is loaded."""
+
+    manifest_path = os.path.join(folder, PLUGIN_MANIFEST_FILE_NAME) if folder else None
+
+    if not manifest_path or not os.path.isfile(manifest_path):
+        return []
+
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+
+    if not isinstance(manifest, dict):
+        raise ValueError('The manifest \'{}\' must map "action:Name" keys to "module:function" targets.'.format(manifest_path))
+
+    commands = []
+
+    for key, target in sorted(manifest.items()):
+        try:
+            action, name = parse_command_key(key)
+
+            if not isinstance(target, basestring) or ":" not in target:
+                raise ValueError('The target {!r} isn\'t a "module:function" target.'.format(target))
+        except ValueError as exception:
+            print('Could not load the plugin command \'{}\' : {}'.format(key, exception))
+            continue
+
+        commands.append(CLazyCommand(action, name, functools.partial(load_target, target, folder)))
+
+    return commands
+
+
+def parse_command_key(key):
+    """Split an \"action:Name\" plugin command key in its action and name. Raises a ValueError if either is missing."""
+
+    action, separator, name = key.partition(":")
+
+    if not separator or not action or not name:
+        raise ValueError('The key {!r} isn\'t an "action:Name" key.'.format(key))
+
+    return action, name
+
+
+def load_target(target, folder=None):
+    """Import the module of a \"module:function\" target and return the function. The folder, if given, is added to the module search path first."""
+
+    module_name, _, attribute = target.partition(":")
+
+    if folder and folder not in sys.path:
+        sys.path.append(folder)
+
+    module = importlib.import_module(module_name)
+
+    return getattr(module, attribute)
 
 
 def get_commands_by_action(action):
     """Get commands by action."""
 
-    commands_to_return = []
-
-    for command in COMMANDS:
-        if command.action == action:
-            commands_to_return.append(command)
+    load_plugins()
 
-    return commands_to_return
+    return tuple(_COMMANDS_BY_ACTION.get(action, ()))
 
 
 def get_commands_by_name(name):
     """Get commands by name."""
 
-    commands_to_return = []
+    load_plugins()
 
-    for command in COMMANDS:
-        if command.name == name:
-            commands_to_return.append(name)
-
-    return commands_to_return
+    return tuple(_COMMANDS_BY_NAME.get(name, ()))
 
 
 def get_command_names_by_action(action):
-    """Get command names by action."""
+    """Get command names by action. The tuple is cached until a command of the action is registered."""
+
+    load_plugins()
 
-    command_names_to_return = []
+    names = _NAMES_BY_ACTION.get(action)
 
-    for command in COMMANDS:
-        if command.action == action:
-            command_names_to_return.append(command.name)
+    if names is None:
+        names = _NAMES_BY_ACTION[action] = tuple(command.name for command in _COMMANDS_BY_ACTION.get(action, ()))
 
-    return command_names_to_return
+    return names
 
 
 def get_command(action, name):
     """Get the command by action and name."""
 
-    for command in COMMANDS:
-        if command.action == action and command.name == name:
-            return command
+    load_plugins()
+
+    return _COMMANDS_BY_KEY.get((action, name))
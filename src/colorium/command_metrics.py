@@ -0,0 +1,248 @@
+"""Module containing the command middleware recording the metrics of the commands' executions (timing, bytes written, profiles) and the
+functions used to read and summarize them. Run the module to print a summary of a metrics log."""
+
+import argparse
+import getpass
+import json
+import math
+import os
+import socket
+import sys
+import threading
+import time
+
+
+# The extensions Maya adds to the file name of a configuration when writing its output (scenes, geometry caches).
+OUTPUT_EXTENSIONS = ("", ".ma", ".mb", ".xml", ".mcc", ".mcx")
+
+
+class CMetricsMiddleware(object):
+    """Command middleware measuring the wall clock and CPU time of each command execution and the bytes written in the configuration's path.
+    Each execution is appended as a JSON line to the metrics log. If a profile folder is given, the execution is also profiled with cProfile
+    and the stats are dumped to a file per execution."""
+
+    @property
+    def log_path(self):
+        """The path of the JSON lines metrics log."""
+
+        return self.__log_path
+
+
+    @property
+    def profile_folder(self):
+        """The folder where the cProfile stats are dumped, or None to disable the profiling."""
+
+        return self.__profile_folder
+
+
+    def __init__(self, log_path, profile_folder=None):
+        self.__log_path = log_path
+        self.__profile_folder = profile_folder
+        self.__lock = threading.Lock()
+
+
+    def __call__(self, command, config, call_next):
+        start_time = time.time()
+        start_cpu = _cpu_time()
+        status = "ok"
+        error = None
+
+        try:
+            if self.__profile_folder:
+                return self.__profile(command, start_time, call_next)
+
+            return call_next()
+        except Exception as exception:
+            status = "error"
+            error = repr(exception)
+            raise
+        finally:
+            self.__record(command, config, start_time, start_cpu, status, error)
+
+
+    def __record(self, command, config, start_time, start_cpu, status, error):
+        """Collect the metrics of an execution and write them. A failure only prints a warning, so it can't fail a command that succeeded
+        or replace the exception of a command that failed."""
+
+        try:
+            record = {
+                "time": start_time,
+                "action": command.action,
+                "command": command.name,
+                "file_name": getattr(config, "file_name", None),
+                "path": getattr(config, "path", None),
+                "wall": time.time() - start_time,
+                "cpu": _cpu_time() - start_cpu,
+                "bytes_written": get_bytes_written(config, start_time),
+                "user": getpass.getuser(),
+                "host": socket.gethostname(),
+                "status": status,
+            }
+
+            if error:
+                record["error"] = error
+
+            self.write(record)
+        except Exception as exception:
+            print('Could not record the metrics of the command \'{}\' : {}'.format(getattr(command, "name", command), exception))
+
+
+    def write(self, record):
+        """Append a record to the metrics log. A log that can't be written only prints a warning, it never fails the command."""
+
+        line = json.dumps(record, sort_keys=True) + "\n"
+
+        with self.__lock:
+            try:
+                folder = os.path.dirname(self.__log_path)
+
+                if folder and not os.path.exists(folder):
+                    os.makedirs(folder)
+
+                with open(self.__log_path, "a") as log_file:
+                    log_file.write(line)
+            except (IOError, OSError) as exception:
+                print('Could not write the command metrics to \'{}\' : {}'.format(self.__log_path, exception))
+
+
+    def __profile(self, command, start_time, call_next):
+        """Call the rest of the chain under cProfile and dump the stats in the profile folder."""
+
+        import cProfile
+
+        profile = cProfile.Profile()
+
+        try:
+            return profile.runcall(call_next)
+        finally:
+            try:
+                if not os.path.exists(self.__profile_folder):
+                    os.makedirs(self.__profile_folder)
+
+                file_name = "{}_{}_{}.prof".format(command.action, command.name.replace(" ", "_"), time.strftime("%Y%m%d_%H%M%S", time.localtime(start_time)))
+                profile.dump_stats(os.path.join(self.__profile_folder, file_name))
+            except Exception as exception:
+                print('Could not dump the profile of the command \'{}\' : {}'.format(command.name, exception))
+
+
+def _cpu_time():
+    """Return the user and system CPU time of the process."""
+
+    times = os.times()
+
+    return times[0] + times[1]
+
+
+def get_bytes_written(config, since):
+    """Return the size of the configuration's output files modified since the specified time : the file named after the configuration's
+    file name in its path, with any of the OUTPUT_EXTENSIONS. The other files of the path aren't counted."""
+
+    path = getattr(config, "path", None)
+    file_name = getattr(config, "file_name", None)
+
+    if not path or not file_name:
+        return 0
+
+    total = 0
+    output_path = os.path.join(path, file_name)
+
+    for extension in OUTPUT_EXTENSIONS:
+        file_path = output_path + extension
+
+        if os.path.isfile(file_path) and os.path.getmtime(file_path) >= since:
+            total += os.path.getsize(file_path)
+
+    return total
+
+
+def read_log(log_path):
+    """Yield the records of a metrics log. The lines that aren't valid JSON (a partially written line) are skipped."""
+
+    with open(log_path) as log_file:
+        for line in log_file:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def summarize(records, keys=("action", "command")):
+    """Aggregate records by the specified keys. Returns a list of dictionaries with the keys' values and the count, the errors,
+    the total, mean, median, 95th percentile and max wall clock time, the mean CPU time and the total bytes written, sorted by total wall clock time."""
+
+    groups = {}
+
+    for record in records:
+        groups.setdefault(tuple(record.get(key) for key in keys), []).append(record)
+
+    summaries = []
+
+    for group_key, group in groups.items():
+        walls = sorted(record["wall"] for record in group)
+        summary = dict(zip(keys, group_key))
+        summary.update({
+            "count": len(group),
+            "errors": sum(1 for record in group if record.get("status") != "ok"),
+            "total": sum(walls),
+            "mean": sum(walls) / len(walls),
+            "p50": _percentile(walls, 50),
+            "p95": _percentile(walls, 95),
+            "max": walls[-1],
+            "cpu": sum(record.get("cpu", 0) for record in group) / len(group),
+            "bytes_written": sum(record.get("bytes_written", 0) for record in group),
+        })
+        summaries.append(summary)
+
+    summaries.sort(key=lambda summary: -summary["total"])
+
+    return summaries
+
+
+def _percentile(sorted_values, percent):
+    """Return the nearest-rank percentile of sorted values."""
+
+    index = max(0, int(math.ceil(percent / 100.0 * len(sorted_values))) - 1)
+
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def format_summaries(summaries, keys=("action", "command")):
+    """Return a text table of the summaries returned by summarize."""
+
+    header = "".join("{:<16}".format(key) for key in keys)
+    lines = [header + "{:>7} {:>7} {:>10} {:>9} {:>9} {:>9} {:>9} {:>9} {:>12}".format("count", "errors", "total s", "mean s", "p50 s", "p95 s", "max s", "cpu s", "MB written")]
+
+    for summary in summaries:
+        line = "".join("{:<16}".format(str(summary[key])) for key in keys)
+        lines.append(line + "{:>7} {:>7} {:>10.2f} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>12.1f}".format(
+            summary["count"], summary["errors"], summary["total"], summary["mean"], summary["p50"], summary["p95"], summary["max"], summary["cpu"],
+            summary["bytes_written"] / 1048576.0))
+
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Print a summary of one or more metrics logs."""
+
+    import colorium.settings as settings
+
+    parser = argparse.ArgumentParser(description="Summarize the metrics of Colorium's commands.")
+    parser.add_argument("logs", nargs="*", default=[settings.COMMAND_METRICS_LOG], help="the JSON lines metrics logs")
+    parser.add_argument("--by", nargs="+", default=["action", "command"], choices=["action", "command", "user", "host", "status"], help="the keys to group by")
+    parser.add_argument("--user", help="only summarize the executions of this user")
+    args = parser.parse_args(argv)
+
+    log_paths = [log_path for log_path in args.logs if os.path.isfile(log_path)]
+    records = [record for log_path in log_paths for record in read_log(log_path) if not args.user or record.get("user") == args.user]
+
+    if not records:
+        print("No command metrics found.")
+        return 1
+
+    print(format_summaries(summarize(records, args.by), args.by))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Module containing the planning of an asset's commit (save, publish and export) as a task graph. Publish and export only read the saved
+scene, so they both depend on the save and run in parallel once it's done, in the worker pool when their command can run there."""
+
+import colorium.task_graph as task_graph
+import colorium.worker as worker
+import colorium.worker_pool as worker_pool
+
+
+def can_run_in_worker(config):
+    """Indicates if the configuration's command has a worker handler, so it can run out of the artist's Maya session.
+    A command run by a worker doesn't go through the command middlewares of the session, so its metrics aren't recorded."""
+
+    return (config.command.action, config.command.name) in worker.HANDLERS
+
+
+def plan_commit(asset, cmds, save=True, publish=True, export=True, increment_version=False, pool=None):
+    """Return the CTaskGraph committing the asset. The save runs first, in the Maya session. The publish and export run once the save succeeded,
+    in parallel in the worker pool (on the saved scene and the selected nodes) when a pool is given and their command can run there,
+    in the Maya session otherwise, or if the pool's worker executable can't be found. Without a save, the workers use a snapshot of the current scene,
+    deleted once the graph has run."""
+
+    graph = task_graph.CTaskGraph()
+    nodes = cmds.ls(sl=True) or []
+    scenes = []
+
+    def get_scene():
+        if not scenes:
+            scenes.append(worker_pool.save_snapshot(cmds))
+
+        return scenes[0]
+
+    if save:
+        def save_asset():
+            if increment_version:
+                asset.update_many(version=asset.version + 1)
+
+            asset.save_config.execute_command()
+            scenes.append(cmds.file(q=True, sn=True))
+
+        graph.add_task("save", save_asset)
+
+    steps = [(name, config) for name, enabled, config in (("publish", publish, asset.publish_config), ("export", export, asset.export_config)) if enabled]
+    use_pool = pool is not None and bool(nodes) and pool.is_available()
+    in_workers = dict((name, use_pool and can_run_in_worker(config)) for name, config in steps)
+
+    # The steps running in the workers are started first, so they run while the steps running in the Maya session do.
+    steps.sort(key=lambda step: not in_workers[step[0]])
+
+    for name, config in steps:
+        if in_workers[name]:
+            function = lambda config=config: pool.submit_configuration(config, get_scene(), nodes)
+        else:
+            function = config.execute_command
+
+        graph.add_task(name, function, ("save",) if save else ())
+
+    if not save:
+        graph.add_cleanup(lambda: scenes and worker_pool.remove_snapshot(scenes[0]))
+
+    return graph
@@ -1,10 +1,19 @@
 """Module containing the CConfiguration class. The CConfiguration class uses an asset information to generate a path and file name for saving, publishing, exporting, creating and deleting the asset using a specific command."""
 
+from colorium.asset_record import CAssetRecord
 import colorium.data_binding as data_binding
+import patterns.observerPattern as observerPattern
 
 
-class CConfiguration(object, data_binding.CBindable):
-    """Uses an asset information to generate a path and file name for saving, publishing, exporting, creating and deleting the asset using a specific command."""
+# The sets of fields of the generator functions, shared by every configuration.
+_GENERATOR_FIELDS = {}
+
+
+class CConfiguration(observerPattern.Observable, data_binding.CBindable):
+    """Uses an asset information to generate a path and file name for saving, publishing, exporting, creating and deleting the asset using a specific command.
+    The property changes are sent to the bindings and published to the observers, the property's name being the topic."""
+
+    PROPERTIES = ("name", "file_name_overridden", "file_name", "path_overridden", "path", "asset", "command")
 
     @property
     def name(self):
@@ -29,18 +38,25 @@ class CConfiguration(object, data_binding.CBindable):
     def file_name_overridden(self, value):
         self.__file_name_overridden = value
         self.notify_property_changed('file_name_overridden', value)
+
+        if not value:
+            self.update('file_name_overridden')
         print('\'file_name_overridden\' property of CConfiguration set to \'{}\'').format(value)
 
 
     @property
     def file_name(self):
-        """The file name."""
+        """The file name. Recomputed on read if the asset fields it depends on changed since it was last generated, unless it's overridden."""
+
+        if self.__file_name_outdated:
+            self.update_file_name()
 
         return self.__file_name
 
     @file_name.setter
     def file_name(self, value):
         self.__file_name = value
+        self.__file_name_outdated = False
         self.notify_property_changed('file_name', value)
         print('\'file_name\' property of CConfiguration set to \'{}\'').format(value)
 
@@ -55,18 +71,25 @@ class CConfiguration(object, data_binding.CBindable):
     def path_overridden(self, value):
         self.__path_overridden = value
         self.notify_property_changed('path_overridden', value)
+
+        if not value:
+            self.update('path_overridden')
         print('\'path_overridden\' property of CConfiguration set to \'{}\'').format(value)
 
 
     @property
     def path(self):
-        """The file path."""
+        """The file path. Recomputed on read if the asset fields it depends on changed since it was last generated, unless it's overridden."""
+
+        if self.__path_outdated:
+            self.update_path()
 
         return self.__path
 
     @path.setter
     def path(self, value):
         self.__path = value
+        self.__path_outdated = False
         self.notify_property_changed('path', value)
         print('\'path\' property of CConfiguration set to \'{}\'').format(value)
 
@@ -80,6 +103,7 @@ class CConfiguration(object, data_binding.CBindable):
     @asset.setter
     def asset(self, value):
         self.__asset = value
+        self.update()
         self.notify_property_changed('asset', value)
         print('\'asset\' property of CConfiguration set to \'{}\'').format(value)
 
@@ -98,6 +122,7 @@ class CConfiguration(object, data_binding.CBindable):
 
 
     def __init__(self, name, asset_data, file_name_generator_function, path_generator_function, default_command):
+        observerPattern.Observable.__init__(self)
         data_binding.CBindable.__init__(self)
 
         self.__name = name
@@ -109,31 +134,133 @@ class CConfiguration(object, data_binding.CBindable):
         self.__file_name_generator_function = file_name_generator_function
         self.__path_generator_function = path_generator_function
         self.__command = default_command
+        self.__file_name_fields = get_generator_fields(file_name_generator_function)
+        self.__path_fields = get_generator_fields(path_generator_function)
+        self.__file_name_outdated = True
+        self.__path_outdated = True
+
+
+    def notify_property_changed(self, prop, value):
+        """Notifies the bindings of the property's new value and publishes it to the observers of the property."""
+
+        data_binding.CBindable.notify_property_changed(self, prop, value)
+        self.notify((prop, value))
+
+
+    def getState(self, topics=None):
+        """Return the current value of every property, or only of the specified properties, as (property, value) changes."""
+
+        return [(prop, getattr(self, prop)) for prop in self.PROPERTIES if topics is None or prop in topics]
+
+
+    def update(self, *fields):
+        """Update the configuration based on the asset information. When fields are given, only the file name and path depending on those asset fields are updated.
+        The update is lazy : the file name and path are marked as outdated and recomputed when read, or right away if a binding is listening to them.
+        An overridden file name or path is kept as is. Turning its override off regenerates it."""
+
+        if depends_on(self.__file_name_fields, fields, 'file_name_overridden'):
+            self.__file_name_outdated = True
+
+            if self.is_bound('file_name'):
+                self.update_file_name()
+
+        if depends_on(self.__path_fields, fields, 'path_overridden'):
+            self.__path_outdated = True
+
+            if self.is_bound('path'):
+                self.update_path()
+
+
+    def get_properties_depending_on(self, *fields):
+        """Return the names of the generated properties (file_name, path) depending on the specified asset fields. No fields means every field."""
+
+        properties = []
 
-        self.update_file_name()
-        self.update_path()
+        if depends_on(self.__file_name_fields, fields):
+            properties.append('file_name')
 
+        if depends_on(self.__path_fields, fields):
+            properties.append('path')
 
-    def update(self):
-        """Update the configuration based on the asset information."""
+        return properties
 
-        self.update_file_name()
-        self.update_path()
+
+    def dependent_properties(self, prop):
+        """Return the generated properties changed as a side effect of a change of the specified property."""
+
+        if prop == 'asset':
+            return [(self, dependent_prop) for dependent_prop in self.get_properties_depending_on()]
+
+        return []
 
 
     def update_file_name(self):
-        """Update the file name based on the asset configuration using the file name generator function passed on instanciation."""
+        """Update the file name based on the asset configuration using the file name generator function passed on instanciation.
+        Does nothing if the file name is overridden."""
+
+        self.__file_name_outdated = False
+
+        if self.__file_name_overridden:
+            return
+
+        file_name = self.__file_name_generator_function(self.__asset)
 
-        self.file_name = self.__file_name_generator_function(self.__asset)
+        if file_name != self.__file_name:
+            self.file_name = file_name
 
 
     def update_path(self):
-        """Update the file paht based on the asset configuration using the file path generator function passed on instanciation."""
+        """Update the file paht based on the asset configuration using the file path generator function passed on instanciation.
+        Does nothing if the file path is overridden."""
+
+        self.__path_outdated = False
+
+        if self.__path_overridden:
+            return
+
+        path = self.__path_generator_function(self.__asset)
+
+        if path != self.__path:
+            self.path = path
+
 
-        self.path = self.__path_generator_function(self.__asset)
+    def to_description(self):
+        """Return a description of the configuration made of plain values, that can be serialized to JSON and sent to a worker process."""
+
+        return {
+            "name": self.__name,
+            "file_name": self.file_name,
+            "path": self.path,
+            "command": {"action": self.__command.action, "name": self.__command.name},
+            "asset": dict(zip(CAssetRecord._fields, self.__asset.to_record())),
+        }
 
 
     def execute_command(self):
         """Execute the command associated to the configuration."""
 
         self.__command.execute(self)
+
+
+def get_generator_fields(generator_function):
+    """Return the set of asset fields a generator function depends on, or None if the generator doesn't declare them (it then depends on every field)."""
+
+    fields = getattr(generator_function, 'fields', None)
+
+    if fields is None:
+        return None
+
+    if fields not in _GENERATOR_FIELDS:
+        _GENERATOR_FIELDS[fields] = frozenset(fields)
+
+    return _GENERATOR_FIELDS[fields]
+
+
+def depends_on(generator_fields, changed_fields, override_field=None):
+    """Indicates if a generator depending on the generator fields must be updated after a change of the changed fields. No changed fields means everything changed.
+    A change of the override field (turning the override off) always requires an update."""
+
+    if not changed_fields or generator_fields is None or override_field in changed_fields:
+        return True
+
+    return not generator_fields.isdisjoint(changed_fields)
@@ -1,18 +1,39 @@
 """Module that contains a variety of functions and classes used to bind classes' properties together."""
 
+from collections import OrderedDict, namedtuple
+import inspect
+import itertools
+import json
+import threading
+import timeit
+import weakref
+
+
+# The property descriptors resolved by get_property, by class and name.
+_PROPERTIES = {}
+
+# The change token of the cascade of binding updates in progress, per thread, and the generator of the cascades' IDs.
+_PROPAGATION = threading.local()
+_GENERATIONS = itertools.count(1)
+
+# The profiler recording the binding updates, set by CBindingProfiler.start.
+_PROFILER = None
+
 
 class CBinding(object):
-    """Description of a binding between two bindable objects : the source object (children of this class) and the destination object."""
+    """Description of a binding between two bindable objects : the source object (children of this class) and the destination object.
+    The binding only holds a weak reference to the destination object, so a binding never keeps its destination alive."""
 
     @property
     def obj(self):
-        """The instance of the destination object that has the binded property."""
+        """The instance of the destination object that has the binded property, or None if it has been garbage collected."""
 
-        return self.__obj
+        return self.__obj()
 
     @obj.setter
     def obj(self, value):
-        self.__obj = value
+        self.__obj = weakref.ref(value)
+        self.__descriptor = None
 
 
     @property
@@ -24,6 +45,7 @@ class CBinding(object):
     @obj_prop.setter
     def obj_prop(self, value):
         self.__obj_prop = value
+        self.__descriptor = None
 
 
     @property
@@ -37,19 +59,55 @@ class CBinding(object):
         self.__prop = value
 
 
-    def __init__(self, obj, obj_prop, prop):
-        self.__obj = obj
+    @property
+    def convert(self):
+        """The function converting the source object's property values into the destination object's property values, or None."""
+
+        return self.__convert
+
+    @convert.setter
+    def convert(self, value):
+        self.__convert = value
+
+
+    @property
+    def deferred(self):
+        """Indicates if the updates of the destination object's property are queued in the deferred dispatcher instead of being applied right away."""
+
+        return self.__deferred
+
+    @deferred.setter
+    def deferred(self, value):
+        self.__deferred = value
+
+
+    @property
+    def key(self):
+        """The key identifying the binding among the bindings of a source object's property : the destination object and its property."""
+
+        return (self.__obj, self.__obj_prop)
+
+
+    def __init__(self, obj, obj_prop, prop, deferred=False, convert=None):
+        self.__obj = weakref.ref(obj)
         self.__obj_prop = obj_prop
         self.__prop = prop
+        self.__deferred = deferred
+        self.__convert = convert
+        self.__descriptor = None
 
 
     def __eq__(self, other):
-        if self.__obj is other.obj and self.__obj_prop == other.obj_prop and self.__prop == other.prop:
+        if self.__obj == other.key[0] and self.__obj_prop == other.obj_prop and self.__prop == other.prop:
             return True
 
         return False
 
 
+    def __hash__(self):
+        return hash((self.__obj, self.__obj_prop, self.__prop))
+
+
     def __ne__(self, other):
         if self.__eq__(other):
             return False
@@ -57,124 +115,704 @@ class CBinding(object):
         return True
 
 
-    def update_prop(self, value):
-        """Update the destination object's property value with the new source object's property value."""
+    def update_prop(self, value, token=None):
+        """Update the destination object's property value with the new source object's property value.
+        The update is skipped if the destination property already has the value, or if the change token shows the destination property
+        was already updated by the current cascade of updates (a cycle in the binding graph)."""
 
-        obj_type = type(self.__obj)
+        obj = self.__obj()
 
-        if self.__obj_prop not in obj_type.__dict__:
-            print '{!r} is not an attribute of class {}'.format(self.__obj_prop, obj_type.__name__)
-        else:
-            prop = obj_type.__dict__[self.__obj_prop]
+        if obj is None:
+            return
 
-            if not isinstance(prop, property):
-                print '{!r} is not a property of class {}'.format(self.__obj_prop, obj_type.__name__)
+        if token is not None:
+            key = (id(obj), self.__obj_prop)
 
-            self.__obj.notified = True
+            if key in token.visited:
+                return
 
-            prop.__set__(self.__obj, value)
+            token.visited.add(key)
 
-            self.__obj.notified = False
+        descriptor = self.__descriptor
 
+        if descriptor is None:
+            descriptor = self.__descriptor = get_property(obj.__class__, self.__obj_prop)
+
+        if self.__convert is not None:
+            value = self.__convert(value)
+
+        if descriptor.fget is not None and descriptor.fget(obj) == value:
+            return
+
+        descriptor.__set__(obj, value)
+
+
+class CConverter(object):
+    """Converts the values flowing through a two-way binding created by bind. convert turns obj_b's property values into obj_a's property values
+    and convert_back does the opposite."""
+
+    def __init__(self, convert, convert_back):
+        self.__convert = convert
+        self.__convert_back = convert_back
+
+
+    def convert(self, value):
+        """Convert one of obj_b's property values into one of obj_a's property values."""
+
+        return self.__convert(value)
+
+
+    def convert_back(self, value):
+        """Convert one of obj_a's property values into one of obj_b's property values."""
+
+        return self.__convert_back(value)
+
+
+class CMappingConverter(CConverter):
+    """Converter backed by lookup tables precomputed from a mapping of obj_b's property values to obj_a's property values.
+    Values missing from the tables are passed through unchanged."""
+
+    def __init__(self, mapping):
+        forward = dict(mapping)
+        backward = dict((value, key) for key, value in forward.items())
+
+        super(CMappingConverter, self).__init__(
+            lambda value: forward.get(value, value),
+            lambda value: backward.get(value, value)
+        )
+
+
+class CChangeToken(object):
+    """Token carried by a cascade of binding updates started by a property change. Identifies the cascade with a generation ID and records
+    the (object, property) pairs already updated by the cascade."""
+
+    @property
+    def generation(self):
+        """The generation ID of the cascade."""
+
+        return self.__generation
+
+
+    @property
+    def visited(self):
+        """The set of (object's id, property) pairs already updated by the cascade."""
+
+        return self.__visited
+
+
+    def __init__(self, generation):
+        self.__generation = generation
+        self.__visited = set()
+
+
+class CDeferredDispatcher(object):
+    """Queue of deferred binding updates. Repeated updates of the same destination object's property are merged into one carrying the last value.
+    The first update queued after a flush asks the scheduler to call flush later, once. The scheduler is a function taking the function to call
+    (Maya's evalDeferred in production). Without a scheduler, the queue has to be flushed manually."""
+
+    @property
+    def scheduler(self):
+        """The function used to schedule the flush of the queue."""
+
+        return self.__scheduler
+
+    @scheduler.setter
+    def scheduler(self, value):
+        self.__scheduler = value
 
-class CBindable():
-    """\"Interface\" used to define a bindable object. A bindable object's properties can be bound to another bindable object's properties.
-    The notify_property_changed function can be used in the setter fucntion of a bindable object's property to notify any bindable object's property
-    bound to the notifier."""
 
     @property
-    def notified(self):
-        """Indicates if the object is being notify."""
+    def pending(self):
+        """The number of updates waiting in the queue."""
+
+        return len(self.__updates)
+
+
+    def __init__(self, scheduler=None):
+        self.__scheduler = scheduler
+        self.__updates = OrderedDict()
+        self.__scheduled = False
+        self.__lock = threading.Lock()
+
+
+    def post(self, binding, value):
+        """Queue the update of a binding's destination property, replacing any update of the same property already in the queue."""
+
+        with self.__lock:
+            self.__updates[binding.key] = (binding, value)
+
+            schedule = not self.__scheduled and self.__scheduler is not None
+            self.__scheduled = self.__scheduled or schedule
 
-        return self.__notified
+        if not schedule:
+            return
 
-    @notified.setter
-    def notified(self, value):
-        self.__notified = value
+        try:
+            self.__scheduler(self.flush)
+        except Exception:
+            # The next update has to try scheduling again, or the queue would never be flushed.
+            with self.__lock:
+                self.__scheduled = False
 
+            raise
+
+
+    def flush(self):
+        """Apply every update in the queue, in the order the properties were first queued."""
+
+        with self.__lock:
+            updates = self.__updates
+            self.__updates = OrderedDict()
+            self.__scheduled = False
+
+        for binding, value in updates.values():
+            binding.update_prop(value)
+
+
+    def clear(self):
+        """Drop every update in the queue without applying them. The next update queued asks the scheduler for a flush again."""
+
+        with self.__lock:
+            self.__updates = OrderedDict()
+            self.__scheduled = False
+
+
+DISPATCHER = CDeferredDispatcher()
+
+
+class CBindable():
+    """\"Interface\" used to define a bindable object. A bindable object's properties can be bound to another bindable object's properties.
+    The notify_property_changed function can be used in the setter fucntion of a bindable object's property to notify any bindable object's property
+    bound to the notifier."""
 
     def __init__(self):
-        self.__bindings = []
-        self.__notified = False
+        self.__bindings = {}
+        self.__binding_lists = {}
+        self.__targets = {}
+        self.__sources = {}
 
 
     def add_binding(self, new_binding):
         """Add a binding the object's binding list."""
 
-        if not self.__bindings:
-            self.__bindings.append(new_binding)
-        else:
-            found = False
+        prop_bindings = self.__bindings.get(new_binding.prop)
+
+        if prop_bindings is None:
+            prop_bindings = self.__bindings[new_binding.prop] = OrderedDict()
 
-            for binding in self.__bindings:
-                if binding == new_binding:
-                    found = True
+        key = new_binding.key
 
-            if not found:
-                self.__bindings.append(new_binding)
+        if key in prop_bindings:
+            return
+
+        prop_bindings[key] = new_binding
+        self.__binding_lists.pop(new_binding.prop, None)
+
+        obj = new_binding.obj
+        self.__watch_target(key[0]).add((new_binding.prop, key))
+
+        if isinstance(obj, CBindable):
+            obj.__add_source(self)
 
 
     def remove_binding(self, old_binding):
-        """Add a binding the object's binding list."""
+        """Remove a binding from the object's binding list."""
+
+        self.__remove(old_binding.prop, old_binding.key)
+
+
+    def get_bindings(self, prop):
+        """Return the bindings in the object's binding list that match the specified property."""
+
+        bindings = self.__binding_lists.get(prop)
+
+        if bindings is None:
+            bindings = self.__binding_lists[prop] = tuple(self.__bindings[prop].values()) if prop in self.__bindings else ()
+
+        return bindings
+
+
+    def get_binding_count(self):
+        """Return the number of bindings in the object's binding list."""
+
+        return sum(len(prop_bindings) for prop_bindings in self.__bindings.values())
+
+
+    def get_binding_sources(self):
+        """Return the objects having at least one binding whose destination is this object."""
+
+        sources = []
 
-        if self.__bindings:
-            for binding in self.__bindings:
-                if binding == old_binding:
-                    self.__bindings.remove(binding)
+        for source_ref in list(self.__sources):
+            source = source_ref()
+
+            if source is None:
+                del self.__sources[source_ref]
+            else:
+                sources.append(source)
+
+        return sources
+
+
+    def is_bound(self, prop):
+        """Indicates if a binding in the object's binding list is listening to the specified property."""
+
+        return prop in self.__bindings
+
+
+    def remove_bindings_to(self, obj):
+        """Remove every binding of the object's binding list whose destination is the specified object."""
+
+        entry = self.__targets.get(weakref.ref(obj))
+
+        if entry is not None:
+            for prop, key in list(entry[1]):
+                self.__remove(prop, key)
+
+
+    def clear_bindings(self):
+        """Remove every binding from the object's binding list."""
+
+        for prop, prop_bindings in list(self.__bindings.items()):
+            for key in list(prop_bindings):
+                self.__remove(prop, key)
 
 
     def notify_property_changed(self, prop, value):
         """Notifies the bindings in the object's binding list that match the specified property and sends them the new value."""
 
-        if not self.__notified:
-            for binding in self.__bindings:
-                if binding.prop == prop:
-                    binding.update_prop(value)
+        if prop not in self.__bindings:
+            return
+
+        token = getattr(_PROPAGATION, 'token', None)
+
+        if token is not None:
+            self.__propagate(token, prop, value)
+            return
+
+        token = _PROPAGATION.token = CChangeToken(next(_GENERATIONS))
+
+        try:
+            self.__propagate(token, prop, value)
+        finally:
+            _PROPAGATION.token = None
+
+
+    def __propagate(self, token, prop, value):
+        """Send the new value of a property to its bindings as part of the cascade identified by the token."""
+
+        token.visited.add((id(self), prop))
+
+        if _PROFILER is not None:
+            _PROFILER.propagate(self, prop, value, token, self.get_bindings(prop))
+            return
+
+        for binding in self.get_bindings(prop):
+            if binding.deferred:
+                DISPATCHER.post(binding, value)
+            else:
+                binding.update_prop(value, token)
+
+
+    def dependent_properties(self, prop):
+        """Return the (object, property) pairs changed as a side effect of a change of the specified property, without going through a binding.
+        Used by trace to follow the cascade of updates. Meant to be overridden by the bindable objects having computed properties."""
+
+        return []
+
+
+    def __remove(self, prop, key):
+        """Remove the binding of a property identified by its key."""
+
+        prop_bindings = self.__bindings.get(prop)
+
+        if prop_bindings is None or key not in prop_bindings:
+            return
+
+        binding = prop_bindings.pop(key)
+        self.__binding_lists.pop(prop, None)
+
+        if not prop_bindings:
+            del self.__bindings[prop]
+
+        target_ref = key[0]
+        entry = self.__targets.get(target_ref)
+
+        if entry is not None:
+            entry[1].discard((prop, key))
 
+            if not entry[1]:
+                del self.__targets[target_ref]
 
-def bind(obj_a, obj_a_property, obj_b, obj_b_property, two_way=True):
-    """Binds a object's property to another object's property."""
+        obj = target_ref()
 
-    if is_valid_property(obj_a, obj_a_property) and is_valid_property(obj_b, obj_b_property):
-        binding_a = CBinding(obj_a, obj_a_property, obj_b_property)
+        if isinstance(obj, CBindable):
+            obj.__remove_source(self)
 
-        obj_b.add_binding(binding_a)
 
-        if two_way:
-            binding_b = CBinding(obj_b, obj_b_property, obj_a_property)
+    def __watch_target(self, target_ref):
+        """Return the set of (property, key) of the bindings whose destination is the referenced object. The first time a destination is seen,
+        a weak reference callback is set on it so its bindings are pruned as soon as it's garbage collected."""
 
-            obj_a.add_binding(binding_b)
+        entry = self.__targets.get(target_ref)
+
+        if entry is None:
+            source_ref = weakref.ref(self)
+
+            def prune(watch_ref):
+                source = source_ref()
+
+                if source is not None:
+                    source.__prune_target(target_ref)
+
+            entry = self.__targets[target_ref] = [weakref.ref(target_ref(), prune), set()]
+
+        return entry[1]
+
+
+    def __prune_target(self, target_ref):
+        """Remove every binding whose destination is the garbage collected object the reference pointed to."""
+
+        entry = self.__targets.get(target_ref)
+
+        if entry is not None:
+            for prop, key in list(entry[1]):
+                self.__remove(prop, key)
+
+
+    def __add_source(self, source):
+        """Count a new binding whose destination is this object."""
+
+        source_ref = weakref.ref(source)
+        self.__sources[source_ref] = self.__sources.get(source_ref, 0) + 1
+
+
+    def __remove_source(self, source):
+        """Uncount a binding whose destination is this object."""
+
+        source_ref = weakref.ref(source)
+        count = self.__sources.get(source_ref)
+
+        if count is not None:
+            if count > 1:
+                self.__sources[source_ref] = count - 1
+            else:
+                del self.__sources[source_ref]
+
+
+class CBindingProfiler(object):
+    """Records the binding updates while it's started : how many notifications each source property sends, how many updates each binding
+    applies and how long they take, and how far each cascade of updates fans out. The durations include the nested updates of the cascade.
+    Only one profiler records at a time. Can be used as a context manager."""
+
+    @property
+    def notifications(self):
+        """The statistics per source property, by \"Class.property\" label."""
+
+        return self.__notifications
+
+
+    @property
+    def bindings(self):
+        """The statistics per binding, by \"Class.property -> Class.property\" label."""
+
+        return self.__bindings
+
+
+    @property
+    def cascades(self):
+        """The statistics of the cascades of updates, per property having started them, by \"Class.property\" label."""
+
+        return self.__cascades
+
+
+    def __init__(self, clock=timeit.default_timer):
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__state = threading.local()
+        self.reset()
+
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+    def start(self):
+        """Start recording the binding updates, replacing the profiler currently recording."""
+
+        global _PROFILER
+
+        _PROFILER = self
+
+
+    def stop(self):
+        """Stop recording the binding updates."""
+
+        global _PROFILER
+
+        if _PROFILER is self:
+            _PROFILER = None
+
+
+    def reset(self):
+        """Drop every statistic recorded so far."""
+
+        with self.__lock:
+            self.__notifications = {}
+            self.__bindings = {}
+            self.__cascades = {}
+
+
+    def propagate(self, source, prop, value, token, bindings):
+        """Send the new value of a source property to its bindings like CBindable does, recording the notification, the updates and the cascade."""
+
+        state = self.__state
+        depth = getattr(state, 'depth', 0)
+
+        if not depth:
+            state.updates = 0
+            state.max_depth = 0
+
+        state.depth = depth + 1
+        state.max_depth = max(state.max_depth, depth + 1)
+        source_label = _class_property_label(source, prop)
+
+        with self.__lock:
+            stats = _get_stats(self.__notifications, source_label, ('count', 'bindings'))
+            stats['count'] += 1
+            stats['bindings'] += len(bindings)
+
+        try:
+            for binding in bindings:
+                label = '{} -> {}'.format(source_label, _class_property_label(binding.obj, binding.obj_prop))
+
+                if binding.deferred:
+                    DISPATCHER.post(binding, value)
+
+                    with self.__lock:
+                        _get_stats(self.__bindings, label, ('count', 'deferred', 'total', 'max'))['deferred'] += 1
+
+                    continue
+
+                state.updates += 1
+                start = self.__clock()
+                binding.update_prop(value, token)
+                duration = self.__clock() - start
+
+                with self.__lock:
+                    stats = _get_stats(self.__bindings, label, ('count', 'deferred', 'total', 'max'))
+                    stats['count'] += 1
+                    stats['total'] += duration
+                    stats['max'] = max(stats['max'], duration)
+        finally:
+            state.depth = depth
+
+        if not depth:
+            with self.__lock:
+                stats = _get_stats(self.__cascades, source_label, ('count', 'updates', 'max_updates', 'max_depth'))
+                stats['count'] += 1
+                stats['updates'] += state.updates
+                stats['max_updates'] = max(stats['max_updates'], state.updates)
+                stats['max_depth'] = max(stats['max_depth'], state.max_depth)
+
+
+    def to_dict(self):
+        """Return the recorded statistics as a dictionary of notifications, bindings and cascades."""
+
+        with self.__lock:
+            return {
+                'notifications': dict((label, dict(stats)) for label, stats in self.__notifications.items()),
+                'bindings': dict((label, dict(stats)) for label, stats in self.__bindings.items()),
+                'cascades': dict((label, dict(stats)) for label, stats in self.__cascades.items()),
+            }
+
+
+    def to_json(self, path=None):
+        """Return the recorded statistics as a JSON string, and write them to a file if a path is given."""
+
+        text = json.dumps(self.to_dict(), indent=2, sort_keys=True)
+
+        if path:
+            with open(path, 'w') as json_file:
+                json_file.write(text)
+
+        return text
+
+
+    def report(self):
+        """Return a text report of the recorded statistics, the most expensive bindings first."""
+
+        data = self.to_dict()
+        lines = ['Source properties (notifications, bindings notified)']
+
+        for label, stats in sorted(data['notifications'].items(), key=lambda item: -item[1]['count']):
+            lines.append('  {:<60} {:>8} {:>8}'.format(label, stats['count'], stats['bindings']))
+
+        lines.append('Bindings (updates, deferred, total ms, max ms)')
+
+        for label, stats in sorted(data['bindings'].items(), key=lambda item: -item[1]['total']):
+            lines.append('  {:<60} {:>8} {:>8} {:>10.3f} {:>10.3f}'.format(label, stats['count'], stats['deferred'], stats['total'] * 1000.0, stats['max'] * 1000.0))
+
+        lines.append('Cascades (count, average updates, max updates, max depth)')
+
+        for label, stats in sorted(data['cascades'].items(), key=lambda item: -item[1]['updates']):
+            lines.append('  {:<60} {:>8} {:>8.1f} {:>8} {:>8}'.format(label, stats['count'], float(stats['updates']) / stats['count'], stats['max_updates'], stats['max_depth']))
+
+        return '\n'.join(lines)
+
+
+CTraceStep = namedtuple('CTraceStep', ('depth', 'source', 'source_prop', 'target', 'target_prop', 'kind'))
+
+
+def trace(obj, prop):
+    """Dry run of the cascade of updates a change of an object's property would trigger. Walks the binding graph without setting anything and
+    returns the list of CTraceStep, in the order the updates would happen. The kind of a step is 'binding', 'deferred' (a binding going through
+    the deferred dispatcher) or 'dependency' (a property changed as a side effect, see CBindable.dependent_properties).
+    Like a real cascade, a property is only visited once."""
+
+    steps = []
+    visited = set([(id(obj), prop)])
+
+    def walk(source, source_prop, depth):
+        edges = [(dependent, dependent_prop, 'dependency') for dependent, dependent_prop in source.dependent_properties(source_prop)]
+
+        for binding in source.get_bindings(source_prop):
+            target = binding.obj
+
+            if target is not None:
+                edges.append((target, binding.obj_prop, 'deferred' if binding.deferred else 'binding'))
+
+        for target, target_prop, kind in edges:
+            key = (id(target), target_prop)
+
+            if key in visited:
+                continue
+
+            visited.add(key)
+            steps.append(CTraceStep(depth, source, source_prop, target, target_prop, kind))
+
+            if isinstance(target, CBindable):
+                walk(target, target_prop, depth + 1)
+
+    walk(obj, prop, 0)
+
+    return steps
+
+
+def format_trace(steps):
+    """Return a text tree of the steps returned by trace."""
+
+    return '\n'.join('{}{}.{} -> {}.{} ({})'.format('  ' * step.depth, describe(step.source), step.source_prop, describe(step.target), step.target_prop, step.kind) for step in steps)
+
+
+def describe(obj):
+    """Return a short description of an object for the profiler's and trace's output : its class name, followed by its name if it has one."""
+
+    name = getattr(obj, 'name', None)
+
+    if isinstance(name, basestring):
+        return '{}({})'.format(obj.__class__.__name__, name)
+
+    return obj.__class__.__name__
+
+
+def _class_property_label(obj, prop):
+    """Return the \"Class.property\" label used to aggregate the profiler's statistics."""
+
+    return '{}.{}'.format(obj.__class__.__name__ if obj is not None else 'None', prop)
+
+
+def _get_stats(stats_by_label, label, counters):
+    """Return the statistics of a label, created with every counter at 0 the first time."""
+
+    stats = stats_by_label.get(label)
+
+    if stats is None:
+        stats = stats_by_label[label] = dict.fromkeys(counters, 0)
+
+    return stats
+
+
+def bind(obj_a, obj_a_property, obj_b, obj_b_property, two_way=True, deferred=False, converter=None):
+    """Binds a object's property to another object's property. Raises an AttributeError if one of the properties isn't valid.
+    When deferred is True, the updates flowing from obj_b to obj_a go through the deferred dispatcher (DISPATCHER).
+    The converter (a CConverter) converts the values flowing from obj_b to obj_a with convert and from obj_a to obj_b with convert_back."""
+
+    get_property(obj_a.__class__, obj_a_property)
+    get_property(obj_b.__class__, obj_b_property)
+
+    binding_a = CBinding(obj_a, obj_a_property, obj_b_property, deferred, converter.convert if converter else None)
+
+    obj_b.add_binding(binding_a)
+
+    if two_way:
+        binding_b = CBinding(obj_b, obj_b_property, obj_a_property, convert=converter.convert_back if converter else None)
+
+        obj_a.add_binding(binding_b)
 
 
 def unbind(obj_a, obj_a_property, obj_b, obj_b_property, two_way=True):
-    """Unbinds a object's property from another object's property."""
+    """Unbinds a object's property from another object's property. Raises an AttributeError if one of the properties isn't valid."""
+
+    get_property(obj_a.__class__, obj_a_property)
+    get_property(obj_b.__class__, obj_b_property)
+
+    binding_a = CBinding(obj_a, obj_a_property, obj_b_property)
 
-    if is_valid_property(obj_a, obj_a_property) and is_valid_property(obj_b, obj_b_property):
-        binding_a = CBinding(obj_a, obj_a_property, obj_b_property)
+    obj_b.remove_binding(binding_a)
 
-        obj_b.remove_binding(binding_a)
+    if two_way:
+        binding_b = CBinding(obj_b, obj_b_property, obj_a_property)
 
-        if two_way:
-            binding_b = CBinding(obj_b, obj_b_property, obj_a_property)
+        obj_a.remove_binding(binding_b)
 
-            obj_a.remove_binding(binding_b)
+
+def unbind_all(obj):
+    """Removes every binding from and to an object."""
+
+    for source in obj.get_binding_sources():
+        source.remove_bindings_to(obj)
+
+    obj.clear_bindings()
 
 
 def is_valid_property(obj, prop):
     """Checks if a property on a object is valid/exists."""
 
-    obj_type = type(obj)
+    try:
+        get_property(obj.__class__, prop)
+    except AttributeError:
+        return False
+
+    return True
+
 
-    if prop not in obj_type.__dict__:
-        print '{!r} is not an attribute of class {}'.format(prop, obj_type.__name__)
+def get_property(obj_class, prop):
+    """Return the property descriptor of a class by name, looked up through the whole class hierarchy (MRO). The descriptor is resolved once per
+    class and name and cached. Raises an AttributeError if the class has no such property."""
 
-        return False
+    key = (obj_class, prop)
+    descriptor = _PROPERTIES.get(key)
+
+    if descriptor is not None:
+        return descriptor
+
+    for cls in inspect.getmro(obj_class):
+        if prop in cls.__dict__:
+            descriptor = cls.__dict__[prop]
+            break
     else:
-        prop = obj_type.__dict__[prop]
+        raise AttributeError('{!r} is not an attribute of class {}'.format(prop, obj_class.__name__))
 
-        if not isinstance(prop, property):
-            print '{!r} is not a property of class {}'.format(prop, obj_type.__name__)
+    if not isinstance(descriptor, property):
+        raise AttributeError('{!r} is not a property of class {}'.format(prop, obj_class.__name__))
 
-            return False
+    _PROPERTIES[key] = descriptor
 
-    return True
+    return descriptor
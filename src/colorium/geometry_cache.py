@@ -0,0 +1,137 @@
+"""Module containing the chunked geometry cache publishing. A long frame range is split in chunks, each chunk is cached by a worker process
+in parallel, and a JSON index ties the per-chunk caches into one logical cache.
+
+By default, each worker evaluates its chunk from the chunk's first frame, which is only right for geometry whose evaluation doesn't depend
+on the previous frames (animation, most deformers). With a run-up, each worker first evaluates the frames from the start of the range to its chunk,
+so simulations and history dependent deformers give the same result as a cache made in one piece. The last worker then evaluates almost the whole
+range : the run-up only spreads the writing of the cache over the workers, not the evaluation."""
+
+import json
+import os
+import colorium.worker_pool as worker_pool
+
+
+# The worker handler caching a chunk, see colorium.worker.cache_geometry_chunk.
+CHUNK_COMMAND = {"action": "publish", "name": "Geometry Cache Chunk"}
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = "_chunks.json"
+
+
+def split_frame_range(start_frame, end_frame, chunk_size):
+    """Split an inclusive frame range in consecutive inclusive (start, end) chunks of chunk_size frames. The last chunk may be shorter."""
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1 frame.")
+
+    start_frame = int(round(start_frame))
+    end_frame = int(round(end_frame))
+    chunks = []
+
+    while start_frame <= end_frame:
+        chunk_end = min(start_frame + chunk_size - 1, end_frame)
+        chunks.append((start_frame, chunk_end))
+        start_frame = chunk_end + 1
+
+    return chunks
+
+
+def get_chunk_file_name(file_name, index):
+    """Return the file name of a chunk's cache."""
+
+    return "{}_chunk{:03d}".format(file_name, index)
+
+
+def get_index_path(path, file_name):
+    """Return the path of the index of a chunked cache."""
+
+    return os.path.join(path, file_name + INDEX_SUFFIX)
+
+
+def plan_chunk_jobs(description, scene, shapes, start_frame, end_frame, chunk_size, run_up=False):
+    """Return the worker jobs caching the shapes of a scene over a frame range, one per chunk. The description is the publish configuration's
+    description (see CConfiguration.to_description). With run_up, each job evaluates the frames from the start of the range to its chunk first."""
+
+    jobs = []
+
+    for index, frame_range in enumerate(split_frame_range(start_frame, end_frame, chunk_size)):
+        config = dict(description, command=CHUNK_COMMAND, file_name=get_chunk_file_name(description["file_name"], index))
+        job = {"scene": scene, "nodes": list(shapes), "config": config, "frame_range": list(frame_range)}
+
+        if run_up and index:
+            job["run_up_start"] = jobs[0]["frame_range"][0]
+
+        jobs.append(job)
+
+    return jobs
+
+
+def write_index(path, file_name, jobs):
+    """Write the index of a chunked cache : the frame range, and the frame range and cache descriptor (XML) of every chunk. Returns its path."""
+
+    chunks = [{"start": job["frame_range"][0], "end": job["frame_range"][1], "xml": job["config"]["file_name"] + ".xml"} for job in jobs]
+    index = {
+        "version": INDEX_VERSION,
+        "name": file_name,
+        "start": chunks[0]["start"],
+        "end": chunks[-1]["end"],
+        "chunks": chunks,
+    }
+    index_path = get_index_path(path, file_name)
+
+    with open(index_path, "w") as index_file:
+        json.dump(index, index_file, indent=2, sort_keys=True)
+
+    return index_path
+
+
+def read_index(index_path):
+    """Read the index of a chunked cache."""
+
+    with open(index_path) as index_file:
+        return json.load(index_file)
+
+
+def find_chunk(index, frame):
+    """Return the chunk of an index containing the frame, or None if the frame is out of the cache's range."""
+
+    for chunk in index["chunks"]:
+        if chunk["start"] <= frame <= chunk["end"]:
+            return chunk
+
+    return None
+
+
+def publish_chunked(cmds, config, shapes, start_frame, end_frame, chunk_size, pool=None, run_up=False):
+    """Cache the shapes over the frame range in chunks cached in parallel by the worker pool, from a snapshot of the current scene, then write
+    the index of the chunks. Waits for every chunk. Raises a CWorkerError listing the chunks that failed. Returns the index's path.
+    The config must be an asset's CConfiguration, a TypeError is raised otherwise. The snapshot is deleted once the chunks are done."""
+
+    if not hasattr(config, "to_description"):
+        raise TypeError("The chunked geometry cache can only publish an asset's configuration, not a {}.".format(type(config).__name__))
+
+    description = config.to_description()
+    pool = pool or worker_pool.get_pool()
+    scene = worker_pool.save_snapshot(cmds)
+    futures = []
+
+    try:
+        jobs = plan_chunk_jobs(description, scene, shapes, start_frame, end_frame, chunk_size, run_up)
+
+        for job in jobs:
+            futures.append(pool.submit(job))
+    finally:
+        worker_pool.remove_snapshot_when_done(scene, futures)
+
+    errors = []
+
+    for job, future in zip(jobs, futures):
+        try:
+            future.wait()
+        except worker_pool.CWorkerError as error:
+            errors.append("frames {}-{} : {}".format(job["frame_range"][0], job["frame_range"][1], error))
+
+    if errors:
+        raise worker_pool.CWorkerError("Some chunks of the geometry cache failed :\n" + "\n".join(errors))
+
+    return write_index(config.path, config.file_name, jobs)
@@ -0,0 +1,483 @@
+"""Module containing a pure Python reader of the Maya geometry caches (the XML descriptor and the .mcc/.mcx IFF data files), used to check
+published caches without Maya. The data files are memory-mapped and the points of a frame are exposed as zero-copy NumPy views, so only the
+frames actually read are loaded in memory. NumPy is only required to read the points.
+
+The data files are big-endian IFF files. A .mcc file uses FOR4 groups with 32-bit sizes and 4-byte alignment, a .mcx file uses FOR8 groups
+with 64-bit sizes and 8-byte alignment. A file starts with a CACH group (VRSN, STIM, ETIM) followed by a MYCH group per sample (TIME, then
+CHNM, SIZE and a data chunk per channel : FVCA/DVCA for float/double vector arrays, FBCA/DBLA for float/double arrays)."""
+
+from collections import namedtuple
+import glob
+import mmap
+import os
+import re
+import struct
+import xml.etree.ElementTree as ElementTree
+
+
+# Maya's time unit : ticks per second.
+TICKS_PER_SECOND = 6000
+
+# The NumPy type and the number of components of the data chunks, by tag.
+DATA_TYPES = {
+    b"FVCA": (">f4", 3),
+    b"DVCA": (">f8", 3),
+    b"FBCA": (">f4", 1),
+    b"DBLA": (">f8", 1),
+}
+
+
+def _numpy():
+    """Import NumPy on first use. NumPy is an optional dependency only required to read the points."""
+
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required to read the points of a geometry cache.")
+
+    return numpy
+
+
+class CCacheError(Exception):
+    """Error raised when a geometry cache is invalid."""
+
+    pass
+
+
+CChannelDescription = namedtuple("CChannelDescription", ("name", "type", "interpretation", "sampling_type", "sampling_rate", "start_time", "end_time"))
+
+CChannelData = namedtuple("CChannelData", ("tag", "count", "offset"))
+
+
+class CCacheDescription(namedtuple("CCacheDescription", ("cache_type", "format", "start_time", "end_time", "time_per_frame", "channels"))):
+    """Description of a geometry cache read from its XML descriptor. The times are in ticks."""
+
+    __slots__ = ()
+
+    @property
+    def start_frame(self):
+        """The first frame of the cache."""
+
+        return float(self.start_time) / self.time_per_frame
+
+
+    @property
+    def end_frame(self):
+        """The last frame of the cache."""
+
+        return float(self.end_time) / self.time_per_frame
+
+
+def read_description(xml_path):
+    """Read the XML descriptor of a geometry cache."""
+
+    root = ElementTree.parse(xml_path).getroot()
+    cache_type = root.find("cacheType")
+    time_range = root.find("time")
+    time_per_frame = root.find("cacheTimePerFrame")
+
+    if cache_type is None or time_range is None or time_per_frame is None:
+        raise CCacheError("'{}' isn't a Maya geometry cache descriptor.".format(xml_path))
+
+    start_time, end_time = [int(time) for time in time_range.get("Range").split("-")]
+    channels = []
+    channels_element = root.find("Channels")
+
+    for channel in (channels_element if channels_element is not None else []):
+        channels.append(CChannelDescription(
+            channel.get("ChannelName"),
+            channel.get("ChannelType"),
+            channel.get("ChannelInterpretation"),
+            channel.get("SamplingType"),
+            int(channel.get("SamplingRate", 0)),
+            int(channel.get("StartTime", start_time)),
+            int(channel.get("EndTime", end_time)),
+        ))
+
+    return CCacheDescription(cache_type.get("Type"), cache_type.get("Format", "mcc"), start_time, end_time, int(time_per_frame.get("TimePerFrame")), channels)
+
+
+class CCacheDataFile(object):
+    """Memory-mapped .mcc/.mcx data file. Opening the file only indexes the chunks, the points are read on demand."""
+
+    @property
+    def path(self):
+        """The path of the data file."""
+
+        return self.__path
+
+
+    @property
+    def start_time(self):
+        """The start time of the file in ticks (STIM)."""
+
+        return self.__start_time
+
+
+    @property
+    def end_time(self):
+        """The end time of the file in ticks (ETIM)."""
+
+        return self.__end_time
+
+
+    @property
+    def times(self):
+        """The times of the samples of the file in ticks, sorted."""
+
+        return sorted(self.__samples)
+
+
+    def __init__(self, path):
+        self.__path = path
+        self.__data = None
+        self.__start_time = None
+        self.__end_time = None
+        self.__samples = {}
+
+        # The memory map keeps its own handle on the file, so the file is closed right away.
+        with open(path, "rb") as data_file:
+            # An empty file can't be memory-mapped.
+            if not os.fstat(data_file.fileno()).st_size:
+                raise CCacheError("'{}' is empty.".format(path))
+
+            self.__data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.__index()
+        except Exception:
+            self.close()
+            raise
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def close(self):
+        """Release the memory map. The point views returned before stay valid : they hold a reference to the memory map,
+        which is unmapped once the last of them is garbage collected."""
+
+        self.__data = None
+
+
+    def has_time(self, time):
+        """Indicates if the file has a sample at a time in ticks."""
+
+        return time in self.__samples
+
+
+    def get_channel_data(self, time, channel):
+        """Return the CChannelData (tag, count and offset) of a channel's sample. Raises a KeyError if the sample doesn't exist."""
+
+        return self.__samples[time][channel]
+
+
+    def get_channels(self, time):
+        """Return the names of the channels sampled at a time."""
+
+        return list(self.__samples[time])
+
+
+    def get_points(self, time, channel):
+        """Return the points of a channel's sample as a read-only NumPy view on the memory-mapped file, without copying them.
+        Vector arrays are (count, 3) arrays, the other arrays are (count,) arrays. The values are big-endian."""
+
+        if self.__data is None:
+            raise CCacheError("'{}' is closed.".format(self.__path))
+
+        numpy = _numpy()
+        channel_data = self.get_channel_data(time, channel)
+        dtype, components = DATA_TYPES[channel_data.tag]
+        points = numpy.frombuffer(self.__data, dtype=dtype, count=channel_data.count * components, offset=channel_data.offset)
+
+        return points.reshape(channel_data.count, components) if components > 1 else points
+
+
+    def __index(self):
+        """Index the samples and the channels' data chunks of the file."""
+
+        data = self.__data
+        layout = _detect_layout(data, self.__path)
+        offset = 0
+
+        while offset < len(data):
+            tag, size, body = _read_chunk_header(data, offset, layout)
+            end = body + size
+
+            if tag not in (b"FOR4", b"FOR8") or end > len(data):
+                raise CCacheError("'{}' has an invalid group at offset {}.".format(self.__path, offset))
+
+            form_type = data[body:body + 4]
+            children = body + layout.form_type_size
+
+            if form_type == b"CACH":
+                self.__index_header(children, end, layout)
+            elif form_type == b"MYCH":
+                self.__index_sample(children, end, layout)
+
+            offset = _align(end, layout.alignment)
+
+
+    def __index_header(self, offset, end, layout):
+        """Read the start and end times of the file."""
+
+        for tag, size, body in _iter_chunks(self.__data, offset, end, layout):
+            if tag == b"STIM":
+                self.__start_time = struct.unpack(">i", self.__data[body:body + 4])[0]
+            elif tag == b"ETIM":
+                self.__end_time = struct.unpack(">i", self.__data[body:body + 4])[0]
+
+
+    def __index_sample(self, offset, end, layout):
+        """Index the channels' data chunks of a sample."""
+
+        time = None
+        channel = None
+        count = None
+        channels = {}
+
+        for tag, size, body in _iter_chunks(self.__data, offset, end, layout):
+            if tag == b"TIME":
+                time = struct.unpack(">i", self.__data[body:body + 4])[0]
+            elif tag == b"CHNM":
+                channel = self.__data[body:body + size].split(b"\0", 1)[0].decode("utf-8")
+            elif tag == b"SIZE":
+                count = struct.unpack(">I", self.__data[body:body + 4])[0]
+            elif tag in DATA_TYPES:
+                dtype, components = DATA_TYPES[tag]
+
+                if count is None or count * components * int(dtype[-1]) > size:
+                    raise CCacheError("'{}' has an invalid {} chunk for the channel '{}'.".format(self.__path, tag.decode("ascii"), channel))
+
+                channels[channel] = CChannelData(tag, count, body)
+
+        if time is None:
+            time = self.__start_time or 0
+
+        self.__samples[time] = channels
+
+
+_CIffLayout = namedtuple("_CIffLayout", ("tag_size", "size_size", "size_format", "form_type_size", "alignment"))
+
+
+def _detect_layout(data, path):
+    """Return the layout of the chunks of a data file, detected from its first group. The 64-bit files align everything on 8 bytes,
+    so the tags may be padded : the position of the CACH form type and of the first chunk tells which fields are."""
+
+    tag = data[0:4]
+
+    if tag == b"FOR4":
+        return _CIffLayout(4, 4, ">I", 4, 4)
+
+    if tag != b"FOR8":
+        raise CCacheError("'{}' isn't a Maya cache data file.".format(path))
+
+    tag_size = 8 if data[16:20] == b"CACH" else 4
+    form_type_start = tag_size + 8
+    form_type_size = 8 if data[form_type_start + 4:form_type_start + 8] == b"\0\0\0\0" else 4
+
+    return _CIffLayout(tag_size, 8, ">Q", form_type_size, 8)
+
+
+def _read_chunk_header(data, offset, layout):
+    """Return the tag, the size and the offset of the body of the chunk at an offset."""
+
+    size_offset = offset + layout.tag_size
+    size = struct.unpack(layout.size_format, data[size_offset:size_offset + layout.size_size])[0]
+
+    return data[offset:offset + 4], size, size_offset + layout.size_size
+
+
+def _iter_chunks(data, offset, end, layout):
+    """Yield the tag, the size and the offset of the body of the chunks between two offsets."""
+
+    while offset < end:
+        tag, size, body = _read_chunk_header(data, offset, layout)
+
+        if body + size > end:
+            raise CCacheError("The chunk {!r} at offset {} overflows its group.".format(tag, offset))
+
+        yield tag, size, body
+
+        offset = _align(body + size, layout.alignment)
+
+
+def _align(offset, alignment):
+    """Round an offset up to the alignment."""
+
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class CGeometryCache(object):
+    """Geometry cache opened from its XML descriptor. The data files are opened on demand, from the same folder as the descriptor."""
+
+    @property
+    def description(self):
+        """The CCacheDescription read from the XML descriptor."""
+
+        return self.__description
+
+
+    @property
+    def channels(self):
+        """The names of the channels of the cache."""
+
+        return [channel.name for channel in self.__description.channels]
+
+
+    def __init__(self, xml_path):
+        self.__xml_path = xml_path
+        self.__description = read_description(xml_path)
+        self.__base_path = os.path.splitext(xml_path)[0]
+        self.__files = {}
+        self.__times = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def close(self):
+        """Close the data files."""
+
+        for data_file in self.__files.values():
+            data_file.close()
+
+        self.__files.clear()
+
+
+    def get_times(self):
+        """Return the times of the samples of the cache in ticks, sorted."""
+
+        if self.__times is None:
+            self.__times = sorted(time for data_file in self.__get_data_files() for time in data_file.times)
+
+        return self.__times
+
+
+    def get_frames(self):
+        """Return the frames of the samples of the cache, sorted."""
+
+        time_per_frame = float(self.__description.time_per_frame)
+
+        return [time / time_per_frame for time in self.get_times()]
+
+
+    def get_points(self, frame, channel=None):
+        """Return the points of a channel (the first channel by default) at a frame as a zero-copy NumPy view. Raises a KeyError if the frame
+        isn't cached."""
+
+        time = int(round(frame * self.__description.time_per_frame))
+        channel = channel or self.channels[0]
+
+        for data_file in self.__get_data_files():
+            if data_file.has_time(time):
+                return data_file.get_points(time, channel)
+
+        raise KeyError("The frame {} isn't cached.".format(frame))
+
+
+    def iter_points(self, channel=None):
+        """Yield every frame of the cache with the points of a channel (the first channel by default)."""
+
+        for frame in self.get_frames():
+            yield frame, self.get_points(frame, channel)
+
+
+    def __get_data_files(self):
+        """Open the data files of the cache : a single file, or one file per frame."""
+
+        if not self.__files:
+            extension = "." + self.__description.format
+
+            if self.__description.cache_type == "OneFilePerFrame":
+                paths = glob.glob(self.__base_path + "Frame*" + extension)
+            else:
+                paths = [self.__base_path + extension]
+
+            for path in paths:
+                self.__files[path] = CCacheDataFile(path)
+
+        return [self.__files[path] for path in sorted(self.__files, key=_natural_key)]
+
+
+def _natural_key(path):
+    """Sort key ordering the per-frame files by frame number."""
+
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)]
+
+
+def check_frame_count(cache, expected_start_frame=None, expected_end_frame=None):
+    """Return the list of the frames missing from a cache between the expected start and end frames (the descriptor's range by default)."""
+
+    description = cache.description
+    start_frame = int(round(expected_start_frame if expected_start_frame is not None else description.start_frame))
+    end_frame = int(round(expected_end_frame if expected_end_frame is not None else description.end_frame))
+    cached_frames = set(int(round(frame)) for frame in cache.get_frames())
+
+    return [frame for frame in range(start_frame, end_frame + 1) if frame not in cached_frames]
+
+
+def find_nan_frames(cache, channel=None):
+    """Return the frames where a channel has NaN or infinite values."""
+
+    numpy = _numpy()
+
+    return [frame for frame, points in cache.iter_points(channel) if not numpy.isfinite(points).all()]
+
+
+def bounding_box(points):
+    """Return the (minimum, maximum) corners of the bounding box of points, ignoring the NaN values."""
+
+    numpy = _numpy()
+
+    return numpy.nanmin(points, axis=0), numpy.nanmax(points, axis=0)
+
+
+def cache_bounding_box(cache, channel=None):
+    """Return the (minimum, maximum) corners of the bounding box of a channel over every frame of a cache."""
+
+    numpy = _numpy()
+    minimum = maximum = None
+
+    for frame, points in cache.iter_points(channel):
+        frame_minimum, frame_maximum = bounding_box(points)
+        minimum = frame_minimum if minimum is None else numpy.minimum(minimum, frame_minimum)
+        maximum = frame_maximum if maximum is None else numpy.maximum(maximum, frame_maximum)
+
+    return minimum, maximum
+
+
+def find_exploded_points(cache, threshold, channel=None):
+    """Return the (frame, number of points) of the frames where points moved farther than the threshold since the previous frame."""
+
+    numpy = _numpy()
+    exploded = []
+    previous = None
+
+    for frame, points in cache.iter_points(channel):
+        points = points.astype(float)
+
+        if previous is not None and previous.shape == points.shape:
+            offsets = points - previous
+
+            # The NaN offsets compare as False, find_nan_frames reports them.
+            with numpy.errstate(invalid="ignore"):
+                distances = numpy.sqrt((offsets ** 2).sum(axis=-1)) if offsets.ndim > 1 else numpy.abs(offsets)
+                count = int((distances > threshold).sum())
+
+            if count:
+                exploded.append((frame, count))
+
+        previous = points
+
+    return exploded
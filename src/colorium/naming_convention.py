@@ -1,21 +1,87 @@
 """Module used to validates the name of a file based on Colorium's naming convention."""
 
 import re as regex
+from collections import namedtuple
 import colorium.asset_type_definition as asset_type_definition
+import colorium.cache as cache
+
+
+# The last segment of the file name of each target.
+FILE_NAME_SUFFIXES = {
+    "save": "v{version:03d}",
+    "publish": "publish",
+    "export": "export",
+}
+
+# The targets whose path contains a folder per scene, shot, name and variant.
+NESTED_PATH_TARGETS = ("save", "export")
+
+# The asset fields read by the file name and path generators. Used as the keys of the generators' caches.
+FILE_NAME_FIELDS = ("type", "name", "has_variant", "variant", "has_scene", "scene", "has_shot", "shot")
+SAVED_FILE_NAME_FIELDS = FILE_NAME_FIELDS + ("version",)
+NESTED_PATH_FIELDS = ("type", "name", "has_variant", "variant", "has_scene", "scene", "has_shot", "shot")
+FLAT_PATH_FIELDS = ("type",)
+
+# The compiled templates, by target and combination of asset variables.
+_FILE_NAME_TEMPLATES = {}
+_PATH_TEMPLATES = {}
+
+
+class CParsedName(namedtuple("CParsedName", ["type", "name", "variant", "scene", "shot", "version"])):
+    """Variables parsed out of a file name. A variable that isn't part of the file name is None."""
+
+    __slots__ = ()
+
+    @property
+    def has_variant(self):
+        """Indicates if the file name has a variant."""
+
+        return self.variant is not None
+
+
+    @property
+    def has_scene(self):
+        """Indicates if the file name has a scene."""
+
+        return self.scene is not None
+
+
+    @property
+    def has_shot(self):
+        """Indicates if the file name has a shot."""
+
+        return self.shot is not None
+
+
+    @property
+    def has_version(self):
+        """Indicates if the file name has a version."""
+
+        return self.version is not None
 
 
 class CNamingConvention:
     """Validates the name of a file based on a naming convention's rules."""
 
-    type_pattern = r"/\b([a-z]{3})\b/gi"
-    name_pattern = r'/\b([a-z]{4,})\b/gi'
+    # Only used by the search_*_in_name methods. parse_name and parse_names only use file_name_pattern.
     variant_pattern = r"(?<=_)\d{2}(?=_)" #/\b([0-9]{2})\b/g
     scene_pattern = r"(?<=_)\d{3}(?=-)" #/\b([0-9]{3})\b/g
     shot_pattern = r"(?<=-)\d{3}(?=_)" #/\b([0-9]{3})\b/g
     version_pattern = r"(?<=_)v\d{3}(?=.)" #/\b(v[0-9]{3})\b/gi
 
+    # Matches every variable of a file name in a single pass. The groups are named after the CParsedName fields.
+    file_name_pattern = r"""
+        ^(?P<type>[^_]+)
+        _(?P<name>[^_.]+)
+        (?:_(?P<variant>\d{2})(?=[_.]|$))?
+        (?:_(?P<scene>\d{3})(?:-(?P<shot>\d{3}))?(?=[_.]|$))?
+        (?:_v(?P<version>\d{3})(?=[_.]|$))?
+    """
+
+
+    def __init__(self, variant_pattern="", scene_pattern="", shot_pattern="", version_pattern="", file_name_pattern=""):
+        """The per-field patterns only affect the search_*_in_name methods. Parsing is controlled by file_name_pattern alone."""
 
-    def __init__(self, variant_pattern="", scene_pattern="", shot_pattern="", version_pattern=""):
         if variant_pattern != "":
             self.variant_pattern = variant_pattern
 
@@ -28,6 +94,39 @@ class CNamingConvention:
         if version_pattern != "":
             self.version_pattern = version_pattern
 
+        if file_name_pattern != "":
+            self.file_name_pattern = file_name_pattern
+
+        self._file_name_regex = regex.compile(self.file_name_pattern, regex.VERBOSE)
+
+
+    def parse_name(self, name):
+        """Parse every variable out of the name in a single pass. Returns a CParsedName or None if the name doesn't follow the naming convention."""
+
+        result = self._file_name_regex.match(name)
+
+        if result is None:
+            return None
+
+        asset_type, asset_name, variant, scene, shot, version = result.group("type", "name", "variant", "scene", "shot", "version")
+
+        return CParsedName(
+            asset_type,
+            asset_name,
+            int(variant) if variant is not None else None,
+            int(scene) if scene is not None else None,
+            int(shot) if shot is not None else None,
+            int(version) if version is not None else None
+        )
+
+
+    def parse_names(self, names):
+        """Parse a list of file names or file paths. Returns a list of CParsedName, with None for every name that doesn't follow the naming convention."""
+
+        parse_name = self.parse_name
+
+        return [parse_name(file_name_from_path(name)) for name in names]
+
 
     def search_type_in_name(self, name):
         """Search the name for the type variable."""
@@ -95,169 +194,175 @@ class CNamingConvention:
         return None
 
 
-def generate_file_name_for_saved_asset(asset_data):
-    """Generate the file name of an asset that's going to be saved."""
+def file_name_from_path(path):
+    """Return the file name at the end of a file path. Both slashes and backslashes are handled as separators."""
 
-    asset_type = asset_type_definition.get_type_by_code(asset_data.type)
+    path = path.strip()
 
-    if asset_type == asset_type_definition.NONE_TYPE:
-        asset_type = asset_type_definition.get_type_by_name(asset_data.type)
+    return path[max(path.rfind("/"), path.rfind("\\")) + 1:]
 
-    template = "{type}_{name}_"
 
-    if asset_data.has_variant:
-        template += "{variant:02d}_"
+def parse_names_chunk(chunk):
+    """Parse a (naming convention, names) chunk. Used by the worker processes of the bulk parser."""
 
-    if asset_data.has_scene and asset_data.has_shot:
-        template += "{scene:03d}-{shot:03d}_"
-    elif asset_data.has_scene:
-        template += "{scene:03d}_"
+    naming_convention, names = chunk
 
-    template += "v{version:03d}"
+    return naming_convention.parse_names(names)
 
-    return template.format(
-        type=asset_type.code,
-        name=asset_data.name,
-        variant=asset_data.variant,
-        scene=asset_data.scene,
-        shot=asset_data.shot,
-        version=asset_data.version
-    ).replace("__", "_")
 
+def get_file_name_template(target, has_name, has_variant, has_scene, has_shot):
+    """Return the compiled file name formatter of a target (save, publish or export) for a combination of asset variables.
+    The formatter is built the first time the combination is requested and reused afterward."""
 
-def generate_file_name_for_published_asset(asset_data):
-    """Generate the file name of an asset that's going to be published."""
+    key = (target, has_name, has_variant, has_scene, has_shot)
 
-    asset_type = asset_type_definition.get_type_by_code(asset_data.type)
+    if key in _FILE_NAME_TEMPLATES:
+        return _FILE_NAME_TEMPLATES[key]
 
-    if asset_type == asset_type_definition.NONE_TYPE:
-        asset_type = asset_type_definition.get_type_by_name(asset_data.type)
+    segments = ["{type}"]
 
-    template = "{type}_{name}_"
+    if has_name:
+        segments.append("{name}")
 
-    if asset_data.has_variant:
-        template += "{variant:02d}_"
+    if has_variant:
+        segments.append("{variant:02d}")
 
-    if asset_data.has_scene and asset_data.has_shot:
-        template += "{scene:03d}-{shot:03d}_"
-    elif asset_data.has_scene:
-        template += "{scene:03d}_"
+    if has_scene and has_shot:
+        segments.append("{scene:03d}-{shot:03d}")
+    elif has_scene:
+        segments.append("{scene:03d}")
 
-    template += "publish"
+    segments.append(FILE_NAME_SUFFIXES[target])
 
-    return template.format(
-        type=asset_type.code,
-        name=asset_data.name,
-        variant=asset_data.variant,
-        scene=asset_data.scene,
-        shot=asset_data.shot
-    ).replace("__", "_")
+    template = _FILE_NAME_TEMPLATES[key] = "_".join(segments).format
 
+    return template
 
-def generate_file_name_for_exported_asset(asset_data):
-    """Generate the file name of an asset that's going to be exported."""
 
-    asset_type = asset_type_definition.get_type_by_code(asset_data.type)
+def get_path_template(target, has_name, has_variant, has_scene, has_shot):
+    """Return the compiled path formatter of a target (save, publish or export) for a combination of asset variables.
+    The formatter is built the first time the combination is requested and reused afterward."""
 
-    if asset_type == asset_type_definition.NONE_TYPE:
-        asset_type = asset_type_definition.get_type_by_name(asset_data.type)
+    key = (target, has_name, has_variant, has_scene, has_shot)
 
-    template = "{type}_{name}_"
+    if key in _PATH_TEMPLATES:
+        return _PATH_TEMPLATES[key]
 
-    if asset_data.has_variant:
-        template += "{variant:02d}_"
+    segments = ["{directory}"]
 
-    if asset_data.has_scene and asset_data.has_shot:
-        template += "{scene:03d}-{shot:03d}_"
-    elif asset_data.has_scene:
-        template += "{scene:03d}_"
+    if target in NESTED_PATH_TARGETS:
+        if has_scene and has_shot:
+            segments.append("{scene:03d}/{shot:03d}")
+        elif has_scene:
+            segments.append("{scene:03d}")
 
-    template += "export"
+        if has_name:
+            segments.append("{name}")
 
-    return template.format(
-        type=asset_type.code,
-        name=asset_data.name,
-        variant=asset_data.variant,
-        scene=asset_data.scene,
-        shot=asset_data.shot
-    ).replace("__", "_")
+        if has_variant:
+            segments.append("{variant:02d}")
 
+    segments.append("")
 
-def generate_path_for_saved_asset(asset_data):
-    """Generate the file path of an asset that's going to be saved."""
+    template = _PATH_TEMPLATES[key] = "/".join(segments).format
 
-    asset_type = asset_type_definition.get_type_by_code(asset_data.type)
+    return template
 
-    if asset_type == asset_type_definition.NONE_TYPE:
-        asset_type = asset_type_definition.get_type_by_name(asset_data.type)
 
-    template = "{saveDir}/"
+@cache.memoize(SAVED_FILE_NAME_FIELDS)
+def generate_file_name_for_saved_asset(asset_data):
+    """Generate the file name of an asset that's going to be saved."""
 
-    if asset_data.has_scene and asset_data.has_shot:
-        template += "{scene:03d}/{shot:03d}/"
-    elif asset_data.has_scene:
-        template += "{scene:03d}/"
+    return _generate_file_name("save", asset_data)
 
-    template += "{name}/"
 
-    if asset_data.has_variant:
-        template += "{variant:02d}/"
+@cache.memoize(FILE_NAME_FIELDS)
+def generate_file_name_for_published_asset(asset_data):
+    """Generate the file name of an asset that's going to be published."""
 
-    return template.format(
-        saveDir=asset_type.save_dir,
-        type=asset_type.code,
-        scene=asset_data.scene,
-        shot=asset_data.shot,
-        name=asset_data.name,
-        variant=asset_data.variant
-    ).replace("//", "/")
+    return _generate_file_name("publish", asset_data)
 
 
-def generate_path_for_published_asset(asset_data):
-    """Generate the file path of an asset that's going to be published."""
+@cache.memoize(FILE_NAME_FIELDS)
+def generate_file_name_for_exported_asset(asset_data):
+    """Generate the file name of an asset that's going to be exported."""
 
-    asset_type = asset_type_definition.get_type_by_code(asset_data.type)
+    return _generate_file_name("export", asset_data)
 
-    if asset_type == asset_type_definition.NONE_TYPE:
-        asset_type = asset_type_definition.get_type_by_name(asset_data.type)
 
-    template = "{publishDir}/"
+@cache.memoize(NESTED_PATH_FIELDS)
+def generate_path_for_saved_asset(asset_data):
+    """Generate the file path of an asset that's going to be saved."""
 
-    return template.format(
-        publishDir=asset_type.publish_dir,
-        type=asset_type.code,
-        scene=asset_data.scene,
-        shot=asset_data.shot,
-        name=asset_data.name,
-        variant=asset_data.variant
-    ).replace("//", "/")
+    asset_type = asset_type_definition.get_type(asset_data.type)
 
+    return _generate_path("save", asset_data, asset_type.save_dir)
 
+
+@cache.memoize(FLAT_PATH_FIELDS)
+def generate_path_for_published_asset(asset_data):
+    """Generate the file path of an asset that's going to be published."""
+
+    asset_type = asset_type_definition.get_type(asset_data.type)
+
+    return _generate_path("publish", asset_data, asset_type.publish_dir)
+
+
+@cache.memoize(NESTED_PATH_FIELDS)
 def generate_path_for_exported_asset(asset_data):
     """Generate the file path of an asset that's going to be exported."""
 
-    asset_type = asset_type_definition.get_type_by_code(asset_data.type)
+    asset_type = asset_type_definition.get_type(asset_data.type)
+
+    return _generate_path("export", asset_data, asset_type.export_dir)
+
+
+GENERATORS = (
+    generate_file_name_for_saved_asset,
+    generate_file_name_for_published_asset,
+    generate_file_name_for_exported_asset,
+    generate_path_for_saved_asset,
+    generate_path_for_published_asset,
+    generate_path_for_exported_asset,
+)
+
+
+def clear_caches():
+    """Clear the caches of the file name and path generators. Must be called when the settings or the asset type definitions change."""
 
-    if asset_type == asset_type_definition.NONE_TYPE:
-        asset_type = asset_type_definition.get_type_by_name(asset_data.type)
+    for generator in GENERATORS:
+        generator.cache.clear()
 
-    template = "{exportDir}/"
 
-    if asset_data.has_scene and asset_data.has_shot:
-        template += "{scene:03d}/{shot:03d}/"
-    elif asset_data.has_scene:
-        template += "{scene:03d}/"
+asset_type_definition.add_registry_listener(clear_caches)
 
-    template += "{name}/"
 
-    if asset_data.has_variant:
-        template += "{variant:02d}/"
+def _generate_file_name(target, asset_data):
+    """Generate the file name of an asset for a target using the compiled template matching the asset's variables."""
 
-    return template.format(
-        exportDir=asset_type.export_dir,
-        type=asset_type.code,
+    key = (target, bool(asset_data.name), asset_data.has_variant, asset_data.has_scene, asset_data.has_scene and asset_data.has_shot)
+    template = _FILE_NAME_TEMPLATES.get(key) or get_file_name_template(*key)
+
+    return template(
+        type=asset_type_definition.get_type(asset_data.type).code,
+        name=asset_data.name,
+        variant=asset_data.variant,
         scene=asset_data.scene,
         shot=asset_data.shot,
+        version=asset_data.version
+    )
+
+
+def _generate_path(target, asset_data, directory):
+    """Generate the file path of an asset for a target using the compiled template matching the asset's variables."""
+
+    key = (target, bool(asset_data.name), asset_data.has_variant, asset_data.has_scene, asset_data.has_scene and asset_data.has_shot)
+    template = _PATH_TEMPLATES.get(key) or get_path_template(*key)
+
+    return template(
+        directory=directory,
         name=asset_data.name,
-        variant=asset_data.variant
-    ).replace("//", "/")
+        variant=asset_data.variant,
+        scene=asset_data.scene,
+        shot=asset_data.shot
+    )
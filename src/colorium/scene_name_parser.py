@@ -1,89 +1,136 @@
 """Module used to parse a string into a Colorium Asset using the Colorium Naming Convention."""
 
-import maya.cmds as cmds
+from collections import deque
+from itertools import islice
+import multiprocessing
+import os
 from colorium.asset import CAsset
+import colorium.asset_record as asset_record
 from colorium.naming_convention import CNamingConvention
+import colorium.naming_convention as naming_convention
 
 
 NAMING_CONVENTION = CNamingConvention()
-ASSET = CAsset()
+DEFAULT_CHUNK_SIZE = 2000
 
+# The number of chunks per worker process sent to the pool ahead of the results.
+PENDING_CHUNKS_PER_PROCESS = 2
 
-def parse_scene_name_to_asset():
-    """Parse the scene name and return an instance of an asset containing the parsed values."""
+
+def parse_scene_name_to_asset(asset=None):
+    """Parse the scene name and return an instance of an asset containing the parsed values. When an asset is given, it's updated instead."""
+
+    import maya.cmds as cmds
 
     scene_name = cmds.file(q=True, sn=True, shn=True)
 
-    return parse_string_to_asset(scene_name)
+    return parse_string_to_asset(scene_name, asset)
+
+
+def parse_string(string):
+    """Parse a file name or a file path and return a new immutable CParsedName, or None if it doesn't follow the naming convention.
+    The folders and the extension are ignored. This function doesn't touch any shared state, so it can safely be called from many threads or processes."""
+
+    if not string:
+        return None
+
+    return NAMING_CONVENTION.parse_name(os.path.splitext(naming_convention.file_name_from_path(string))[0])
+
+
+def parse_string_to_asset(string, asset=None):
+    """Parse a string and return a new instance of an asset containing the parsed values. When an asset is given, it's updated instead."""
+
+    if asset is None:
+        return parsed_name_to_asset(parse_string(string))
+
+    return update_asset_from_parsed_name(asset, parse_string(string))
+
+
+def parse_strings_to_assets(strings, on_unparseable=None, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Parse an iterable of file names or file paths (os.walk output, lines of a manifest, ...) and yield a (string, CParsedName) tuple
+    for every string as soon as it's parsed. The strings that don't follow the naming convention aren't yielded, they are passed to the
+    on_unparseable callback instead. Blank strings are skipped.
 
+    When processes is given, the strings are parsed by a pool of worker processes in chunks of chunk_size strings. The results are still
+    yielded in the input order. This is only worth it for very large inputs."""
 
-def parse_string_to_asset(string):
-    """Parse a string and return an instance of an asset containing the parsed values."""
+    if processes:
+        results = __parse_chunks_in_pool(strings, processes, chunk_size)
+    else:
+        results = ((string, parse_string(string)) for string in strings)
 
-    string.encode("ascii", "ignore")
-    if string:
-        parse_type_from_string(string)
-        parse_name_from_string(string)
-        parse_variant_from_string(string)
-        parse_scene_from_string(string)
-        parse_shot_from_string(string)
-        parse_version_from_string(string)
+    for string, parsed_name in results:
+        if parsed_name is not None:
+            yield string, parsed_name
+        elif on_unparseable is not None and string.strip():
+            on_unparseable(string)
 
-    return ASSET
 
+def __parse_chunks_in_pool(strings, processes, chunk_size):
+    """Parse the strings in chunks using a pool of worker processes and yield a (string, CParsedName) tuple for every string.
+    At most PENDING_CHUNKS_PER_PROCESS chunks per process are read ahead of the results, so the memory stays bounded on very large inputs."""
 
-def parse_type_from_string(string_to_parse):
-    """Parse the type out of a string and assign it to the asset."""
+    max_pending = processes * PENDING_CHUNKS_PER_PROCESS
+    pending = deque()
+    pool = multiprocessing.Pool(processes)
+    completed = False
 
-    asset_type = NAMING_CONVENTION.search_type_in_name(string_to_parse)
+    try:
+        for chunk in __split_in_chunks(strings, chunk_size):
+            pending.append((chunk, pool.apply_async(naming_convention.parse_names_chunk, ((NAMING_CONVENTION, chunk),))))
 
-    if asset_type != None:
-        ASSET.type = asset_type
+            if len(pending) >= max_pending:
+                for result in __pop_chunk_results(pending):
+                    yield result
 
+        while pending:
+            for result in __pop_chunk_results(pending):
+                yield result
 
-def parse_name_from_string(string_to_parse):
-    """Parse the name out of a string and assign it to the asset."""
+        completed = True
+    finally:
+        if completed:
+            pool.close()
+        else:
+            pool.terminate()
 
-    name = NAMING_CONVENTION.search_name_in_name(string_to_parse)
+        pool.join()
 
-    if name != None:
-        ASSET.name = name
 
+def __pop_chunk_results(pending):
+    """Wait for the oldest pending chunk and return its (string, CParsedName) tuples."""
 
-def parse_variant_from_string(string_to_parse):
-    """Parse the variant out of a string and assign it to the asset."""
+    chunk, async_result = pending.popleft()
 
-    variant = NAMING_CONVENTION.search_variant_in_name(string_to_parse)
+    return zip(chunk, async_result.get())
 
-    if variant != None:
-        ASSET.variant = int(variant)
-        ASSET.has_variant = True
 
+def __split_in_chunks(iterable, chunk_size):
+    """Split an iterable in lists of chunk_size elements. The last list may be shorter."""
 
-def parse_scene_from_string(string_to_parse):
-    """Parse the scene out of a string and assign it to the asset."""
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, chunk_size))
 
-    scene = NAMING_CONVENTION.search_scene_in_name(string_to_parse)
+    while chunk:
+        yield chunk
 
-    if scene != None:
-        ASSET.scene = int(scene)
-        ASSET.has_scene = True
+        chunk = list(islice(iterator, chunk_size))
 
 
-def parse_shot_from_string(string_to_parse):
-    """Parse the shot out of a string and assign it to the asset."""
+def parsed_name_to_asset(parsed_name):
+    """Create a new instance of an asset from a CParsedName. The values missing from the parsed name keep the asset's defaults."""
 
-    shot = NAMING_CONVENTION.search_shot_in_name(string_to_parse)
+    if parsed_name is None:
+        return CAsset()
 
-    if shot != None:
-        ASSET.shot = int(shot)
-        ASSET.has_shot = True
+    return CAsset.from_record(asset_record.from_parsed_name(parsed_name))
 
 
-def parse_version_from_string(string_to_parse):
-    """Parse the version out of a string and assign it to the asset."""
+def update_asset_from_parsed_name(asset, parsed_name):
+    """Set the values of a CParsedName on an existing asset in a single batch update, so its configurations are updated once
+    and its bindings are notified once per field. The values missing from the parsed name keep the asset's values. Returns the asset."""
 
-    version = NAMING_CONVENTION.seach_version_in_name(string_to_parse)
+    if parsed_name is not None:
+        asset.update_many(**asset_record.get_parsed_values(parsed_name))
 
-    if version != None:
-        ASSET.version = int(version.replace("v", ""))
+    return asset
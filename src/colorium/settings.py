@@ -1,11 +1,27 @@
 """Module containing all the settings for the package."""
 
+import os
+
 # PATHS
 PROJECT_FOLDER = 'Y:/project'
 MAYA_PROJECT_FOLDER = 'Y:/project/maya_work'
 ASSET_SAVE_BASE_FOLDER = 'Y:/project/maya_work/scenes'
 ASSET_PUBLISH_BASE_FOLDER = 'Y:/project/maya_work/assets'
 ASSET_EXPORT_BASE_FOLDER = 'Y:/project/exports/maya'
+COMMAND_PLUGINS_FOLDER = 'Y:/project/pipeline/colorium_plugins' # Folder containing the commands.json manifest of the third-party commands
 
 # FILE FORMATS
 DEFAULT_FILE_FORMAT = 'Maya Binary' # Valid values are : Maya Ascii, Maya Binary
+
+# COMMAND METRICS
+COMMAND_METRICS_ENABLED = True
+COMMAND_METRICS_LOG = os.path.join(os.path.expanduser('~'), 'colorium', 'command_metrics.jsonl') # Local JSON lines log, summarized by running colorium.command_metrics
+COMMAND_PROFILE_FOLDER = '' # Folder where a cProfile stats file is dumped per command execution, empty to disable the profiling
+
+# WORKERS
+MAYAPY_EXECUTABLE = 'C:/Program Files/Autodesk/Maya2018/bin/mayapy.exe' # Headless Maya interpreter running the publish and export workers
+WORKER_POOL_SIZE = 2 # Number of warm worker processes
+WORKER_START_TIMEOUT = 300 # Seconds a worker process has to start before it's killed
+WORKER_JOB_TIMEOUT = 3600 # Seconds a worker process has to run a job before it's killed and the job fails
+COMMIT_IN_WORKERS = False # Run the commit's publish and export in the worker processes when their command can run there. The command middlewares (metrics) don't run for them
+GEOMETRY_CACHE_CHUNK_SIZE = 100 # Number of frames cached by each worker process with the Geometry Cache (Chunked) publish commands
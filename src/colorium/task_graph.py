@@ -0,0 +1,173 @@
+"""Module containing a small task dependency graph. The tasks run as soon as the tasks they depend on succeeded, the independent tasks in parallel."""
+
+from collections import OrderedDict, namedtuple
+import threading
+import time
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+
+# The statuses of a task.
+PENDING, RUNNING, SUCCEEDED, FAILED, SKIPPED, CANCELLED = "pending", "running", "succeeded", "failed", "skipped", "cancelled"
+
+
+class CTaskResult(namedtuple("CTaskResult", ("name", "status", "value", "error", "start", "wall"))):
+    """Result of a task : its status, the value it returned, the error it raised, when it started and how long it took (wall clock)."""
+
+    __slots__ = ()
+
+    @property
+    def succeeded(self):
+        """Indicates if the task succeeded."""
+
+        return self.status == SUCCEEDED
+
+
+class CTaskGraph(object):
+    """Graph of tasks depending on each other. The tasks are started by run on the calling thread, so they can use maya.cmds.
+    A task that returns a future (an object with a wait and an add_done_callback method, like a worker pool's CJobFuture) keeps running
+    in the background while the next ready tasks are started. That's how independent tasks run in parallel.
+    When a task fails, the tasks depending on it are skipped and the others keep running. Once cancelled, the tasks not started are cancelled."""
+
+    @property
+    def results(self):
+        """The CTaskResult of the finished tasks, by name, in the order they finished."""
+
+        return self.__results
+
+
+    def __init__(self):
+        self.__tasks = OrderedDict()
+        self.__cleanups = []
+        self.__results = OrderedDict()
+        self.__futures = {}
+        self.__completions = queue.Queue()
+        self.__cancelled = threading.Event()
+
+
+    def add_task(self, name, function, depends_on=()):
+        """Add a task calling the function without argument once the tasks it depends on succeeded. Raises a ValueError if a task
+        with the same name exists or if a dependency isn't in the graph yet (which also prevents cycles)."""
+
+        if name in self.__tasks:
+            raise ValueError('The task {!r} already exists.'.format(name))
+
+        for dependency in depends_on:
+            if dependency not in self.__tasks:
+                raise ValueError('The task {!r} depends on the unknown task {!r}.'.format(name, dependency))
+
+        self.__tasks[name] = (function, tuple(depends_on))
+
+
+    def add_cleanup(self, function):
+        """Add a function called without argument once run is done, whatever the outcome of the tasks, even if a callback of run raised.
+        The background tasks are done by then, unless a callback raised while they were running."""
+
+        self.__cleanups.append(function)
+
+
+    def cancel(self):
+        """Cancel the tasks not started yet and the background jobs that can still be cancelled. Safe to call from any thread."""
+
+        self.__cancelled.set()
+
+        for future in list(self.__futures.values()):
+            future.cancel()
+
+
+    def run(self, on_result=None, poll=None, poll_interval=0.1):
+        """Run the tasks and return their CTaskResult by name. The on_result callback is called with each CTaskResult as soon as the task is done.
+        While background tasks are running, the poll function, if given, is called every poll_interval seconds (to cancel from the UI, for example)."""
+
+        statuses = OrderedDict((name, PENDING) for name in self.__tasks)
+        starts = {}
+
+        def finish(name, status, value=None, error=None):
+            statuses[name] = status
+            start = starts.get(name)
+            result = CTaskResult(name, status, value, error, start, time.time() - start if start else 0.0)
+            self.__results[name] = result
+
+            if on_result is not None:
+                on_result(result)
+
+        try:
+            while True:
+                started = False
+
+                for name, (function, depends_on) in self.__tasks.items():
+                    if statuses[name] != PENDING:
+                        continue
+
+                    dependency_statuses = [statuses[dependency] for dependency in depends_on]
+
+                    if self.__cancelled.is_set():
+                        finish(name, CANCELLED)
+                    elif any(status in (FAILED, SKIPPED, CANCELLED) for status in dependency_statuses):
+                        finish(name, SKIPPED)
+                    elif all(status == SUCCEEDED for status in dependency_statuses):
+                        started = True
+                        self.__start(name, function, starts, statuses, finish)
+
+                if started:
+                    continue
+
+                if not self.__futures:
+                    break
+
+                self.__wait_for_completion(finish, poll, poll_interval)
+        finally:
+            for cleanup in self.__cleanups:
+                cleanup()
+
+        return self.__results
+
+
+    def __start(self, name, function, starts, statuses, finish):
+        """Call a task's function. A returned future is followed in the background, any other value completes the task."""
+
+        starts[name] = time.time()
+        statuses[name] = RUNNING
+
+        try:
+            value = function()
+        except Exception as exception:
+            finish(name, FAILED, error=exception)
+            return
+
+        if hasattr(value, "wait") and hasattr(value, "add_done_callback"):
+            self.__futures[name] = value
+            value.add_done_callback(lambda future: self.__completions.put(name))
+        else:
+            finish(name, SUCCEEDED, value)
+
+
+    def __wait_for_completion(self, finish, poll, poll_interval):
+        """Wait until a background task is done and finish it."""
+
+        while True:
+            try:
+                name = self.__completions.get(timeout=poll_interval)
+                break
+            except queue.Empty:
+                if poll is not None:
+                    poll()
+
+        future = self.__futures.pop(name)
+
+        try:
+            value = future.wait()
+        except Exception as exception:
+            finish(name, CANCELLED if future.cancelled() else FAILED, error=exception)
+        else:
+            finish(name, SUCCEEDED, value)
+
+
+def format_results(results):
+    """Return a text report of the tasks' results, with the time each one took."""
+
+    return "\n".join("{:<12} {:<10} {:>8.2f} s{}".format(result.name, result.status, result.wall, " : {}".format(result.error) if result.error else "")
+                     for result in results.values())
@@ -1,7 +1,25 @@
 """Module used to build consistent UI for Colorium's tools using maya.cmds."""
 
 import maya.cmds as cmds
+import maya.utils
 import colorium.data_binding as data_binding
+import patterns.eventBus as eventBus
+
+
+def schedule_on_idle(callback):
+    """Scheduler of the deferred binding updates. Calls the callback once Maya is idle."""
+
+    cmds.evalDeferred(callback, lowestPriority=True)
+
+
+def execute_on_main_thread(callback):
+    """Executor of the event bus. Calls the callback on Maya's main thread, from any thread."""
+
+    maya.utils.executeDeferred(callback)
+
+
+data_binding.DISPATCHER.scheduler = schedule_on_idle
+eventBus.BUS.executor = execute_on_main_thread
 
 
 class CUI(object):
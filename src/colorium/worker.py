@@ -0,0 +1,170 @@
+"""Module containing the entry point of the headless worker processes (mayapy) running the publish and export jobs of the worker pool.
+
+The worker reads one JSON job per line on its standard input and writes one JSON result per line on its standard output. A job contains
+its ID, the scene snapshot to open, the nodes to select and the description of the configuration to execute (see CConfiguration.to_description).
+The maya.cmds module is injected, so the jobs can be run with a plain Python stand-in outside Maya."""
+
+import json
+import os
+import sys
+import time
+import traceback
+
+
+# The functions running the jobs, by (action, command name). A handler takes the maya.cmds module, the configuration description and the job.
+HANDLERS = {}
+
+
+def register_handler(action, name):
+    """Decorator registering a function as the handler of the jobs of the specified action and command name."""
+
+    def decorator(function):
+        HANDLERS[(action, name)] = function
+
+        return function
+
+    return decorator
+
+
+def open_scene(cmds, scene):
+    """Open the scene snapshot of a job, unless it's already opened. The workers stay warm between the jobs of the same snapshot."""
+
+    if scene and cmds.file(q=True, sn=True) != scene:
+        cmds.file(scene, o=True, f=True)
+
+
+def select_nodes(cmds, nodes):
+    """Select the nodes of a job. Raises a ValueError if the job has no nodes."""
+
+    if not nodes:
+        raise ValueError("The job has no nodes to select.")
+
+    cmds.select(nodes, r=True)
+
+
+def make_dirs(path):
+    """Create the folder of a configuration if it doesn't exist."""
+
+    if path and not os.path.exists(path):
+        os.makedirs(path)
+
+
+def _export_selection(cmds, config, job, file_type):
+    """Export the job's nodes in the configuration's path and file name. Like the commands run in the Maya session, an existing file isn't overwritten."""
+
+    make_dirs(config["path"])
+    select_nodes(cmds, job.get("nodes"))
+    cmds.file(config["path"] + config["file_name"], es=True, typ=file_type)
+
+
+@register_handler("publish", "Maya Ascii")
+@register_handler("export", "Maya Ascii")
+def export_maya_ascii(cmds, config, job):
+    """Publish or export the job's nodes in Maya Ascii."""
+
+    _export_selection(cmds, config, job, "mayaAscii")
+
+
+@register_handler("publish", "Maya Binary")
+@register_handler("export", "Maya Binary")
+def export_maya_binary(cmds, config, job):
+    """Publish or export the job's nodes in Maya Binary."""
+
+    _export_selection(cmds, config, job, "mayaBinary")
+
+
+@register_handler("publish", "Geometry Cache Chunk")
+def cache_geometry_chunk(cmds, config, job):
+    """Cache the job's shapes over the job's frame range, or over the scene's playback range if the job has none.
+    If the job has a run-up start, the frames from the run-up start to the first cached frame are evaluated first."""
+
+    make_dirs(config["path"])
+
+    if not job.get("nodes"):
+        raise ValueError("The job has no shapes to cache.")
+
+    if job.get("frame_range"):
+        start_frame, end_frame = job["frame_range"]
+    else:
+        start_frame = cmds.playbackOptions(q=True, ast=True)
+        end_frame = cmds.playbackOptions(q=True, aet=True)
+
+    for frame in range(int(job.get("run_up_start", start_frame)), int(start_frame)):
+        cmds.currentTime(frame, e=True)
+
+    cmds.cacheFile(f=config["file_name"], dir=config["path"], pts=job["nodes"], st=start_frame, et=end_frame, r=True, ws=True, fm="OneFile", sch=True)
+
+
+def run_job(job, cmds):
+    """Run a job and return its result : its ID, its status (\"ok\" or \"error\"), the error's message and traceback if it failed,
+    and the wall clock time it took."""
+
+    start = time.time()
+    result = {"id": job.get("id"), "status": "ok"}
+
+    try:
+        config = job["config"]
+        handler = HANDLERS.get((config["command"]["action"], config["command"]["name"]))
+
+        if handler is None:
+            raise ValueError('No worker handler for the {} command {!r}.'.format(config["command"]["action"], config["command"]["name"]))
+
+        open_scene(cmds, job.get("scene"))
+        handler(cmds, config, job)
+    except Exception as exception:
+        result["status"] = "error"
+        result["error"] = str(exception) or repr(exception)
+        result["traceback"] = traceback.format_exc()
+
+    result["wall"] = time.time() - start
+
+    return result
+
+
+def serve(input_stream, output_stream, cmds):
+    """Run the jobs read on the input stream and write their results on the output stream, until the input stream is closed.
+    A \"ready\" message is written first. A line that isn't a valid job gets an error result."""
+
+    _write(output_stream, {"ready": True, "pid": os.getpid()})
+
+    for line in iter(input_stream.readline, ""):
+        if not line.strip():
+            continue
+
+        try:
+            job = json.loads(line)
+        except ValueError as exception:
+            _write(output_stream, {"id": None, "status": "error", "error": "Invalid job : {}".format(exception)})
+            continue
+
+        _write(output_stream, run_job(job, cmds))
+
+
+def _write(output_stream, message):
+    """Write a message as a JSON line and flush it right away."""
+
+    output_stream.write(json.dumps(message) + "\n")
+    output_stream.flush()
+
+
+def main():
+    """Entry point of the mayapy worker processes. Initializes Maya once, then serves the jobs. Maya's own output is sent to the standard
+    error so it can't corrupt the results written on the standard output."""
+
+    output_stream = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    import maya.standalone
+
+    maya.standalone.initialize(name="python")
+
+    import maya.cmds as cmds
+
+    try:
+        serve(sys.stdin, output_stream, cmds)
+    finally:
+        maya.standalone.uninitialize()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""Module containing the pool of persistent headless worker processes (mayapy) running the publish and export jobs out of the artist's Maya session.
+The workers are started once and stay warm, so Maya's startup cost isn't paid per job, and several jobs run in parallel."""
+
+from distutils.spawn import find_executable
+import itertools
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+import colorium.settings as settings
+
+
+# The folder containing the colorium package, added to the workers' module search path.
+_PACKAGE_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sentinel put in the job queue to stop a worker thread.
+_STOP = object()
+
+
+class CWorkerError(Exception):
+    """Error raised by a job that failed in a worker process, or whose worker process died."""
+
+    def __init__(self, message, traceback=None):
+        super(CWorkerError, self).__init__(message)
+
+        self.traceback = traceback
+
+
+class CJobFuture(object):
+    """Result of a job submitted to the worker pool, available once the job is done."""
+
+    @property
+    def job(self):
+        """The job."""
+
+        return self.__job
+
+
+    @property
+    def result(self):
+        """The result message written by the worker, or None until the job is done."""
+
+        return self.__result
+
+
+    def __init__(self, job):
+        self.__job = job
+        self.__result = None
+        self.__error = None
+        self.__state = "pending"
+        self.__event = threading.Event()
+        self.__callbacks = []
+        self.__lock = threading.Lock()
+
+
+    def done(self):
+        """Indicates if the job is done, failed or was cancelled."""
+
+        return self.__event.is_set()
+
+
+    def cancel(self):
+        """Cancel the job if a worker hasn't started it yet. Returns True if the job is cancelled."""
+
+        with self.__lock:
+            if self.__state != "pending":
+                return self.__state == "cancelled"
+
+            self.__state = "cancelled"
+
+        self._set(None, CWorkerError("The job was cancelled."))
+
+        return True
+
+
+    def cancelled(self):
+        """Indicates if the job was cancelled."""
+
+        return self.__state == "cancelled"
+
+
+    def wait(self, timeout=None):
+        """Return the job's result message once it's done. Raises a CWorkerError if the job failed or was cancelled."""
+
+        if not self.__event.wait(timeout):
+            raise CWorkerError("The job didn't finish in time.")
+
+        if self.__error is not None:
+            raise self.__error
+
+        return self.__result
+
+
+    def add_done_callback(self, callback):
+        """Call the callback with the future once the job is done, right away if it's already done. The callback is called on the pool's thread."""
+
+        with self.__lock:
+            if not self.__event.is_set():
+                self.__callbacks.append(callback)
+                return
+
+        callback(self)
+
+
+    def _start(self):
+        """Mark the job as started. Returns False if the job was cancelled."""
+
+        with self.__lock:
+            if self.__state != "pending":
+                return False
+
+            self.__state = "running"
+
+            return True
+
+
+    def _set(self, result, error=None):
+        """Set the job's result or error and call the done callbacks."""
+
+        with self.__lock:
+            self.__result = result
+            self.__error = error
+            self.__event.set()
+            callbacks, self.__callbacks = self.__callbacks, []
+
+        for callback in callbacks:
+            callback(self)
+
+
+class CWorkerPool(object):
+    """Pool of persistent worker processes serving the jobs of colorium.worker. Each worker process is driven by a thread of the pool
+    taking the jobs from a shared queue. A worker process that dies, or doesn't answer in time, fails its job and is restarted for the next one."""
+
+    @property
+    def size(self):
+        """The number of worker processes."""
+
+        return self.__size
+
+
+    @property
+    def started(self):
+        """Indicates if the worker processes are started."""
+
+        return bool(self.__threads)
+
+
+    def __init__(self, size=None, command_line=None, start_timeout=None, job_timeout=None):
+        self.__size = size or settings.WORKER_POOL_SIZE
+        self.__command_line = command_line or [settings.MAYAPY_EXECUTABLE, "-m", "colorium.worker"]
+        self.__start_timeout = start_timeout or settings.WORKER_START_TIMEOUT
+        self.__job_timeout = job_timeout or settings.WORKER_JOB_TIMEOUT
+        self.__jobs = queue.Queue()
+        self.__threads = []
+        self.__ids = itertools.count(1)
+        self.__lock = threading.Lock()
+
+
+    def is_available(self):
+        """Indicates if the worker executable can be found, so the worker processes can be started."""
+
+        executable = self.__command_line[0]
+
+        return os.path.isfile(executable) or find_executable(executable) is not None
+
+
+    def start(self):
+        """Start the worker processes in the background, so they are warm when the first jobs are submitted. Does nothing if they are already started."""
+
+        with self.__lock:
+            if self.__threads:
+                return
+
+            for index in range(self.__size):
+                thread = threading.Thread(target=self.__run_worker, name="ColoriumWorker{}".format(index))
+                thread.daemon = True
+                thread.start()
+                self.__threads.append(thread)
+
+
+    def submit(self, job):
+        """Queue a job and return its CJobFuture. The pool is started if needed. An ID is given to the job if it has none."""
+
+        self.start()
+
+        job = dict(job)
+        job.setdefault("id", next(self.__ids))
+        future = CJobFuture(job)
+        self.__jobs.put(future)
+
+        return future
+
+
+    def submit_configuration(self, config, scene, nodes):
+        """Queue the execution of a configuration's command on the nodes of a scene snapshot and return its CJobFuture."""
+
+        return self.submit({"scene": scene, "nodes": list(nodes), "config": config.to_description()})
+
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes once the queued jobs are done."""
+
+        with self.__lock:
+            threads, self.__threads = self.__threads, []
+
+        for _ in threads:
+            self.__jobs.put(_STOP)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+    def __run_worker(self):
+        """Drive a worker process : send it the queued jobs one at a time and set their futures with its results."""
+
+        try:
+            process = self.__start_process()
+        except (IOError, OSError, ValueError, CWorkerError):
+            process = None
+
+        try:
+            while True:
+                future = self.__jobs.get()
+
+                if future is _STOP:
+                    break
+
+                if not future._start():
+                    continue
+
+                try:
+                    if process is None or not process.alive:
+                        process = self.__start_process()
+
+                    process.send(future.job)
+                    result = process.read(self.__job_timeout)
+                except (IOError, OSError, ValueError, CWorkerError) as exception:
+                    if process is not None:
+                        process.kill()
+
+                    process = None
+                    future._set(None, CWorkerError("The worker process failed : {}".format(exception)))
+                    continue
+
+                if result.get("status") == "ok":
+                    future._set(result)
+                else:
+                    future._set(result, CWorkerError(result.get("error", "Unknown error"), result.get("traceback")))
+        finally:
+            if process is not None:
+                process.stop()
+
+
+    def __start_process(self):
+        """Start a worker process and wait until it's ready."""
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(path for path in (_PACKAGE_FOLDER, env.get("PYTHONPATH")) if path)
+
+        process = _CWorkerProcess(subprocess.Popen(self.__command_line, stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env, universal_newlines=True))
+
+        try:
+            if not process.read(self.__start_timeout).get("ready"):
+                raise CWorkerError("The worker process didn't start.")
+        except (ValueError, CWorkerError):
+            process.kill()
+            raise
+
+        return process
+
+
+class _CWorkerProcess(object):
+    """Worker process driven by a thread of the pool. Its output is read by a thread of its own, so the pool can wait for a message with a timeout."""
+
+    @property
+    def alive(self):
+        """Indicates if the process is still running."""
+
+        return self.__process.poll() is None
+
+
+    def __init__(self, process):
+        self.__process = process
+        self.__messages = queue.Queue()
+
+        reader = threading.Thread(target=self.__read_output, name="ColoriumWorkerReader{}".format(process.pid))
+        reader.daemon = True
+        reader.start()
+
+
+    def send(self, job):
+        """Send a job to the process."""
+
+        self.__process.stdin.write(json.dumps(job) + "\n")
+        self.__process.stdin.flush()
+
+
+    def read(self, timeout):
+        """Return the next JSON message written by the process. Raises a CWorkerError if the process died or didn't write a message in time."""
+
+        try:
+            line = self.__messages.get(timeout=timeout)
+        except queue.Empty:
+            raise CWorkerError("The worker process didn't answer in {} seconds.".format(timeout))
+
+        if line is None:
+            raise CWorkerError("The worker process exited with code {}.".format(self.__process.wait()))
+
+        return json.loads(line)
+
+
+    def stop(self):
+        """Close the process' input so it exits, and wait for it."""
+
+        try:
+            self.__process.stdin.close()
+        except (IOError, OSError):
+            pass
+
+        self.__process.wait()
+
+
+    def kill(self):
+        """Kill the process, hung or not, and wait for it."""
+
+        try:
+            self.__process.kill()
+        except OSError:
+            pass
+
+        self.stop()
+
+
+    def __read_output(self):
+        """Queue the lines written by the process until its output is closed. None marks the end of the output."""
+
+        try:
+            for line in iter(self.__process.stdout.readline, ""):
+                self.__messages.put(line)
+        finally:
+            self.__messages.put(None)
+
+
+def save_snapshot(cmds, folder=None):
+    """Save a copy of the current scene that the workers can open, without renaming the current scene. Returns the snapshot's path."""
+
+    folder = folder or tempfile.gettempdir()
+    scene_name = os.path.splitext(os.path.basename(cmds.file(q=True, sn=True) or "untitled"))[0]
+    path = os.path.join(folder, "colorium_snapshot_{}_{}_{}.mb".format(scene_name, os.getpid(), int(time.time() * 1000))).replace("\\", "/")
+
+    cmds.file(path, ea=True, f=True, pr=True, typ="mayaBinary")
+
+    return path
+
+
+def remove_snapshot(path):
+    """Delete a scene snapshot. A snapshot that can't be deleted only prints a warning."""
+
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except OSError as exception:
+        print('Could not delete the scene snapshot \'{}\' : {}'.format(path, exception))
+
+
+def remove_snapshot_when_done(path, futures):
+    """Delete a scene snapshot once every job using it is done, failed or was cancelled."""
+
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(future):
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+
+        if last:
+            remove_snapshot(path)
+
+    if not futures:
+        remove_snapshot(path)
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+
+_POOL = None
+
+
+def get_pool():
+    """Return the shared worker pool, created on first use."""
+
+    global _POOL
+
+    if _POOL is None:
+        _POOL = CWorkerPool()
+
+    return _POOL
+
+
+def submit_selection(cmds, configs, pool=None):
+    """Save a snapshot of the current scene and submit the execution of each configuration's command on the selected nodes to the worker pool.
+    Returns the CJobFuture of each configuration, in the same order. The snapshot is deleted once the jobs are done."""
+
+    nodes = cmds.ls(sl=True) or []
+    scene = save_snapshot(cmds)
+    pool = pool or get_pool()
+    futures = [pool.submit_configuration(config, scene, nodes) for config in configs]
+    remove_snapshot_when_done(scene, futures)
+
+    return futures
@@ -0,0 +1,100 @@
+import threading
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+from patterns.observerPattern import Observable
+
+
+class EventBus(Observable):
+    """Observable that any thread can post events to. An event is a (topic, payload) change. The events are queued and delivered to the
+    observers in batches by flush, which must run on the thread owning the observers (Maya's main thread). The first event posted after
+    a flush asks the executor to call flush, once. The executor is a function taking the function to call on the main thread
+    (Maya's executeDeferred in production). Without an executor, the bus has to be flushed manually. Unlike the changes of an Observable's
+    batch, the events are never coalesced."""
+
+    def __init__(self, executor=None, eventQueue=None):
+        Observable.__init__(self)
+
+        self._executor = executor
+        self._queue = eventQueue if eventQueue is not None else queue.Queue()
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        """The function used to run the flush of the bus on the main thread."""
+
+        return self._executor
+
+    @executor.setter
+    def executor(self, value):
+        self._executor = value
+
+    def post(self, topic, payload=None):
+        """Queue an event. Safe to call from any thread."""
+
+        self._queue.put((topic, payload))
+        self._schedule()
+
+    def flush(self):
+        """Deliver every queued event to the observers of its topic, in the order they were posted. Returns the number of events delivered."""
+
+        with self._lock:
+            self._scheduled = False
+
+        events = []
+
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if events and self._observers:
+            self._deliver(events)
+
+        return len(events)
+
+    def relay(self, sourceQueue):
+        """Start a daemon thread posting to the bus the (topic, payload) events put in another queue, for instance a multiprocessing queue
+        shared with worker processes. Putting None in the source queue stops the thread. Returns the thread."""
+
+        def run():
+            while True:
+                event = sourceQueue.get()
+
+                if event is None:
+                    break
+
+                self.post(*event)
+
+        thread = threading.Thread(target=run, name="EventBusRelay")
+        thread.daemon = True
+        thread.start()
+
+        return thread
+
+    def _schedule(self):
+        """Ask the executor to flush the bus, unless a flush is already scheduled."""
+
+        with self._lock:
+            schedule = not self._scheduled and self._executor is not None
+            self._scheduled = self._scheduled or schedule
+
+        if not schedule:
+            return
+
+        try:
+            self._executor(self.flush)
+        except Exception:
+            # The next event has to try scheduling again, or the bus would never be flushed.
+            with self._lock:
+                self._scheduled = False
+
+            raise
+
+
+BUS = EventBus()
@@ -1,4 +1,7 @@
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+import weakref
 
 class Subject():
     __metaclass__ = ABCMeta
@@ -30,3 +33,144 @@ class Observer():
     @abstractmethod
     def update(self, *args):
         pass
+
+
+class Observable(Subject):
+    """Concrete subject. Each instance holds weak references to its observers, so attaching an observer never keeps it alive.
+    An observer can subscribe to every topic or to some topics only. A change is a (topic, value) tuple and the observers receive,
+    in a single call to their update method, the list of the changes matching their topics. The changes notified inside a batch
+    are delivered at the end of the batch, only the last value of each topic being kept."""
+
+    def __init__(self):
+        self._observers = None
+        self._allTopicsObservers = None
+        self._topicObservers = None
+        self._batchDepth = 0
+        self._pendingChanges = None
+
+    def attach(self, observer, topics=None):
+        """Attach an observer to every topic, or only to the specified topics. Attaching an observer again replaces its topics."""
+
+        if self._observers is None:
+            self._observers = weakref.WeakKeyDictionary()
+            self._allTopicsObservers = weakref.WeakSet()
+            self._topicObservers = {}
+
+        self.detach(observer)
+
+        if topics is None:
+            self._observers[observer] = None
+            self._allTopicsObservers.add(observer)
+            return
+
+        topics = frozenset(topics)
+        self._observers[observer] = topics
+
+        for topic in topics:
+            topicObservers = self._topicObservers.get(topic)
+
+            if topicObservers is None:
+                topicObservers = self._topicObservers[topic] = weakref.WeakSet()
+
+            topicObservers.add(observer)
+
+    def attachAndNotify(self, observer, topics=None):
+        """Attach an observer and send it the current state of the subject (see getState)."""
+
+        self.attach(observer, topics)
+
+        changes = self.getState(topics)
+
+        if changes:
+            observer.update(changes)
+
+    def detach(self, observer):
+        """Detach an observer. Does nothing if the observer isn't attached."""
+
+        if self._observers is None or observer not in self._observers:
+            return
+
+        topics = self._observers.pop(observer)
+
+        if topics is None:
+            self._allTopicsObservers.discard(observer)
+            return
+
+        for topic in topics:
+            topicObservers = self._topicObservers.get(topic)
+
+            if topicObservers is not None:
+                topicObservers.discard(observer)
+
+                if not topicObservers:
+                    del self._topicObservers[topic]
+
+    def notify(self, *changes):
+        """Send the (topic, value) changes to the observers of their topics, or queue them until the end of the current batch."""
+
+        if self._batchDepth:
+            for topic, value in changes:
+                self._pendingChanges[topic] = value
+        elif self._observers:
+            self._deliver(changes)
+
+    @contextmanager
+    def batch(self):
+        """Context manager that queues the changes notified in the block and delivers them at the end. Batches can be nested."""
+
+        if not self._batchDepth:
+            self._pendingChanges = OrderedDict()
+
+        self._batchDepth += 1
+
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+
+            if not self._batchDepth:
+                changes = self._pendingChanges
+                self._pendingChanges = None
+
+                if changes and self._observers:
+                    self._deliver(list(changes.items()))
+
+    def getState(self, topics=None):
+        """Return the current state of the subject as a list of (topic, value) changes, for every topic or only the specified topics.
+        Sent by attachAndNotify to the new observer. Meant to be overridden, returns an empty list by default."""
+
+        return []
+
+    def getObserverCount(self):
+        """Return the number of observers attached to the subject."""
+
+        return len(self._observers) if self._observers is not None else 0
+
+    def clearObservers(self):
+        """Detach every observer."""
+
+        self._observers = None
+        self._allTopicsObservers = None
+        self._topicObservers = None
+
+    def _deliver(self, changes):
+        """Send each observer the list of changes matching its topics."""
+
+        deliveries = OrderedDict()
+        topicObservers = self._topicObservers
+
+        for observer in self._allTopicsObservers:
+            deliveries[observer] = list(changes)
+
+        if topicObservers:
+            for change in changes:
+                for observer in topicObservers.get(change[0], ()):
+                    observerChanges = deliveries.get(observer)
+
+                    if observerChanges is None:
+                        observerChanges = deliveries[observer] = []
+
+                    observerChanges.append(change)
+
+        for observer, observerChanges in deliveries.items():
+            observer.update(observerChanges)
@@ -0,0 +1,112 @@
+import pytest
+import colorium.data_binding as data_binding
+import colorium.scene_name_parser as scene_name_parser
+from colorium.asset import CAsset
+from patterns.observerPattern import Observer
+
+
+class Recorder(Observer):
+    def __init__(self):
+        self.changes = []
+
+    def update(self, changes):
+        self.changes.append(changes)
+
+
+class Control(object, data_binding.CBindable):
+    def __init__(self):
+        data_binding.CBindable.__init__(self)
+
+        self._value = None
+        self.values = []
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self.values.append(value)
+        self.notify_property_changed("value", value)
+
+
+def bind_file_names(asset):
+    controls = dict((config.name, Control()) for config in (asset.save_config, asset.publish_config, asset.export_config))
+
+    for config in (asset.save_config, asset.publish_config, asset.export_config):
+        data_binding.bind(controls[config.name], "value", config, "file_name")
+
+    return controls
+
+
+def test_updateManyCoalescesTheUpdates():
+    asset = CAsset(asset_type="mdl", name="tree")
+    controls = bind_file_names(asset)
+    recorder = Recorder()
+    asset.attach(recorder)
+
+    asset.update_many(type="rig", name="hero", has_variant=True, variant=2)
+
+    assert [control.values for name, control in sorted(controls.items())] == [
+        ["rig_hero_02_export"], ["rig_hero_02_publish"], ["rig_hero_02_v001"],
+    ]
+    assert len(recorder.changes) == 1
+    assert sorted(recorder.changes[0]) == [("has_variant", True), ("name", "hero"), ("type", "rig"), ("variant", 2)]
+
+def test_nestedBatchUpdatesFlushOnce():
+    asset = CAsset(asset_type="mdl", name="tree")
+    controls = bind_file_names(asset)
+
+    with asset.batch_update():
+        asset.name = "rock"
+
+        with asset.batch_update():
+            asset.name = "bush"
+
+        assert controls["publish"].values == []
+
+        asset.type = "prx"
+
+    assert controls["publish"].values == ["prx_bush_publish"]
+
+def test_batchUpdateFlushesOnException():
+    asset = CAsset(asset_type="mdl", name="tree")
+    controls = bind_file_names(asset)
+
+    with pytest.raises(RuntimeError):
+        with asset.batch_update():
+            asset.name = "rock"
+
+            raise RuntimeError("Interrupted")
+
+    assert controls["publish"].values == ["mdl_rock_publish"]
+
+    asset.name = "bush"
+
+    assert controls["publish"].values == ["mdl_rock_publish", "mdl_bush_publish"]
+
+def test_updateManyRejectsUnknownFields():
+    asset = CAsset(asset_type="mdl", name="tree")
+
+    with pytest.raises(AttributeError):
+        asset.update_many(name="rock", colour="green")
+
+    assert asset.name == "tree"
+
+def test_parseStringUpdatesAnAssetInOneBatch():
+    asset = CAsset()
+    controls = bind_file_names(asset)
+
+    assert scene_name_parser.parse_string_to_asset("/scenes/rig_hero_02_010-020_v004.ma", asset) is asset
+    assert controls["save"].values == ["rig_hero_02_010-020_v004"]
+
+def test_flushedFieldsOnlyUpdateTheDependentConfigurations():
+    asset = CAsset(asset_type="mdl", name="tree")
+    controls = bind_file_names(asset)
+
+    with asset.batch_update():
+        asset.version = 3
+        asset.has_version = True
+
+    assert [(name, control.values) for name, control in sorted(controls.items())] == [("export", []), ("publish", []), ("save", ["mdl_tree_v003"])]
@@ -0,0 +1,34 @@
+import pytest
+import colorium.asset_type_definition as asset_type_definition
+from colorium.asset_type_definition import CAssetTypeDefinition
+
+
+def test_getTypeByCodeOrName():
+    assert asset_type_definition.get_type("mdl") is asset_type_definition.MODEL_TYPE
+    assert asset_type_definition.get_type("Model") is asset_type_definition.MODEL_TYPE
+    assert asset_type_definition.get_type("unknown") is asset_type_definition.NONE_TYPE
+
+def test_codesAndNamesAreCached():
+    assert asset_type_definition.codes() is asset_type_definition.codes()
+    assert asset_type_definition.names()[1] == "Model"
+
+def test_registerTypeInvalidatesViews():
+    codes = asset_type_definition.codes()
+    custom_type = asset_type_definition.register_type(CAssetTypeDefinition(code="fx_", name="Effect"))
+
+    try:
+        assert asset_type_definition.codes() is not codes
+        assert "fx_" in asset_type_definition.codes()
+        assert asset_type_definition.get_type_by_name("Effect") is custom_type
+    finally:
+        asset_type_definition.ASSET_TYPES.remove(custom_type)
+        asset_type_definition.invalidate_registry()
+
+    assert asset_type_definition.get_type("fx_") is asset_type_definition.NONE_TYPE
+
+def test_nameConverter():
+    converter = asset_type_definition.name_converter()
+
+    assert converter.convert("mdl") == "Model"
+    assert converter.convert_back("Model") == "mdl"
+    assert asset_type_definition.name_converter() is converter
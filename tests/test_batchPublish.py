@@ -0,0 +1,49 @@
+import colorium.batch_publish as batch_publish
+
+
+class FakeCmds(object):
+    def __init__(self):
+        self.selection = ["|world|previous"]
+        self.calls = []
+
+    def ls(self, sl=False):
+        return list(self.selection)
+
+    def select(self, nodes=None, r=False, cl=False):
+        self.selection = [] if cl else list(nodes)
+
+    def file(self, path, es=False, typ=None):
+        if "broken" in path:
+            raise RuntimeError("Disk full")
+
+        self.calls.append((path, list(self.selection)))
+
+
+def test_nodeShortName():
+    assert batch_publish.node_short_name("|set|props:mdl_chair_01") == "mdl_chair_01"
+    assert batch_publish.node_short_name("mdl_chair_01") == "mdl_chair_01"
+
+def test_planGroupsNodesSharingATarget():
+    jobs, unparseable = batch_publish.plan(["|set|a:mdl_chair_01", "prx_rock_02", "|set|b:mdl_chair_01", "pCube1"])
+
+    assert [(job.file_name, job.nodes) for job in jobs] == [
+        ("mdl_chair_01_publish", ["|set|a:mdl_chair_01", "|set|b:mdl_chair_01"]),
+        ("prx_rock_02_publish", ["prx_rock_02"]),
+    ]
+    assert unparseable == ["pCube1"]
+
+def test_publishExportsOncePerGroup(monkeypatch):
+    fake_cmds = FakeCmds()
+    monkeypatch.setattr(batch_publish, "cmds", fake_cmds)
+    monkeypatch.setattr(batch_publish.command, "cmds", fake_cmds)
+    monkeypatch.setattr(batch_publish.command, "MIDDLEWARES", [])
+    monkeypatch.setattr(batch_publish.command.os, "makedirs", lambda path: None)
+    progress = []
+
+    results = batch_publish.publish(["a:mdl_chair_01", "b:mdl_chair_01", "mdl_broken_01", "pCube1"], progress=lambda *args: progress.append(args[:2]))
+
+    assert [(result.node, result.success) for result in results] == [("pCube1", False), ("a:mdl_chair_01", True), ("b:mdl_chair_01", True), ("mdl_broken_01", False)]
+    assert results[3].error == "Disk full"
+    assert [(path.rpartition("/")[2], nodes) for path, nodes in fake_cmds.calls] == [("mdl_chair_01_publish", ["a:mdl_chair_01", "b:mdl_chair_01"])]
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert fake_cmds.selection == ["|world|previous"]
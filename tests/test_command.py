@@ -0,0 +1,123 @@
+import json
+import pytest
+import colorium.command as command
+
+
+def test_getCommand():
+    save_command = command.get_command("save", "Maya Ascii")
+
+    assert save_command.action == "save"
+    assert save_command.name == "Maya Ascii"
+    assert command.get_command("save", "Unknown") is None
+
+def test_getCommandsByName():
+    commands = command.get_commands_by_name("Maya Binary")
+
+    assert all(isinstance(each, command.CCommand) for each in commands)
+    assert set(each.action for each in commands) == set(["open", "delete", "save", "publish", "export"])
+
+def test_getCommandNamesByAction():
+    names = command.get_command_names_by_action("publish")
+
+    assert names == ("Maya Ascii", "Maya Binary", "Geometry Cache", "Geometry Cache (Chunked)", "Geometry Cache (Chunked, Run-Up)")
+    assert command.get_command_names_by_action("publish") is names
+
+def test_registerCommandFirstWins():
+    first = command.get_command("open", "Explorer")
+
+    assert command.register_command(command.CConcreteCommand("open", "Explorer", None)) is first
+
+def test_folderPluginsAreLoadedLazily(tmpdir, monkeypatch):
+    tmpdir.join("colorium_test_plugin.py").write("CALLS = []\n\ndef export_usd(config):\n    CALLS.append(config)\n")
+    tmpdir.join(command.PLUGIN_MANIFEST_FILE_NAME).write(json.dumps({"export:USD": "colorium_test_plugin:export_usd"}))
+    monkeypatch.setattr(command.settings, "COMMAND_PLUGINS_FOLDER", str(tmpdir))
+    monkeypatch.setattr(command, "_PLUGINS_LOADED", False)
+    monkeypatch.setattr(command, "MIDDLEWARES", [])
+
+    usd_command = command.get_command("export", "USD")
+
+    assert "USD" in command.get_command_names_by_action("export")
+    assert not usd_command.loaded
+
+    usd_command.execute("config")
+
+    import colorium_test_plugin
+
+    assert usd_command.loaded
+    assert colorium_test_plugin.CALLS == ["config"]
+
+def test_middlewaresWrapTheExecution(monkeypatch):
+    monkeypatch.setattr(command, "MIDDLEWARES", [])
+    calls = []
+
+    def outer(cmd, config, call_next):
+        calls.append("outer before")
+        result = call_next()
+        calls.append("outer after")
+
+        return result
+
+    def inner(cmd, config, call_next):
+        calls.append("inner " + cmd.name)
+
+        return call_next() * 2
+
+    command.add_middleware(outer)
+    command.add_middleware(inner)
+    test_command = command.CConcreteCommand("test", "Test", lambda config: calls.append(config) or 21)
+
+    assert test_command.execute("config") == 42
+    assert calls == ["outer before", "inner Test", "config", "outer after"]
+
+    command.remove_middleware(outer)
+    command.remove_middleware(inner)
+    assert command.MIDDLEWARES == []
+
+def test_mayaCommandRunsThroughMiddlewares(tmpdir, monkeypatch):
+    calls = []
+
+    class FakeCmds(object):
+        def ls(self, sl=False):
+            return ["mdl_tree_01"]
+
+        def file(self, *args, **kwargs):
+            calls.append((args, kwargs))
+
+    class Config(object):
+        path = str(tmpdir) + "/"
+        file_name = "mdl_tree_01_publish"
+
+    monkeypatch.setattr(command, "cmds", FakeCmds())
+    monkeypatch.setattr(command, "MIDDLEWARES", [lambda cmd, config, call_next: calls.append(cmd.name) or call_next()])
+
+    command.get_command("publish", "Maya Ascii").execute(Config())
+
+    assert calls == ["Maya Ascii", ((Config.path + Config.file_name,), {"es": True, "typ": "mayaAscii"})]
+
+def test_brokenManifestDoesntPreventLoading(tmpdir, monkeypatch):
+    tmpdir.join(command.PLUGIN_MANIFEST_FILE_NAME).write("{not json")
+    monkeypatch.setattr(command.settings, "COMMAND_PLUGINS_FOLDER", str(tmpdir))
+    monkeypatch.setattr(command, "_PLUGINS_LOADED", False)
+
+    assert command.get_command("save", "Maya Ascii") is not None
+
+def test_invalidManifestEntriesAreSkipped(tmpdir, monkeypatch):
+    def fail():
+        raise RuntimeError("Broken distribution")
+
+    manifest = {"export:Manifest Test": "colorium_test_plugin:export", "Manifest Test": "colorium_test_plugin:export", "export:Bad Target": 3}
+    tmpdir.join(command.PLUGIN_MANIFEST_FILE_NAME).write(json.dumps(manifest))
+    monkeypatch.setattr(command.settings, "COMMAND_PLUGINS_FOLDER", str(tmpdir))
+    monkeypatch.setattr(command, "_PLUGINS_LOADED", False)
+    monkeypatch.setattr(command, "__discover_entry_point_commands", fail)
+
+    assert command.get_command("export", "Manifest Test") is not None
+    assert command.get_command("export", "Bad Target") is None
+    assert "" not in command.get_command_names_by_action("Manifest Test")
+
+def test_parseCommandKey():
+    assert command.parse_command_key("export:USD (Layered)") == ("export", "USD (Layered)")
+
+    for key in ("USD", ":USD", "export:"):
+        with pytest.raises(ValueError):
+            command.parse_command_key(key)
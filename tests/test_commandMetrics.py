@@ -0,0 +1,88 @@
+import json
+import pytest
+import colorium.command_metrics as command_metrics
+
+
+class Command(object):
+    action = "publish"
+    name = "Maya Ascii"
+
+
+class Config(object):
+    def __init__(self, path, file_name):
+        self.path = path
+        self.file_name = file_name
+
+
+def test_middlewareAppendsRecords(tmpdir):
+    log_path = str(tmpdir.join("logs", "metrics.jsonl"))
+    config = Config(str(tmpdir) + "/", "mdl_chair")
+    middleware = command_metrics.CMetricsMiddleware(log_path)
+
+    def write_file():
+        tmpdir.join("mdl_chair.ma").write("x" * 100)
+
+        return "done"
+
+    assert middleware(Command(), config, write_file) == "done"
+
+    with pytest.raises(ValueError):
+        middleware(Command(), config, lambda: int("not a number"))
+
+    records = list(command_metrics.read_log(log_path))
+
+    assert [record["status"] for record in records] == ["ok", "error"]
+    assert records[0]["bytes_written"] == 100
+    assert records[0]["action"] == "publish"
+    assert records[0]["wall"] >= 0
+
+def test_middlewareDumpsProfiles(tmpdir):
+    middleware = command_metrics.CMetricsMiddleware(str(tmpdir.join("metrics.jsonl")), str(tmpdir.join("profiles")))
+
+    middleware(Command(), Config(None, None), lambda: None)
+
+    assert len(tmpdir.join("profiles").listdir()) == 1
+
+def test_summarize():
+    records = [
+        {"action": "save", "command": "Maya Binary", "wall": wall, "cpu": 0.5, "bytes_written": 10, "status": "ok"}
+        for wall in (1.0, 2.0, 3.0, 4.0)
+    ]
+    records.append({"action": "export", "command": "FBX", "wall": 1.0, "status": "error"})
+
+    summaries = command_metrics.summarize(records)
+
+    assert [(summary["action"], summary["count"], summary["errors"]) for summary in summaries] == [("save", 4, 0), ("export", 1, 1)]
+    assert summaries[0]["mean"] == 2.5
+    assert summaries[0]["p50"] == 2.0
+    assert summaries[0]["max"] == 4.0
+    assert summaries[0]["bytes_written"] == 40
+    assert "Maya Binary" in command_metrics.format_summaries(summaries)
+
+def test_readLogSkipsPartialLines(tmpdir):
+    log = tmpdir.join("metrics.jsonl")
+    log.write(json.dumps({"wall": 1.0}) + "\n{\"wall\": 2\n")
+
+    assert list(command_metrics.read_log(str(log))) == [{"wall": 1.0}]
+
+def test_bytesWrittenOnlyCountsTheOutputFiles(tmpdir):
+    config = Config(str(tmpdir), "mdl_chair_publish")
+    tmpdir.join("mdl_chair_publish.ma").write("x" * 10)
+    tmpdir.join("mdl_chair_publish.xml").write("x" * 5)
+    tmpdir.join("mdl_chair_publish_old.ma").write("x" * 1000)
+    tmpdir.join("mdl_chair_publish.xml").setmtime(1000.5)
+
+    assert command_metrics.get_bytes_written(config, 0) == 15
+    assert command_metrics.get_bytes_written(config, 1000.7) == 10
+
+def test_metricsFailuresDontChangeTheCommandOutcome(tmpdir, monkeypatch):
+    def fail(config, since):
+        raise OSError("Permission denied")
+
+    monkeypatch.setattr(command_metrics, "get_bytes_written", fail)
+    middleware = command_metrics.CMetricsMiddleware(str(tmpdir.join("metrics.jsonl")))
+
+    assert middleware(Command(), Config(str(tmpdir), "mdl_chair"), lambda: "done") == "done"
+
+    with pytest.raises(ValueError):
+        middleware(Command(), Config(str(tmpdir), "mdl_chair"), lambda: int("not a number"))
@@ -0,0 +1,143 @@
+import colorium.data_binding as data_binding
+from colorium.asset import CAsset
+from colorium.configuration import CConfiguration
+from patterns.observerPattern import Observer
+
+
+class Bindable(object, data_binding.CBindable):
+    def __init__(self):
+        data_binding.CBindable.__init__(self)
+
+        self._value = None
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self.notify_property_changed("value", value)
+
+
+class Recorder(Observer):
+    def __init__(self):
+        self.changes = []
+
+    def update(self, changes):
+        self.changes.append(changes)
+
+
+class Asset(object):
+    def __init__(self, name="tree", version=1):
+        self.name = name
+        self.version = version
+
+
+def make_configuration(asset, calls):
+    def generate_file_name(asset):
+        calls.append("file_name")
+
+        return "{}_v{:03d}".format(asset.name, asset.version)
+
+    def generate_path(asset):
+        calls.append("path")
+
+        return "/assets/{}/".format(asset.name)
+
+    generate_file_name.fields = ("name", "version")
+    generate_path.fields = ("name",)
+
+    return CConfiguration("save", asset, generate_file_name, generate_path, None)
+
+
+def test_fieldChangesMarkOnlyTheDependentPropertiesOutdated():
+    calls = []
+    asset = Asset()
+    config = make_configuration(asset, calls)
+
+    assert (config.file_name, config.path) == ("tree_v001", "/assets/tree/")
+
+    del calls[:]
+    asset.version = 2
+    config.update("version")
+
+    assert (config.file_name, config.path) == ("tree_v002", "/assets/tree/")
+    assert calls == ["file_name"]
+
+def test_updateIsLazy():
+    calls = []
+    asset = Asset()
+    config = make_configuration(asset, calls)
+
+    for version in range(2, 10):
+        asset.version = version
+        config.update("version")
+
+    assert calls == []
+    assert config.file_name == "tree_v009"
+    assert config.file_name == "tree_v009"
+    assert calls == ["file_name"]
+
+def test_boundPropertiesAreUpdatedEagerly():
+    calls = []
+    asset = Asset()
+    config = make_configuration(asset, calls)
+    control = Bindable()
+    data_binding.bind(control, "value", config, "file_name")
+
+    asset.version = 2
+    config.update("version")
+
+    assert calls == ["file_name"]
+    assert control.value == "tree_v002"
+
+def test_overriddenFileNameAndPathAreKept():
+    config = CAsset(asset_type="mdl", name="tree").publish_config
+
+    config.file_name_overridden = True
+    config.file_name = "custom"
+    config.path_overridden = True
+    config.path = "/custom/"
+    config.asset.name = "rock"
+
+    assert (config.file_name, config.path) == ("custom", "/custom/")
+
+    config.file_name_overridden = False
+
+    assert config.file_name == "mdl_rock_publish"
+    assert config.path == "/custom/"
+
+def test_fileNameSetWithoutOverrideIsKeptUntilTheAssetChanges():
+    config = CAsset(asset_type="mdl", name="tree").publish_config
+
+    config.file_name = "custom"
+
+    assert config.file_name == "custom"
+
+    config.asset.name = "rock"
+
+    assert config.file_name == "mdl_rock_publish"
+
+def test_assetFieldChangeOnlyUpdatesTheDependentConfigurations():
+    asset = CAsset(asset_type="mdl", name="tree")
+    recorders = {}
+    controls = []
+
+    for config in (asset.save_config, asset.publish_config, asset.export_config):
+        for prop in ("file_name", "path"):
+            controls.append(Bindable())
+            data_binding.bind(controls[-1], "value", config, prop)
+            recorders[config.name, prop] = Recorder()
+            config.attach(recorders[config.name, prop], [prop])
+
+    asset.version = 2
+
+    assert [key for key, recorder in sorted(recorders.items()) if recorder.changes] == [("save", "file_name")]
+    assert recorders["save", "file_name"].changes == [[("file_name", "mdl_tree_v002")]]
+
+    asset.name = "rock"
+
+    assert [key for key, recorder in sorted(recorders.items()) if recorder.changes] == [
+        ("export", "file_name"), ("export", "path"), ("publish", "file_name"), ("save", "file_name"), ("save", "path"),
+    ]
@@ -0,0 +1,264 @@
+import gc
+import weakref
+import pytest
+import colorium.data_binding as data_binding
+
+
+class Bindable(object, data_binding.CBindable):
+    def __init__(self, value=None):
+        data_binding.CBindable.__init__(self)
+
+        self._value = value
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self.notify_property_changed("value", value)
+
+
+def test_bindPropagatesBothWays():
+    model = Bindable(1)
+    control = Bindable(1)
+    data_binding.bind(control, "value", model, "value")
+
+    model.value = 2
+    assert control.value == 2
+
+    control.value = 3
+    assert model.value == 3
+
+def test_addBindingIgnoresDuplicates():
+    model = Bindable()
+    control = Bindable()
+
+    data_binding.bind(control, "value", model, "value")
+    data_binding.bind(control, "value", model, "value")
+
+    assert model.get_binding_count() == 1
+    assert len(model.get_bindings("value")) == 1
+
+def test_unbind():
+    model = Bindable(1)
+    control = Bindable(1)
+    data_binding.bind(control, "value", model, "value")
+    data_binding.unbind(control, "value", model, "value")
+
+    model.value = 2
+
+    assert control.value == 1
+    assert not model.is_bound("value")
+
+def test_unbindAll():
+    model = Bindable()
+    controls = [Bindable() for index in range(3)]
+
+    for control in controls:
+        data_binding.bind(control, "value", model, "value")
+
+    data_binding.unbind_all(controls[0])
+
+    assert model.get_binding_count() == 2
+    assert controls[0].get_binding_count() == 0
+
+    data_binding.unbind_all(model)
+
+    assert model.get_binding_count() == 0
+    assert all(control.get_binding_count() == 0 for control in controls)
+
+class DerivedBindable(Bindable):
+    pass
+
+def test_bindInheritedProperty():
+    model = Bindable(1)
+    control = DerivedBindable(1)
+    data_binding.bind(control, "value", model, "value")
+
+    model.value = 2
+
+    assert control.value == 2
+    assert data_binding.is_valid_property(control, "value")
+
+def test_bindInvalidPropertyRaises():
+    with pytest.raises(AttributeError):
+        data_binding.bind(Bindable(), "missing", Bindable(), "value")
+
+    with pytest.raises(AttributeError):
+        data_binding.bind(Bindable(), "notify_property_changed", Bindable(), "value")
+
+    assert not data_binding.is_valid_property(Bindable(), "missing")
+
+class CountingBindable(Bindable):
+    def __init__(self, value=None):
+        super(CountingBindable, self).__init__(value)
+
+        self.set_count = 0
+
+    @Bindable.value.setter
+    def value(self, value):
+        self.set_count += 1
+        Bindable.value.fset(self, value)
+
+def test_unchangedValuesAreNotSet():
+    model = CountingBindable(1)
+    control = CountingBindable(1)
+    data_binding.bind(control, "value", model, "value")
+
+    model.value = 1
+
+    assert control.set_count == 0
+
+def test_propagationStopsOnCycles():
+    objects = [CountingBindable(0) for index in range(3)]
+    data_binding.bind(objects[1], "value", objects[0], "value", two_way=False)
+    data_binding.bind(objects[2], "value", objects[1], "value", two_way=False)
+    data_binding.bind(objects[0], "value", objects[2], "value", two_way=False)
+
+    # NaN is never equal to itself, so only the cycle detection can stop the propagation.
+    objects[0].value = float("nan")
+
+    assert all(obj.value != obj.value for obj in objects)
+    assert [obj.set_count for obj in objects] == [1, 1, 1]
+
+def test_deferredUpdatesAreCoalesced():
+    scheduled = []
+    dispatcher = data_binding.DISPATCHER
+    dispatcher.scheduler = scheduled.append
+
+    try:
+        model = Bindable(0)
+        control = CountingBindable(0)
+        data_binding.bind(control, "value", model, "value", deferred=True)
+
+        for value in range(1, 6):
+            model.value = value
+
+        assert control.value == 0
+        assert dispatcher.pending == 1
+        assert scheduled == [dispatcher.flush]
+
+        scheduled.pop()()
+
+        assert control.value == 5
+        assert control.set_count == 1
+        assert dispatcher.pending == 0
+    finally:
+        dispatcher.scheduler = None
+        dispatcher.clear()
+
+class Binding(object):
+    def __init__(self, key):
+        self.key = key
+        self.values = []
+
+    def update_prop(self, value):
+        self.values.append(value)
+
+
+def test_deferredDispatcherSchedulesAgainAfterAFailure():
+    scheduled = []
+
+    def scheduler(function):
+        if not scheduled:
+            scheduled.append(None)
+            raise RuntimeError("Scheduler unavailable")
+
+        scheduled.append(function)
+
+    dispatcher = data_binding.CDeferredDispatcher(scheduler)
+    binding = Binding("a")
+
+    with pytest.raises(RuntimeError):
+        dispatcher.post(binding, 1)
+
+    dispatcher.post(binding, 2)
+    scheduled.pop()()
+
+    assert binding.values == [2]
+
+def test_deferredDispatcherSchedulesAgainAfterAClear():
+    scheduled = []
+    dispatcher = data_binding.CDeferredDispatcher(scheduled.append)
+    binding = Binding("a")
+
+    dispatcher.post(binding, 1)
+    dispatcher.clear()
+    dispatcher.post(binding, 2)
+
+    assert len(scheduled) == 2
+
+    scheduled.pop()()
+
+    assert binding.values == [2]
+
+def test_closedControlsAreReclaimed():
+    model = Bindable(0)
+    control_refs = []
+
+    for cycle in range(10):
+        controls = [Bindable(0) for index in range(5)]
+
+        for control in controls:
+            data_binding.bind(control, "value", model, "value")
+            control_refs.append(weakref.ref(control))
+
+        model.value = cycle
+
+        del controls, control
+        gc.collect()
+
+        assert model.get_binding_count() == 0
+        assert model.get_binding_sources() == []
+
+    assert all(control_ref() is None for control_ref in control_refs)
+
+def test_converterConvertsBothWays():
+    model = Bindable("mdl")
+    control = Bindable("Model")
+    converter = data_binding.CMappingConverter({"mdl": "Model", "rig": "Rig"})
+    data_binding.bind(control, "value", model, "value", converter=converter)
+
+    control.value = "Rig"
+    assert model.value == "rig"
+
+    model.value = "mdl"
+    assert control.value == "Model"
+
+    model.value = "xyz"
+    assert control.value == "xyz"
+
+def test_profilerRecordsUpdatesAndCascades():
+    model = Bindable(1)
+    control = Bindable(1)
+    preview = Bindable(1)
+    data_binding.bind(control, "value", model, "value")
+    data_binding.bind(preview, "value", control, "value", two_way=False)
+
+    with data_binding.CBindingProfiler() as profiler:
+        model.value = 2
+
+    data = profiler.to_dict()
+    assert data["notifications"]["Bindable.value"]["count"] == 2
+    assert data["bindings"]["Bindable.value -> Bindable.value"]["count"] == 3
+    assert data["cascades"]["Bindable.value"] == {"count": 1, "updates": 3, "max_updates": 3, "max_depth": 2}
+    assert "Bindable.value" in profiler.report()
+    assert preview.value == 2
+
+    model.value = 3
+    assert profiler.to_dict()["cascades"]["Bindable.value"]["count"] == 1
+
+def test_traceDoesNotSetAnything():
+    model = Bindable(1)
+    control = Bindable(1)
+    preview = Bindable(1)
+    data_binding.bind(control, "value", model, "value")
+    data_binding.bind(preview, "value", control, "value", deferred=True)
+
+    steps = data_binding.trace(model, "value")
+
+    assert [(step.depth, step.target, step.kind) for step in steps] == [(0, control, "binding"), (1, preview, "deferred")]
+    assert control.value == 1
+    assert "Bindable.value -> Bindable.value (deferred)" in data_binding.format_trace(steps)
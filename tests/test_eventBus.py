@@ -0,0 +1,93 @@
+import threading
+import pytest
+from patterns.eventBus import queue
+from patterns.eventBus import EventBus
+from patterns.observerPattern import Observer
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.calls = []
+
+    def update(self, *args):
+        self.calls.append(args[0])
+
+
+def test_postFromThreadsAndFlush():
+    bus = EventBus()
+    recorder = RecordingObserver()
+    bus.attach(recorder, topics=["published"])
+
+    threads = [threading.Thread(target=bus.post, args=("published", index)) for index in range(10)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    bus.post("ignored")
+
+    assert recorder.calls == []
+    assert bus.flush() == 11
+    assert sorted(payload for topic, payload in recorder.calls[0]) == list(range(10))
+
+def test_executorIsCalledOncePerFlush():
+    flushes = []
+    bus = EventBus(executor=flushes.append)
+    recorder = RecordingObserver()
+    bus.attach(recorder)
+
+    bus.post("published", 1)
+    bus.post("published", 1)
+
+    assert len(flushes) == 1
+
+    flushes.pop()()
+
+    assert recorder.calls == [[("published", 1), ("published", 1)]]
+
+    bus.post("published", 2)
+
+    assert len(flushes) == 1
+
+def test_executorIsCalledAgainAfterAFailure():
+    flushes = []
+
+    def executor(flush):
+        if not flushes:
+            flushes.append(None)
+            raise RuntimeError("Main thread unavailable")
+
+        flushes.append(flush)
+
+    bus = EventBus(executor=executor)
+    recorder = RecordingObserver()
+    bus.attach(recorder)
+
+    with pytest.raises(RuntimeError):
+        bus.post("published", 1)
+
+    bus.post("published", 2)
+
+    assert flushes == [None, bus.flush]
+
+    flushes.pop()()
+
+    assert recorder.calls == [[("published", 1), ("published", 2)]]
+
+def test_relay():
+    flushed = threading.Event()
+    bus = EventBus(executor=lambda flush: flushed.set())
+    recorder = RecordingObserver()
+    bus.attach(recorder)
+    source = queue.Queue()
+
+    thread = bus.relay(source)
+    source.put(("catalog_updated", "models"))
+    source.put(None)
+    thread.join(5)
+
+    assert flushed.wait(5)
+    bus.flush()
+    assert recorder.calls == [[("catalog_updated", "models")]]
@@ -0,0 +1,128 @@
+import pytest
+import colorium.geometry_cache as geometry_cache
+import colorium.worker as worker
+from colorium.batch_publish import CPublishJob
+from colorium.worker_pool import CWorkerError
+
+
+def test_splitFrameRange():
+    assert geometry_cache.split_frame_range(1, 250, 100) == [(1, 100), (101, 200), (201, 250)]
+    assert geometry_cache.split_frame_range(1.0, 1.0, 100) == [(1, 1)]
+    assert geometry_cache.split_frame_range(10, 1, 100) == []
+
+    with pytest.raises(ValueError):
+        geometry_cache.split_frame_range(1, 10, 0)
+
+DESCRIPTION = {"name": "publish", "file_name": "sim_cloth_010-020_publish", "path": "/caches/", "command": {"action": "publish", "name": "Geometry Cache (Chunked)"}}
+
+def test_planChunkJobs():
+    jobs = geometry_cache.plan_chunk_jobs(DESCRIPTION, "/tmp/snapshot.mb", ["|cloth|clothShape"], 1, 150, 100)
+
+    assert [job["frame_range"] for job in jobs] == [[1, 100], [101, 150]]
+    assert [job["config"]["file_name"] for job in jobs] == ["sim_cloth_010-020_publish_chunk000", "sim_cloth_010-020_publish_chunk001"]
+    assert all(job["config"]["command"] == geometry_cache.CHUNK_COMMAND for job in jobs)
+    assert "run_up_start" not in jobs[1]
+    assert [job.get("run_up_start") for job in geometry_cache.plan_chunk_jobs(DESCRIPTION, None, ["clothShape"], 1, 150, 100, run_up=True)] == [None, 1]
+    assert DESCRIPTION["file_name"] == "sim_cloth_010-020_publish"
+
+def test_workerCachesChunk(tmpdir):
+    calls = []
+    frames = []
+
+    class Cmds(object):
+        def file(self, *args, **kwargs):
+            return None
+
+        def currentTime(self, frame, e=False):
+            frames.append(frame)
+
+        def cacheFile(self, **kwargs):
+            calls.append(kwargs)
+
+    job = geometry_cache.plan_chunk_jobs(dict(DESCRIPTION, path=str(tmpdir) + "/"), None, ["clothShape"], 1, 150, 100, run_up=True)[1]
+
+    assert worker.run_job(job, Cmds())["status"] == "ok"
+    assert calls[0]["st"] == 101 and calls[0]["et"] == 150
+    assert calls[0]["f"] == "sim_cloth_010-020_publish_chunk001"
+    assert frames == list(range(1, 101))
+
+
+class Future(object):
+    def __init__(self, error=None):
+        self.error = error
+
+    def add_done_callback(self, callback):
+        callback(self)
+
+    def wait(self, timeout=None):
+        if self.error:
+            raise CWorkerError(self.error)
+
+        return {"status": "ok"}
+
+
+class Pool(object):
+    def __init__(self, failing_frame=None):
+        self.jobs = []
+        self.failing_frame = failing_frame
+
+    def submit(self, job):
+        self.jobs.append(job)
+
+        return Future("Disk full" if job["frame_range"][0] == self.failing_frame else None)
+
+
+class Config(object):
+    def __init__(self, path):
+        self.path = path
+        self.file_name = DESCRIPTION["file_name"]
+
+    def to_description(self):
+        return dict(DESCRIPTION, path=self.path)
+
+
+class Cmds(object):
+    def file(self, *args, **kwargs):
+        return "/scenes/sim_cloth_010-020_v001.mb" if kwargs.get("q") else None
+
+
+def test_publishChunkedWritesIndex(tmpdir):
+    pool = Pool()
+
+    index_path = geometry_cache.publish_chunked(Cmds(), Config(str(tmpdir)), ["clothShape"], 1, 250, 100, pool)
+    index = geometry_cache.read_index(index_path)
+
+    assert len(pool.jobs) == 3
+    assert (index["start"], index["end"]) == (1, 250)
+    assert geometry_cache.find_chunk(index, 150)["xml"] == "sim_cloth_010-020_publish_chunk001.xml"
+    assert geometry_cache.find_chunk(index, 251) is None
+
+def test_publishChunkedReportsFailedChunks(tmpdir):
+    with pytest.raises(CWorkerError) as error:
+        geometry_cache.publish_chunked(Cmds(), Config(str(tmpdir)), ["clothShape"], 1, 250, 100, Pool(failing_frame=101))
+
+    assert "frames 101-200 : Disk full" in str(error.value)
+    assert not tmpdir.join(DESCRIPTION["file_name"] + geometry_cache.INDEX_SUFFIX).check()
+
+def test_publishChunkedRemovesTheSnapshot(tmpdir, monkeypatch):
+    snapshot = tmpdir.join("snapshot.mb")
+
+    def save_snapshot(cmds):
+        snapshot.write("")
+
+        return str(snapshot)
+
+    monkeypatch.setattr(geometry_cache.worker_pool, "save_snapshot", save_snapshot)
+
+    with pytest.raises(CWorkerError):
+        geometry_cache.publish_chunked(Cmds(), Config(str(tmpdir)), ["clothShape"], 1, 250, 100, Pool(failing_frame=1))
+
+    assert not snapshot.check()
+
+def test_publishChunkedRejectsBatchPublishJobs(tmpdir):
+    job = CPublishJob(None, str(tmpdir), "mdl_chair_01_publish", ["mdl_chair_01"])
+
+    with pytest.raises(TypeError) as error:
+        geometry_cache.publish_chunked(Cmds(), job, ["clothShape"], 1, 250, 100, Pool())
+
+    assert "not a CPublishJob" in str(error.value)
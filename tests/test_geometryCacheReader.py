@@ -0,0 +1,132 @@
+import struct
+import pytest
+import colorium.geometry_cache_reader as geometry_cache_reader
+
+numpy = pytest.importorskip("numpy")
+
+
+XML = """<?xml version="1.0"?>
+<Autodesk_Cache_File>
+  <cacheType Type="{cache_type}" Format="{format}"/>
+  <time Range="250-1000"/>
+  <cacheTimePerFrame TimePerFrame="250"/>
+  <cacheVersion Version="2.0"/>
+  <Channels>
+    <channel0 ChannelName="clothShape" ChannelType="FloatVectorArray" ChannelInterpretation="positions" SamplingType="Regular" SamplingRate="250" StartTime="250" EndTime="1000"/>
+  </Channels>
+</Autodesk_Cache_File>
+"""
+
+
+def chunk(tag, body, wide):
+    alignment = 8 if wide else 4
+    header = tag + (b"\0" * 4 + struct.pack(">Q", len(body)) if wide else struct.pack(">I", len(body)))
+    padding = b"\0" * (-len(body) % alignment)
+
+    return header + body + padding
+
+def group(form_type, children, wide):
+    return chunk(b"FOR8" if wide else b"FOR4", form_type + (b"\0" * 4 if wide else b"") + b"".join(children), wide)
+
+def write_data_file(path, samples, wide=False, tag=b"FVCA"):
+    """Write a cache data file with samples of (time, points) for the clothShape channel, stored in the type of the data tag."""
+
+    data = group(b"CACH", [
+        chunk(b"VRSN", b"0.1\0", wide),
+        chunk(b"STIM", struct.pack(">i", samples[0][0]), wide),
+        chunk(b"ETIM", struct.pack(">i", samples[-1][0]), wide),
+    ], wide)
+
+    for time, points in samples:
+        points = numpy.asarray(points, dtype=geometry_cache_reader.DATA_TYPES[tag][0])
+        data += group(b"MYCH", [
+            chunk(b"TIME", struct.pack(">i", time), wide),
+            chunk(b"CHNM", b"clothShape\0", wide),
+            chunk(b"SIZE", struct.pack(">I", len(points)), wide),
+            chunk(tag, points.tobytes(), wide),
+        ], wide)
+
+    path.write_binary(data)
+
+def make_points(frame):
+    return [[frame, 0.0, 0.0], [0.0, frame, 0.0], [0.0, 0.0, -frame]]
+
+@pytest.mark.parametrize("file_format", ["mcc", "mcx"])
+def test_readOneFileCache(tmpdir, file_format):
+    tmpdir.join("cloth.xml").write(XML.format(cache_type="OneFile", format=file_format))
+    write_data_file(tmpdir.join("cloth." + file_format), [(frame * 250, make_points(frame)) for frame in range(1, 5)], wide=file_format == "mcx")
+
+    with geometry_cache_reader.CGeometryCache(str(tmpdir.join("cloth.xml"))) as cache:
+        assert cache.channels == ["clothShape"]
+        assert cache.get_frames() == [1.0, 2.0, 3.0, 4.0]
+
+        points = cache.get_points(3)
+
+        assert points.shape == (3, 3)
+        assert not points.flags.owndata
+        assert points.tolist() == make_points(3)
+        assert geometry_cache_reader.check_frame_count(cache) == []
+        assert geometry_cache_reader.check_frame_count(cache, 1, 6) == [5, 6]
+
+        minimum, maximum = geometry_cache_reader.cache_bounding_box(cache)
+
+        assert minimum.tolist() == [0.0, 0.0, -4.0]
+        assert maximum.tolist() == [4.0, 4.0, 0.0]
+
+@pytest.mark.parametrize("file_format", ["mcc", "mcx"])
+def test_readOneFilePerFrameCache(tmpdir, file_format):
+    tmpdir.join("cloth.xml").write(XML.format(cache_type="OneFilePerFrame", format=file_format))
+
+    for frame in (1, 2, 3, 10):
+        write_data_file(tmpdir.join("clothFrame{}.{}".format(frame, file_format)), [(frame * 250, make_points(frame))], wide=file_format == "mcx")
+
+    with geometry_cache_reader.CGeometryCache(str(tmpdir.join("cloth.xml"))) as cache:
+        assert cache.get_frames() == [1.0, 2.0, 3.0, 10.0]
+        assert cache.get_points(10).tolist() == make_points(10)
+        assert geometry_cache_reader.check_frame_count(cache) == [4]
+
+def test_findNanAndExplodedPoints(tmpdir):
+    tmpdir.join("cloth.xml").write(XML.format(cache_type="OneFile", format="mcc"))
+    frames = [make_points(1), make_points(2), [[float("nan"), 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, -3.0]], [[4.0, 0.0, 0.0], [0.0, 4000.0, 0.0], [0.0, 0.0, -4.0]]]
+    write_data_file(tmpdir.join("cloth.mcc"), [(index * 250 + 250, points) for index, points in enumerate(frames)])
+
+    with geometry_cache_reader.CGeometryCache(str(tmpdir.join("cloth.xml"))) as cache:
+        assert geometry_cache_reader.find_nan_frames(cache) == [3.0]
+        assert geometry_cache_reader.find_exploded_points(cache, 100.0) == [(4.0, 1)]
+
+@pytest.mark.parametrize("tag, points", [
+    (b"DVCA", [[0.1, 0.2, 0.3], [1e-300, 2.0, 3.0]]),
+    (b"FBCA", [0.5, 1.5, 2.5]),
+    (b"DBLA", [0.1, 1e-300]),
+])
+@pytest.mark.parametrize("file_format", ["mcc", "mcx"])
+def test_readChannelTypes(tmpdir, file_format, tag, points):
+    write_data_file(tmpdir.join("cloth." + file_format), [(250, points)], wide=file_format == "mcx", tag=tag)
+
+    with geometry_cache_reader.CCacheDataFile(str(tmpdir.join("cloth." + file_format))) as data_file:
+        channel_points = data_file.get_points(250, "clothShape")
+
+        assert channel_points.dtype == numpy.dtype(geometry_cache_reader.DATA_TYPES[tag][0])
+        assert channel_points.tolist() == points
+
+@pytest.mark.parametrize("content", [b"", b"RIFF" + b"\0" * 12])
+def test_invalidDataFileRaises(tmpdir, content):
+    tmpdir.join("cloth.mcc").write_binary(content)
+
+    with pytest.raises(geometry_cache_reader.CCacheError):
+        geometry_cache_reader.CCacheDataFile(str(tmpdir.join("cloth.mcc")))
+
+def test_pointsStayValidAfterClose(tmpdir):
+    tmpdir.join("cloth.xml").write(XML.format(cache_type="OneFile", format="mcc"))
+    write_data_file(tmpdir.join("cloth.mcc"), [(frame * 250, make_points(frame)) for frame in range(1, 5)])
+
+    with geometry_cache_reader.CGeometryCache(str(tmpdir.join("cloth.xml"))) as cache:
+        frames = [points for frame, points in cache.iter_points()]
+
+    assert [points.tolist() for points in frames] == [make_points(frame) for frame in range(1, 5)]
+
+    data_file = geometry_cache_reader.CCacheDataFile(str(tmpdir.join("cloth.mcc")))
+    data_file.close()
+
+    with pytest.raises(geometry_cache_reader.CCacheError):
+        data_file.get_points(250, "clothShape")
@@ -0,0 +1,113 @@
+import pytest
+from colorium.naming_convention import CNamingConvention
+import colorium.naming_convention as naming_convention_module
+from colorium.asset_record import CAssetRecord
+
+
+naming_convention = CNamingConvention()
+
+def test_parseNameWithAllVariables():
+    parsed_name = naming_convention.parse_name("anm_bob_02_010-020_v003.mb")
+
+    assert parsed_name == ("anm", "bob", 2, 10, 20, 3)
+    assert parsed_name.has_variant and parsed_name.has_scene and parsed_name.has_shot and parsed_name.has_version
+
+def test_parseNameWithoutOptionalVariables():
+    parsed_name = naming_convention.parse_name("mdl_tree_v001.ma")
+
+    assert parsed_name == ("mdl", "tree", None, None, None, 1)
+    assert not parsed_name.has_variant
+
+def test_parseNameWithSceneOnly():
+    parsed_name = naming_convention.parse_name("lay_forest_120_publish.ma")
+
+    assert parsed_name.scene == 120
+    assert parsed_name.shot is None
+    assert parsed_name.version is None
+
+def test_parseNameMatchesPerVariableSearch():
+    name = "anm_bob_02_010-020_v003.mb"
+    parsed_name = naming_convention.parse_name(name)
+
+    assert parsed_name.type == naming_convention.search_type_in_name(name)
+    assert parsed_name.name == naming_convention.search_name_in_name(name)
+    assert parsed_name.variant == int(naming_convention.search_variant_in_name(name))
+    assert parsed_name.scene == int(naming_convention.search_scene_in_name(name))
+    assert parsed_name.shot == int(naming_convention.search_shot_in_name(name))
+    assert parsed_name.version == int(naming_convention.seach_version_in_name(name)[1:])
+
+def test_parseNameUsesOnlyTheFileNamePattern():
+    custom_convention = CNamingConvention(variant_pattern=r"(?<=_)\d{3}(?=_)", file_name_pattern=r"(?P<type>[a-z]+)-(?P<name>[a-z]+)(?:-v(?P<version>\d+))?(?P<variant>\d{2})?(?P<scene>\d{3})?(?P<shot>\d{3})?")
+
+    assert custom_convention.parse_name("mdl-tree-v12.ma") == ("mdl", "tree", None, None, None, 12)
+    assert custom_convention.parse_name("anm_bob_02_010-020_v003.mb") is None
+
+def test_parseInvalidName():
+    assert naming_convention.parse_name("untitled.ma") is None
+    assert naming_convention.parse_name("") is None
+
+def test_parseNamesFromPaths():
+    parsed_names = naming_convention.parse_names(["Y:/project/scenes/mdl_tree_01_v001.ma\n", "C:\\scenes\\rig_bob_v002.mb", "untitled.ma"])
+
+    assert parsed_names[0] == ("mdl", "tree", 1, None, None, 1)
+    assert parsed_names[1] == ("rig", "bob", None, None, None, 2)
+    assert parsed_names[2] is None
+
+class AssetData(object):
+    def __init__(self, **values):
+        self.type = "anm"
+        self.name = "bob"
+        self.has_variant = True
+        self.variant = 2
+        self.has_scene = True
+        self.scene = 10
+        self.has_shot = True
+        self.shot = 20
+        self.version = 3
+        self.__dict__.update(values)
+
+def test_generateFileNames():
+    asset_data = AssetData()
+
+    assert naming_convention_module.generate_file_name_for_saved_asset(asset_data) == "anm_bob_02_010-020_v003"
+    assert naming_convention_module.generate_file_name_for_published_asset(asset_data) == "anm_bob_02_010-020_publish"
+    assert naming_convention_module.generate_file_name_for_exported_asset(AssetData(has_shot=False)) == "anm_bob_02_010_export"
+
+def test_generatePaths():
+    asset_data = AssetData(type="Animation")
+
+    assert naming_convention_module.generate_path_for_saved_asset(asset_data).endswith("/animations/010/020/bob/02/")
+    assert naming_convention_module.generate_path_for_published_asset(asset_data).endswith("/animations/")
+    assert naming_convention_module.generate_path_for_exported_asset(AssetData(has_scene=False, has_variant=False)).endswith("/animations/bob/")
+
+def test_generateWithoutNameHasNoEmptySegment():
+    asset_data = AssetData(name="", has_variant=False, has_scene=False)
+
+    assert naming_convention_module.generate_file_name_for_saved_asset(asset_data) == "anm_v003"
+    assert naming_convention_module.generate_path_for_saved_asset(asset_data).endswith("/animations/")
+
+def test_templatesAreCompiledOnce():
+    template = naming_convention_module.get_file_name_template("save", True, True, False, False)
+
+    assert naming_convention_module.get_file_name_template("save", True, True, False, False) is template
+
+def test_generatorsAreMemoized():
+    naming_convention_module.clear_caches()
+    generator = naming_convention_module.generate_path_for_published_asset
+
+    first_path = generator(AssetData(name="bob"))
+    second_path = generator(AssetData(name="alice"))
+
+    assert first_path == second_path
+    assert generator.fields == ("type",)
+    assert (generator.cache.hits, generator.cache.misses) == (1, 1)
+
+    naming_convention_module.clear_caches()
+
+    assert (generator.cache.hits, generator.cache.misses, generator.cache.size) == (0, 0, 0)
+
+def test_generatorsAcceptAssetRecords():
+    record = CAssetRecord(type="anm", name="bob", has_variant=True, variant=2, version=3)
+
+    assert naming_convention_module.generate_file_name_for_saved_asset(record) == "anm_bob_02_v003"
+    assert hash(record) == hash(record._replace(version=3))
@@ -1,4 +1,6 @@
+import gc
 import pytest
+from patterns.observerPattern import Observable
 from patterns.observerPattern import Subject
 from patterns.observerPattern import Observer
 
@@ -74,3 +76,90 @@ def test_detach():
     subject.value = 20
 
     assert observer.value != subject.value
+
+
+class ObservableSubject(Observable):
+    def getState(self, topics=None):
+        state = [("value", 1), ("other", 2)]
+
+        return [change for change in state if topics is None or change[0] in topics]
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.calls = []
+
+    def update(self, *args):
+        self.calls.append(args[0])
+
+
+def test_observableObserversArePerInstance():
+    subject_a = ObservableSubject()
+    subject_b = ObservableSubject()
+    recorder = RecordingObserver()
+
+    subject_a.attach(recorder)
+    subject_b.notify(("value", 10))
+
+    assert recorder.calls == []
+    assert subject_b.getObserverCount() == 0
+
+def test_observableTopicFilter():
+    subject = ObservableSubject()
+    all_topics = RecordingObserver()
+    value_only = RecordingObserver()
+    subject.attach(all_topics)
+    subject.attach(value_only, topics=["value"])
+
+    subject.notify(("value", 10), ("other", 20))
+
+    assert all_topics.calls == [[("value", 10), ("other", 20)]]
+    assert value_only.calls == [[("value", 10)]]
+
+def test_observableBatch():
+    subject = ObservableSubject()
+    recorder = RecordingObserver()
+    subject.attach(recorder)
+
+    with subject.batch():
+        subject.notify(("value", 10))
+        subject.notify(("other", 20))
+        subject.notify(("value", 30))
+
+        assert recorder.calls == []
+
+    assert recorder.calls == [[("value", 30), ("other", 20)]]
+
+def test_observableAttachAndNotify():
+    subject = ObservableSubject()
+    recorder = RecordingObserver()
+
+    subject.attachAndNotify(recorder, topics=["other"])
+
+    assert recorder.calls == [[("other", 2)]]
+
+def test_observableDetachAndClear():
+    subject = ObservableSubject()
+    recorder = RecordingObserver()
+    subject.attach(recorder, topics=["value"])
+    subject.detach(recorder)
+    subject.notify(("value", 10))
+
+    assert recorder.calls == []
+
+    subject.attach(recorder)
+    subject.clearObservers()
+    subject.notify(("value", 10))
+
+    assert recorder.calls == []
+
+def test_observableHoldsWeakObservers():
+    subject = ObservableSubject()
+    recorder = RecordingObserver()
+    subject.attach(recorder, topics=["value"])
+
+    del recorder
+    gc.collect()
+
+    assert subject.getObserverCount() == 0
+    subject.notify(("value", 10))
@@ -0,0 +1,48 @@
+import pytest
+import colorium.scene_name_parser as scene_name_parser
+from colorium.naming_convention import CParsedName
+
+
+def test_parseString():
+    assert scene_name_parser.parse_string("mdl_tree_01_010-020_v003") == CParsedName("mdl", "tree", 1, 10, 20, 3)
+    assert scene_name_parser.parse_string("") is None
+    assert scene_name_parser.parse_string("tree") is None
+
+@pytest.mark.parametrize("string", ["Y:/a/mdl_tree_v001.ma", "Y:\\a\\mdl_tree_v001.mb", "/a/b.c/mdl_tree_v001", "mdl_tree_v001.ma"])
+def test_parseStringIgnoresFoldersAndExtension(string):
+    assert scene_name_parser.parse_string(string) == CParsedName("mdl", "tree", None, None, None, 1)
+
+def test_parseStringToAsset():
+    asset = scene_name_parser.parse_string_to_asset("/projects/rig_hero_02_v012.ma")
+
+    assert (asset.type, asset.name, asset.has_variant, asset.variant, asset.version) == ("rig", "hero", True, 2, 12)
+
+def test_parseStringsToAssets():
+    unparseable = []
+    strings = ["/a/mdl_tree_v001.ma", "readme.txt", "", "prx_rock_02"]
+
+    results = list(scene_name_parser.parse_strings_to_assets(strings, on_unparseable=unparseable.append))
+
+    assert [(string, parsed_name.name) for string, parsed_name in results] == [("/a/mdl_tree_v001.ma", "tree"), ("prx_rock_02", "rock")]
+    assert unparseable == ["readme.txt"]
+
+def test_parseStringsInPoolReadsTheInputLazily():
+    consumed = []
+
+    def strings():
+        for index in range(1000):
+            consumed.append(index)
+
+            yield "mdl_tree{}_v001.ma".format(index) if index % 100 else "unparseable"
+
+    unparseable = []
+    results = scene_name_parser.parse_strings_to_assets(strings(), on_unparseable=unparseable.append, processes=2, chunk_size=10)
+    first_string, first_parsed_name = next(results)
+
+    assert (first_string, first_parsed_name.name) == ("mdl_tree1_v001.ma", "tree1")
+    assert len(consumed) <= 2 * scene_name_parser.PENDING_CHUNKS_PER_PROCESS * 10
+
+    results = [first_string] + [string for string, parsed_name in results]
+
+    assert results == ["mdl_tree{}_v001.ma".format(index) for index in range(1000) if index % 100]
+    assert len(unparseable) == 10
@@ -0,0 +1,212 @@
+import threading
+import pytest
+import colorium.commit as commit
+import colorium.task_graph as task_graph
+
+
+class Future(object):
+    def __init__(self):
+        self.callbacks = []
+        self.value = None
+        self.error = None
+        self.is_cancelled = False
+
+    def add_done_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def complete(self, value=None, error=None):
+        self.value = value
+        self.error = error
+
+        for callback in self.callbacks:
+            callback(self)
+
+    def cancel(self):
+        self.is_cancelled = True
+        self.complete(error=RuntimeError("cancelled"))
+
+        return True
+
+    def cancelled(self):
+        return self.is_cancelled
+
+    def wait(self, timeout=None):
+        if self.error is not None:
+            raise self.error
+
+        return self.value
+
+
+def test_independentTasksRunInParallel():
+    graph = task_graph.CTaskGraph()
+    futures = {"publish": Future(), "export": Future()}
+    started = []
+
+    def start(name):
+        started.append(name)
+
+        if len(started) == 3:
+            threading.Timer(0.05, futures["export"].complete, ("exported",)).start()
+            threading.Timer(0.1, futures["publish"].complete, ("published",)).start()
+
+        return futures[name]
+
+    graph.add_task("save", lambda: started.append("save") or "saved")
+    graph.add_task("publish", lambda: start("publish"), ["save"])
+    graph.add_task("export", lambda: start("export"), ["save"])
+
+    results = graph.run()
+
+    assert started == ["save", "publish", "export"]
+    assert list(results) == ["save", "export", "publish"]
+    assert [result.value for result in results.values()] == ["saved", "exported", "published"]
+    assert all(result.succeeded for result in results.values())
+    assert results["publish"].wall >= results["export"].wall
+
+def test_failureSkipsDependentTasksOnly():
+    graph = task_graph.CTaskGraph()
+    graph.add_task("save", lambda: 1 / 0)
+    graph.add_task("publish", lambda: "published", ["save"])
+    graph.add_task("report", lambda: "reported")
+
+    results = graph.run()
+
+    assert results["save"].status == task_graph.FAILED
+    assert isinstance(results["save"].error, ZeroDivisionError)
+    assert results["publish"].status == task_graph.SKIPPED
+    assert results["report"].status == task_graph.SUCCEEDED
+
+def test_cancel():
+    graph = task_graph.CTaskGraph()
+    future = Future()
+    graph.add_task("export", lambda: future)
+    graph.add_task("cleanup", lambda: "done", ["export"])
+    polls = []
+
+    def poll():
+        polls.append(True)
+        graph.cancel()
+
+    results = graph.run(poll=poll, poll_interval=0.01)
+
+    assert polls
+    assert results["export"].status == task_graph.CANCELLED
+    assert results["cleanup"].status == task_graph.CANCELLED
+
+def test_addTaskWithUnknownDependencyRaises():
+    graph = task_graph.CTaskGraph()
+
+    with pytest.raises(ValueError):
+        graph.add_task("publish", lambda: None, ["save"])
+
+
+class Command(object):
+    def __init__(self, action, name):
+        self.action = action
+        self.name = name
+
+
+class Config(object):
+    def __init__(self, action, name, calls):
+        self.command = Command(action, name)
+        self.calls = calls
+
+    def execute_command(self):
+        self.calls.append(self.command.action)
+
+
+class Asset(object):
+    def __init__(self, calls):
+        self.version = 1
+        self.save_config = Config("save", "Maya Binary", calls)
+        self.publish_config = Config("publish", "Geometry Cache", calls)
+        self.export_config = Config("export", "Maya Binary", calls)
+
+    def update_many(self, **fields):
+        self.__dict__.update(fields)
+
+
+class Cmds(object):
+    def ls(self, sl=False):
+        return ["mdl_chair_01"]
+
+    def file(self, q=False, sn=False):
+        return "/scenes/mdl_chair_01_v002.mb"
+
+
+class Pool(object):
+    def __init__(self, calls, available=True):
+        self.calls = calls
+        self.available = available
+
+    def is_available(self):
+        return self.available
+
+    def submit_configuration(self, config, scene, nodes):
+        self.calls.append(("worker", config.command.action, scene, nodes))
+        future = Future()
+        threading.Timer(0.01, future.complete, ("ok",)).start()
+
+        return future
+
+
+def test_planCommit():
+    calls = []
+    asset = Asset(calls)
+
+    graph = commit.plan_commit(asset, Cmds(), increment_version=True, pool=Pool(calls))
+    results = graph.run()
+
+    assert asset.version == 2
+    assert calls == ["save", ("worker", "export", "/scenes/mdl_chair_01_v002.mb", ["mdl_chair_01"]), "publish"]
+    assert all(result.succeeded for result in results.values())
+    assert "export" in task_graph.format_results(results)
+
+def test_planCommitRunsInSessionWithoutWorkerExecutable():
+    calls = []
+
+    results = commit.plan_commit(Asset(calls), Cmds(), pool=Pool(calls, available=False)).run()
+
+    assert calls == ["save", "publish", "export"]
+    assert all(result.succeeded for result in results.values())
+
+def test_planCommitRemovesTheSnapshot(tmpdir, monkeypatch):
+    calls = []
+    snapshot = tmpdir.join("snapshot.mb")
+
+    def save_snapshot(cmds):
+        snapshot.write("")
+
+        return str(snapshot)
+
+    monkeypatch.setattr(commit.worker_pool, "save_snapshot", save_snapshot)
+    graph = commit.plan_commit(Asset(calls), Cmds(), save=False, publish=False, pool=Pool(calls))
+
+    assert graph.run()["export"].succeeded
+    assert calls == [("worker", "export", str(snapshot), ["mdl_chair_01"])]
+    assert not snapshot.check()
+
+def test_cleanupsRunAfterTheTasks():
+    calls = []
+    graph = task_graph.CTaskGraph()
+    graph.add_task("a", lambda: calls.append("a"))
+    graph.add_task("b", lambda: 1 / 0)
+    graph.add_cleanup(lambda: calls.append("cleanup"))
+
+    graph.run()
+
+    assert calls == ["a", "cleanup"]
+
+def test_cleanupsRunWhenACallbackRaises():
+    calls = []
+    graph = task_graph.CTaskGraph()
+    graph.add_task("a", lambda: calls.append("a"))
+    graph.add_cleanup(lambda: calls.append("cleanup"))
+
+    def on_result(result):
+        raise RuntimeError("progressWindow failed")
+
+    with pytest.raises(RuntimeError):
+        graph.run(on_result)
+
+    assert calls == ["a", "cleanup"]
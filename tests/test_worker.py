@@ -0,0 +1,156 @@
+import io
+import json
+import sys
+import pytest
+import colorium.worker as worker
+import colorium.worker_pool as worker_pool
+from colorium.worker_pool import CJobFuture, CWorkerError, CWorkerPool
+
+
+class FakeCmds(object):
+    def __init__(self):
+        self.calls = []
+        self.scene = None
+
+    def file(self, *args, **kwargs):
+        if kwargs.get("q"):
+            return self.scene
+
+        if kwargs.get("o"):
+            self.scene = args[0]
+
+        self.calls.append(("file", args, kwargs))
+
+    def select(self, nodes, r=False):
+        self.calls.append(("select", nodes))
+
+
+class OutputStream(object):
+    def __init__(self):
+        self.lines = []
+
+    def write(self, text):
+        self.lines.append(text)
+
+    def flush(self):
+        pass
+
+
+def make_job(tmpdir, command_name="Maya Ascii", nodes=("mdl_chair_01",)):
+    return {
+        "id": 7,
+        "scene": "/tmp/snapshot.mb",
+        "nodes": list(nodes),
+        "config": {
+            "name": "publish",
+            "file_name": "mdl_chair_01_publish",
+            "path": str(tmpdir) + "/models/",
+            "command": {"action": "publish", "name": command_name},
+            "asset": {},
+        },
+    }
+
+
+def test_runJob(tmpdir):
+    cmds = FakeCmds()
+
+    result = worker.run_job(make_job(tmpdir), cmds)
+
+    assert result["id"] == 7
+    assert result["status"] == "ok"
+    assert cmds.calls[0] == ("file", ("/tmp/snapshot.mb",), {"o": True, "f": True})
+    assert cmds.calls[-1] == ("file", (str(tmpdir) + "/models/mdl_chair_01_publish",), {"es": True, "typ": "mayaAscii"})
+    assert tmpdir.join("models").check(dir=True)
+
+    worker.run_job(make_job(tmpdir), cmds)
+
+    assert [call for call in cmds.calls if call[2:] == ({"o": True, "f": True},)] == [cmds.calls[0]]
+
+def test_runJobReportsErrors(tmpdir):
+    assert "No worker handler" in worker.run_job(make_job(tmpdir, command_name="USD"), FakeCmds())["error"]
+    assert worker.run_job(make_job(tmpdir, nodes=()), FakeCmds())["status"] == "error"
+
+def test_serve(tmpdir):
+    input_stream = io.BytesIO("{}\n\nnot json\n".format(json.dumps(make_job(tmpdir))).encode("utf-8"))
+    output_stream = OutputStream()
+
+    worker.serve(input_stream, output_stream, FakeCmds())
+
+    messages = [json.loads(line) for line in output_stream.lines]
+
+    assert messages[0]["ready"]
+    assert messages[1]["status"] == "ok"
+    assert messages[2]["status"] == "error"
+
+WORKER_SCRIPT = """
+import sys
+import colorium.worker as worker
+
+class FakeCmds(object):
+    def file(self, *args, **kwargs):
+        if args and "crash" in args[0]:
+            sys.exit(3)
+
+    def select(self, nodes, r=False):
+        pass
+
+worker.serve(sys.stdin, sys.stdout, FakeCmds())
+"""
+
+def test_workerPool(tmpdir):
+    pool = CWorkerPool(size=2, command_line=[sys.executable, "-c", WORKER_SCRIPT])
+
+    try:
+        futures = [pool.submit(make_job(tmpdir)) for index in range(4)]
+        failing = pool.submit(make_job(tmpdir, command_name="USD"))
+        crashing = pool.submit(dict(make_job(tmpdir), scene="/tmp/crash.mb"))
+
+        assert [future.wait(30)["status"] for future in futures] == ["ok"] * 4
+
+        with pytest.raises(CWorkerError):
+            failing.wait(30)
+
+        with pytest.raises(CWorkerError):
+            crashing.wait(30)
+
+        assert pool.submit(make_job(tmpdir)).wait(30)["status"] == "ok"
+    finally:
+        pool.shutdown()
+
+HANGING_WORKER_SCRIPT = """
+import json
+import sys
+import time
+
+if sys.argv[1] == "job":
+    sys.stdout.write(json.dumps({"ready": True}) + "\\n")
+    sys.stdout.flush()
+
+time.sleep(60)
+"""
+
+@pytest.mark.parametrize("hangs_on", ["start", "job"])
+def test_workerPoolKillsHungWorkers(tmpdir, hangs_on):
+    pool = CWorkerPool(size=1, command_line=[sys.executable, "-c", HANGING_WORKER_SCRIPT, hangs_on], start_timeout=0.5, job_timeout=0.5)
+
+    try:
+        with pytest.raises(CWorkerError) as error:
+            pool.submit(make_job(tmpdir)).wait(30)
+
+        assert "didn't answer in 0.5 seconds" in str(error.value)
+    finally:
+        pool.shutdown()
+
+def test_snapshotIsRemovedOnceTheJobsAreDone(tmpdir):
+    snapshot = tmpdir.join("snapshot.mb")
+    snapshot.write("")
+    futures = [CJobFuture({}), CJobFuture({})]
+
+    worker_pool.remove_snapshot_when_done(str(snapshot), futures)
+    futures[0]._set({"status": "ok"})
+
+    assert snapshot.check()
+
+    futures[1].cancel()
+
+    assert not snapshot.check()